@@ -21,18 +21,26 @@ cdef extern from "wrap.h" namespace "polymake":
 
 def give_{cython}(PerlObject perl_object, bytes prop):
     cdef {cython} ans = {cython}.__new__({cython})
+    cdef pm_PerlObject * pm_obj = perl_object.pm_obj
     cdef string cprop = prop
-    sig_str("error in polymake while accessing property")
-    pm_give_{cython}(ans.pm_obj, perl_object.pm_obj, cprop)
-    sig_off()
+    perl_lock()
+    try:
+        with nogil:
+            pm_provide_property(pm_obj, cprop)
+        pm_give_{cython}(ans.pm_obj, pm_obj, cprop)
+    finally:
+        perl_unlock()
     return ans
 
 def call_method_{cython}(PerlObject perl_object, bytes prop):
     cdef {cython} ans = {cython}.__new__({cython})
+    cdef pm_PerlObject * pm_obj = perl_object.pm_obj
     cdef string cprop = prop
-    sig_str("error in polymake while accessing method")
-    pm_call_method_{cython}(ans.pm_obj, perl_object.pm_obj, cprop)
-    sig_off()
+    perl_lock()
+    try:
+        pm_call_method_{cython}(ans.pm_obj, pm_obj, cprop)
+    finally:
+        perl_unlock()
     return ans
 """
 
@@ -73,6 +81,35 @@ cdef class {cython}:
         return (<bytes>out.str()).decode('ascii')
 """
 
+# Pickling through polymake plain text format (the output of __repr__ can be
+# parsed back with PlainParser). The classes of the modules below have a
+# __reduce__ method based on the functions of pickle_def.
+picklable_modules = ["Array", "IncidenceMatrix", "Integer", "Map", "Matrix",
+        "PowerSet", "Rational", "Set", "SparseMatrix", "Vector"]
+
+reduce_def="""
+    def __reduce__(self):
+        return (from_plain_{cython}, (to_plain_{cython}(self),))
+"""
+
+pickle_def="""
+# pickling of {cython}
+cdef extern from "wrap.h" namespace "polymake":
+    void pm_{cython}_to_plain "WRAP_wrap_OUT" (ostringstream, pm_{cython})
+    void pm_{cython}_from_plain "pm_parse" (pm_{cython}&, string) except +ValueError
+
+cdef bytes to_plain_{cython}({cython} x):
+    cdef ostringstream out
+    pm_{cython}_to_plain(out, x.pm_obj)
+    return <bytes> out.str()
+
+def from_plain_{cython}(bytes s):
+    r\"\"\"Return the {cython} with plain text representation ``s``\"\"\"
+    cdef {cython} ans = {cython}.__new__({cython})
+    pm_{cython}_from_plain(ans.pm_obj, s)
+    return ans
+"""
+
 # Iteration protocol
 # pytype     : SetInt
 # pmperltype : Set<Int>
@@ -170,6 +207,11 @@ def write_undefined_classes():
             for typ in types:
                 if typ in classes[pm_mod]:
                     output.write(class_def.format(**all_types[typ]))
+                    if pm_mod in picklable_modules:
+                        output.write(reduce_def.format(**all_types[typ]))
+            if pm_mod in picklable_modules:
+                for typ in types:
+                    output.write(pickle_def.format(**all_types[typ]))
 
 def write_definitions(filename):
     with open(filename, "w") as output:
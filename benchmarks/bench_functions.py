@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+r"""
+Overhead of calls to polymake functions
+
+Compare the cost of building small polytopes with the cost of switching the
+polymake application, which was done before every function call.
+
+Run with::
+
+    $ python bench_functions.py
+"""
+
+from __future__ import print_function
+
+import timeit
+
+import polymake
+from polymake.main import pm_set_application
+
+NUMBER = 1000
+
+def switch():
+    pm_set_application(b"fan")
+    pm_set_application(b"polytope")
+
+if __name__ == '__main__':
+    for name, f in [("cube(3)", lambda: polymake.cube(3)),
+                    ("cross(3)", lambda: polymake.cross(3)),
+                    ("application switch", switch)]:
+        t = min(timeit.repeat(f, number=NUMBER, repeat=3))
+        print("{:<20} {:9.3f}us".format(name, 1e6 * t / NUMBER))
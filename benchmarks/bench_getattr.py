@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+r"""
+Overhead of attribute access on perl objects
+
+Compare the cost of ``p.N_VERTICES`` (or any other attribute) with the
+dispatch that was performed on each access before the handlers were cached:
+encoding of the name, lookup in the property table and resolution of the
+handler. The handlers access perl and hence are timed in the polymake thread
+(see :mod:`polymake.main`). The cached access is timed from the main thread
+where it does not leave the calling thread, and the cost of a round-trip
+through the polymake thread is given for comparison.
+
+Run with::
+
+    $ python bench_getattr.py
+"""
+
+from __future__ import print_function
+
+import timeit
+
+import polymake
+from polymake.main import run_in_polymake_thread
+from polymake.perl_object import get_properties
+from polymake.handlers import get_property_handler
+
+NUMBER = 100000
+
+def uncached_getattr(p, properties, name):
+    bname = name.encode('utf-8')
+    handler = get_property_handler(properties[bname])
+    return handler(p, bname)
+
+def bench(p, name):
+    properties = get_properties(p)
+    bname = name.encode('utf-8')
+    handler = get_property_handler(properties[bname])
+
+    # make sure that the property is computed and the caches are filled
+    getattr(p, name)
+
+    def repeat(f):
+        return min(timeit.repeat(f, number=NUMBER, repeat=3))
+
+    t_raw = run_in_polymake_thread(repeat, lambda: handler(p, bname))
+    t_old = run_in_polymake_thread(repeat, lambda: uncached_getattr(p, properties, name))
+    t_new = repeat(lambda: getattr(p, name))
+    t_thread = repeat(lambda: run_in_polymake_thread(getattr, p, name))
+
+    print("{:<20} handler {:7.3f}us   uncached {:7.3f}us (+{:.3f})   cached {:7.3f}us (+{:.3f})   polymake thread {:7.3f}us".format(
+          name,
+          1e6 * t_raw / NUMBER,
+          1e6 * t_old / NUMBER, 1e6 * (t_old - t_raw) / NUMBER,
+          1e6 * t_new / NUMBER, 1e6 * (t_new - t_raw) / NUMBER,
+          1e6 * t_thread / NUMBER))
+
+if __name__ == '__main__':
+    p = polymake.cube(3)
+    for name in ["N_VERTICES", "SIMPLE", "F_VECTOR", "FACETS", "VERTICES_IN_FACETS"]:
+        bench(p, name)
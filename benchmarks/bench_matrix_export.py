@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+r"""
+Export of rational and integer matrices to Python
+
+Compare the entry by entry conversion ``m[i,j].python()`` with the bulk
+conversions ``m.python()`` and ``m.to_numpy(float)``.
+
+Run with::
+
+    $ python bench_matrix_export.py
+"""
+
+from __future__ import print_function
+
+import timeit
+
+import polymake
+
+NUMBER = 10
+
+def per_entry(m):
+    return [[m[i,j].python() for j in range(m.cols())] for i in range(m.rows())]
+
+def bench(name, m):
+    t_entry = min(timeit.repeat(lambda: per_entry(m), number=NUMBER, repeat=3)) / NUMBER
+    t_python = min(timeit.repeat(lambda: m.python(), number=NUMBER, repeat=3)) / NUMBER
+    print("{:<30} {:>5} x {:<3} per entry {:9.3f}ms   python() {:9.3f}ms (x{:.1f})".format(
+          name, m.rows(), m.cols(),
+          1e3 * t_entry, 1e3 * t_python, t_entry / t_python), end='')
+    try:
+        import numpy
+    except ImportError:
+        print()
+        return
+    t_float = min(timeit.repeat(lambda: m.to_numpy(float), number=NUMBER, repeat=3)) / NUMBER
+    print("   to_numpy(float) {:9.3f}ms (x{:.1f})".format(1e3 * t_float, t_entry / t_float))
+
+if __name__ == '__main__':
+    c = polymake.cube(6)
+    bench("cube(6).VERTEX_NORMALS", c.VERTEX_NORMALS)
+    bench("cube(6).DEGREE_ONE_GENERATORS", c.DEGREE_ONE_GENERATORS)
+    p = polymake.rand_sphere(5, 1000)
+    bench("rand_sphere(5, 1000).FACETS", p.FACETS)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+r"""
+Arithmetic of polymake scalars
+
+Compare the cost of the arithmetic, hashing and conversions of
+:class:`polymake.Integer` and :class:`polymake.Rational` with Python ``int``,
+``fractions.Fraction`` and (if installed) gmpy2.
+
+Run with::
+
+    $ python bench_numbers.py
+"""
+
+from __future__ import print_function
+
+import timeit
+from fractions import Fraction
+
+import polymake
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+NUMBER = 10000
+
+def benchmarks(name, a, b):
+    def add():
+        a + b
+    def mul():
+        a * b
+    def iadd():
+        x = a
+        for _ in range(10):
+            x += b
+    def hash_():
+        hash(a)
+    def int_():
+        int(a)
+
+    ans = [("{} add".format(name), add),
+           ("{} mul".format(name), mul),
+           ("{} 10 x +=".format(name), iadd),
+           ("{} hash".format(name), hash_)]
+    if not isinstance(a, (Fraction, polymake.Rational)) and \
+       not (gmpy2 is not None and isinstance(a, type(gmpy2.mpq()))):
+        ans.append(("{} int".format(name), int_))
+    return ans
+
+if __name__ == '__main__':
+    big = 2**100 + 1
+    cases = [("int", 12345, 6789),
+             ("int (big)", big, big),
+             ("Integer", polymake.Integer(12345), polymake.Integer(6789)),
+             ("Integer (big)", polymake.Integer(big), polymake.Integer(big)),
+             ("Fraction", Fraction(3, 7), Fraction(5, 11)),
+             ("Rational", polymake.Rational(3, 7), polymake.Rational(5, 11))]
+    if gmpy2 is not None:
+        cases.extend([("mpz", gmpy2.mpz(12345), gmpy2.mpz(6789)),
+                      ("mpz (big)", gmpy2.mpz(big), gmpy2.mpz(big)),
+                      ("mpq", gmpy2.mpq(3, 7), gmpy2.mpq(5, 11))])
+
+    for case in cases:
+        for name, f in benchmarks(*case):
+            t = min(timeit.repeat(f, number=NUMBER, repeat=3))
+            print("{:<25} {:9.3f}us".format(name, 1e6 * t / NUMBER))
@@ -5,8 +5,15 @@ The polymake python library provides Python bindings to polymake.
 """
 from __future__ import absolute_import
 
+from .main import init
 from .integer import Integer
 from .rational import Rational
 
 from .functions import *
-from .big_object import Polytope
+from .big_object import Polytope, PointConfiguration
+
+try:
+    from .aio import acall
+except ImportError:
+    # no asyncio (Python 2)
+    pass
@@ -0,0 +1,93 @@
+r"""
+asyncio interface to polymake
+
+The computations are run by the polymake thread (see
+:mod:`polymake.executor`) and the coroutines are resumed when the converted
+result is available, so that the event loop is never blocked by polymake.
+
+EXAMPLES:
+
+>>> import asyncio
+>>> import polymake
+>>> async def f():
+...     c = await polymake.acall("cube", 3)
+...     return await c.agive("N_FACETS")
+>>> asyncio.get_event_loop().run_until_complete(f())
+6
+
+.. NOTE::
+
+    Cancellation (explicit or after a timeout) only prevents requests that
+    are not started yet. A computation that is already running in polymake
+    can not be interrupted: it runs to completion and its result is
+    discarded.
+"""
+###############################################################################
+#       Copyright (C) 2016      Vincent Delecroix <vincent.delecroix@labri.fr>
+#  Distributed under the terms of the GNU General Public License (GPL),
+#  version 3 or any later version.  The full text of the GPL is available at:
+#                  http://www.gnu.org/licenses/
+###############################################################################
+
+from __future__ import absolute_import
+
+import asyncio
+
+from .executor import get_executor
+
+def _wrap(future, timeout):
+    future = asyncio.wrap_future(future)
+    if timeout is None:
+        return future
+    return asyncio.wait_for(future, timeout)
+
+def agive(p, name, timeout=None):
+    r"""
+    Return an awaitable for the property (or method) ``name`` of ``p``
+
+    INPUT:
+
+    - ``p`` -- a perl object
+
+    - ``name`` -- the name of a property or method
+
+    - ``timeout`` -- an optional timeout in seconds (``asyncio.TimeoutError``
+      is raised when it expires)
+    """
+    return _wrap(get_executor().give(p, name), timeout)
+
+def acall(name, *args, **kwds):
+    r"""
+    Return an awaitable for the result of the polymake function ``name``
+
+    INPUT:
+
+    - ``name`` -- name of a function from :mod:`polymake`, or of any
+      polymake function in the application ``app`` returning a big object
+      (see :func:`polymake.perl_object.call_polymake_function`)
+
+    - ``args``, ``kwds`` -- arguments and options of the function
+
+    - ``app`` -- keyword only, the polymake application (default ``"polytope"``)
+
+    - ``timeout`` -- keyword only, an optional timeout in seconds
+    """
+    from . import functions
+    from .perl_object import call_polymake_function
+
+    app = kwds.pop('app', 'polytope')
+    timeout = kwds.pop('timeout', None)
+    if not isinstance(name, str):
+        name = name.decode('ascii')
+
+    ex = get_executor()
+    try:
+        f = getattr(functions, name)
+    except AttributeError:
+        if not isinstance(app, bytes):
+            app = app.encode('ascii')
+        future = ex.submit(call_polymake_function, app, name.encode('ascii'), *args, **kwds)
+    else:
+        future = ex.submit(f, *args, **kwds)
+
+    return _wrap(future, timeout)
@@ -10,6 +10,8 @@
 from libcpp cimport bool
 from libcpp.string cimport string
 
+include "auto_array.pxi"
+
 from .defs cimport pm_PairStringString, pm_PairStringArrayString, pm_SetInt
 from .set cimport SetInt
 
@@ -47,6 +49,9 @@ cdef class ArrayBool(object):
         cdef ostringstream out
         pm_ArrayBool_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
+
+    def __reduce__(self):
+        return (from_plain_ArrayBool, (to_plain_ArrayBool(self),))
     def python(self):
         r"""Converts into a list of booleans
         """
@@ -77,6 +82,9 @@ cdef class ArrayInt(object):
         cdef ostringstream out
         pm_ArrayInt_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
+
+    def __reduce__(self):
+        return (from_plain_ArrayInt, (to_plain_ArrayInt(self),))
     def python(self):
         r"""Converts into a Python list of integers
 
@@ -98,6 +106,9 @@ cdef class ArrayString(object):
         cdef ostringstream out
         pm_ArrayString_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
+
+    def __reduce__(self):
+        return (from_plain_ArrayString, (to_plain_ArrayString(self),))
     def __iter__(self):
         cdef pm_ArrayString_iterator it = entire_ArrayString(self.pm_obj)
         while not it.at_end():
@@ -126,6 +137,9 @@ cdef class ArraySetInt(object):
         pm_ArraySetInt_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
 
+    def __reduce__(self):
+        return (from_plain_ArraySetInt, (to_plain_ArraySetInt(self),))
+
 cdef class ArrayArrayInt(object):
     def __len__(self): return self.pm_obj.size()
     def __getitem__(self, Py_ssize_t i):
@@ -138,6 +152,9 @@ cdef class ArrayArrayInt(object):
         pm_ArrayArrayInt_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
 
+    def __reduce__(self):
+        return (from_plain_ArrayArrayInt, (to_plain_ArrayArrayInt(self),))
+
 cdef class ArrayArrayString(object):
     def __len__(self): return self.pm_obj.size()
     def __getitem__(self, Py_ssize_t i):
@@ -149,6 +166,9 @@ cdef class ArrayArrayString(object):
         cdef ostringstream out
         pm_ArrayArrayString_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
+
+    def __reduce__(self):
+        return (from_plain_ArrayArrayString, (to_plain_ArrayArrayString(self),))
     def python(self):
         r"""Converts into a list of list of strings
         """
@@ -164,6 +184,9 @@ cdef class ArrayPairStringString(object):
         cdef ostringstream out
         pm_ArrayPairStringString_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
+
+    def __reduce__(self):
+        return (from_plain_ArrayPairStringString, (to_plain_ArrayPairStringString(self),))
     def python(self):
         cdef Py_ssize_t i
         return [self[i] for i in range(self.pm_obj.size())]
@@ -180,6 +203,9 @@ cdef class ArrayPairStringArrayString(object):
         cdef ostringstream out
         pm_ArrayPairStringArrayString_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
+
+    def __reduce__(self):
+        return (from_plain_ArrayPairStringArrayString, (to_plain_ArrayPairStringArrayString(self),))
     def python(self):
         cdef Py_ssize_t i
         l = [self[i] for i in range(self.pm_obj.size())]
@@ -196,6 +222,9 @@ cdef class ArrayArrayPairStringString(object):
         cdef ostringstream out
         pm_ArrayArrayPairStringString_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
+
+    def __reduce__(self):
+        return (from_plain_ArrayArrayPairStringString, (to_plain_ArrayArrayPairStringString(self),))
     def python(self):
         cdef Py_ssize_t i
         return [self[i].python() for i in range(self.pm_obj.size())]
@@ -8,135 +8,133 @@
 #                  http://www.gnu.org/licenses/
 ###############################################################################
 
-from .cygmp.mpz cimport *
-from .cygmp.mpz cimport *
-from .defs cimport (pm_Integer, pm_Rational, pm_MatrixInteger, pm_MatrixRational,
-        pm_assign_MatrixRational, pm_PerlObject)
-from .perl_object cimport wrap_perl_object
-from .rational import get_num_den
-
-cdef extern from "polymake/Matrix.h" namespace "polymake":
-    # WRAP_CALL(t,i,j) -> t(i,j)
-    pm_Integer pm_MatrixInteger_get "WRAP_CALL" (pm_MatrixInteger, int i, int j)
-    pm_Rational pm_MatrixRational_get "WRAP_CALL" (pm_MatrixRational, int i, int j)
-
-def clean_mat(mat):
-    r"Return a triple (nr, nc, entries)"
-    try:
-        nr = mat.nrows()
-        nc = mat.ncols()
-    except AttributeError:
-        if isinstance(mat, (tuple,list)) and mat and \
-           all(isinstance(row, (tuple,list)) for row in mat) and mat[0] and \
-           all(len(row) == len(mat[0]) for row in mat):
-               nr = len(mat)
-               nc = len(mat[0])
-        else:
-            raise ValueError("invalid input {}".format(mat))
-
-    if nr <= 0 or nc <= 0:
-        raise ValueError("invalid input {}".format(mat))
-
-    cdef long num, den
-    cdef Py_ssize_t i,j
-    cdef list clean_mat = []
-    cdef list row
-    for i in range(nr):
-        row = []
-        mi = mat[i]
-        for j in range(nc):
-            row.append(get_num_den(mi[j]))
-        clean_mat.append(row)
-
-    return (nr, nc, clean_mat)
-
-cdef pm_MatrixRational* rat_mat_to_pm(int nr, int nc, list mat):
-    """
-    Create a polymake rational matrix from input so that:
-
-    - accessing to the elements is done via ``mat[i,j]``
-    - given a rational entry we access to numerator and denominator via the
-      methods ``.numerator()`` and ``.denominator()``
-    """
-    # create polymake matrix with dimensions of mat
-    cdef pm_MatrixRational* pm_mat = new pm_MatrixRational(nr, nc)
-
-    cdef Py_ssize_t i, j
-    cdef long num, den
-
-    # clean data
-    for i,row in enumerate(mat):
-        for j,elt in enumerate(row):
-            num, den = get_num_den(elt)
-            pm_MatrixRational_get(pm_mat[0], i, j).set_long(num, den)
+from libcpp.string cimport string
 
-    return pm_mat
+from .defs cimport pm_PerlObject, pm_assign_MatrixRational
+from .perl_object cimport PerlObject, wrap_perl_object, get_type_tables
+from .matrix cimport MatrixRational
+from .main cimport perl_lock, perl_unlock, set_application, in_polymake_thread
+from .main import run_in_polymake_thread
 
-cdef pm_MatrixInteger* int_mat_to_pm(int nr, int nc, list mat):
+cdef PerlObject new_big_object(bytes app, bytes type_name):
+    r"""
+    Return a new (empty) perl object of type ``type_name`` in the application ``app``
     """
-    Create a polymake integer matrix from input so that:
+    cdef pm_PerlObject * pm_obj = NULL
+    perl_lock()
+    try:
+        set_application(app)
+        pm_obj = new pm_PerlObject(<string> type_name)
+        return wrap_perl_object(pm_obj[0])
+    finally:
+        del pm_obj
+        perl_unlock()
+
+cdef int set_properties(PerlObject p, dict properties, dict props) except -1:
+    r"""
+    Assign the properties ``props`` (a dictionary name -> value) to ``p``
 
-    - there are methods ``nrows``, ``ncols`` giving the number of rows and cols
-    - accessing to the elements is done via ``mat[i,j]``
+    The argument ``properties`` is the table of properties of the type of
+    ``p`` (see :func:`polymake.perl_object.get_type_tables`). All values are
+    checked and converted before any assignment is made.
     """
-    # create polymake matrix with dimensions of mat
-    cdef pm_MatrixInteger* pm_mat = new pm_MatrixInteger(nr, nc)
-
-    cdef mpz_t z
-    cdef Py_ssize_t i, j
+    cdef list converted = []
+    cdef MatrixRational mat
+    cdef string cprop
+    for name, value in props.items():
+        bname = name if isinstance(name, bytes) else name.encode('ascii')
+        try:
+            pm_type = properties[bname]
+        except KeyError:
+            raise ValueError("{} is not a valid property of {}".format(name, p.type_name()))
+        if pm_type != b"Matrix<Rational>":
+            raise NotImplementedError("can not assign property {} of type {}".format(name, pm_type.decode('ascii')))
+
+        if isinstance(value, MatrixRational):
+            converted.append((bname, value))
+        else:
+            converted.append((bname, MatrixRational.from_numpy(value)))
 
-    # clean data
-    mpz_init(z)
-    for i,row in enumerate(mat):
-        for j,elt in enumerate(row):
-            mpz_set_si(z, elt)
-            pm_MatrixInteger_get(pm_mat[0], i, j).set_mpz_srcptr(z)
-    mpz_clear(z)
+    perl_lock()
+    try:
+        for bname, mat in converted:
+            cprop = bname
+            pm_assign_MatrixRational(p.pm_obj.take(cprop), mat.pm_obj)
+    finally:
+        perl_unlock()
 
-    return pm_mat
+    p._invalidate_cache()
+    return 0
 
-def PolytopeRational(**args):
+class BigObjectConstructor(object):
     r"""
-    Construct a polytope
-
-    INPUT:
-
-    - ``VERTICES`` -- a matrix of vertices
+    Constructor of polymake big objects of a given type from their properties
 
-    - ``POINTS`` -- a matrix of points
-
-    - ``FACETS`` -- a matrix of facets
+    Only properties of type ``Matrix<Rational>`` can be assigned for now. The
+    values can be anything accepted by :meth:`MatrixRational.from_numpy`.
 
     EXAMPLES:
 
-    >>> 
+    >>> import polymake
+    >>> p = polymake.Polytope(POINTS=[[1,0,0], [1,1,0], [1,0,1]])
+    >>> p.N_VERTICES
+    3
+    >>> polymake.Polytope(PONTS=[[1,0,0]])
+    Traceback (most recent call last):
+    ...
+    ValueError: PONTS is not a valid property of Polytope<Rational>
     """
-    raise NotImplementedError
-#    cdef pm_MatrixRational * pm_mat
-#    cdef string cprop
-#    # FIXME: this should not be needed
-#    from .main import pm_set_application
-#
-#    cdef pm_PerlObject * pm_obj = new pm_PerlObject(b"polytope::Polytope<Rational>")
-#
-#    cdef pm_MapStringString props = pm_get_properties(pm_obj)
-#
-#    for prop, value in args.items():
-#        cprop = prop.encode('ascii')
-#        if not props.exist(cprop):
-#            raise ValueError("{} is not a valid property of polytope::Polytope<Rational>")
-#
-#        if constructor = constructors[value]
-#
-#        nr, nc, mat = clean_mat(value)
-#        pm_mat = rat_mat_to_pm(nr, nc, mat)
-#        pm_assign_MatrixRational(pm_obj.take(prop), pm_mat[0])
-#        del pm_mat
-#
-#    return wrap_perl_object(pm_obj[0])
-
+    def __init__(self, app, type_name):
+        self.app = app
+        self.type_name = type_name
+
+    def __repr__(self):
+        return "Constructor of {}::{}".format(self.app.decode('ascii'), self.type_name.decode('ascii'))
+
+    def __call__(self, **props):
+        if not in_polymake_thread():
+            return run_in_polymake_thread(self, **props)
+        cdef PerlObject p = new_big_object(self.app, self.type_name)
+        cdef tuple tables = get_type_tables(p)
+        set_properties(p, <dict> tables[0], props)
+        return p
+
+    def from_many(self, data):
+        r"""
+        Return the list of objects built from the dictionaries of properties in ``data``
+
+        The application is set and the table of properties looked up only once.
+
+        >>> import polymake
+        >>> l = polymake.Polytope.from_many([{'POINTS': [[1,0], [1,k]]} for k in range(1,4)])
+        >>> [p.VOLUME for p in l]
+        [1, 2, 3]
+        """
+        if not in_polymake_thread():
+            return run_in_polymake_thread(self.from_many, data)
+        cdef list ans = []
+        cdef dict properties = None
+        cdef PerlObject p
+        cdef pm_PerlObject * pm_obj
+
+        perl_lock()
+        try:
+            set_application(self.app)
+            for props in data:
+                pm_obj = new pm_PerlObject(<string> self.type_name)
+                try:
+                    p = wrap_perl_object(pm_obj[0])
+                finally:
+                    del pm_obj
+                if properties is None:
+                    properties = <dict> get_type_tables(p)[0]
+                set_properties(p, properties, props)
+                ans.append(p)
+        finally:
+            perl_unlock()
+        return ans
+
+PolytopeRational = BigObjectConstructor(b"polytope", b"Polytope<Rational>")
 Polytope = PolytopeRational
 
-def PointConfiguration(**args):
-    cdef pm_MatrixRational * pm_mat
-    cdef pm_PerlObject * pm_obj = new pm_PerlObject(b"PointConfiguration<Rational>")
+PointConfiguration = BigObjectConstructor(b"polytope", b"PointConfiguration<Rational>")
@@ -0,0 +1,64 @@
+###############################################################################
+#       Copyright (C) 2016      Vincent Delecroix <vincent.delecroix@labri.fr>
+#  Distributed under the terms of the GNU General Public License (GPL),
+#  version 3 or any later version.  The full text of the GPL is available at:
+#                  http://www.gnu.org/licenses/
+###############################################################################
+
+# Export of the contiguous storage of dense polymake vectors and matrices
+# through the Python buffer protocol. The buffers are read-only since the
+# storage might be shared with other polymake objects (copy on write).
+
+from cpython.buffer cimport PyBUF_WRITABLE
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+
+from .defs cimport pm_MatrixInt, pm_MatrixFloat, pm_VectorInt, pm_VectorFloat
+
+cdef extern from "wrap.h":
+    const int * pm_MatrixInt_data "pm_matrix_data" (pm_MatrixInt)
+    const float * pm_MatrixFloat_data "pm_matrix_data" (pm_MatrixFloat)
+    const int * pm_VectorInt_data "pm_vector_data" (pm_VectorInt)
+    const float * pm_VectorFloat_data "pm_vector_data" (pm_VectorFloat)
+
+cdef inline int fill_buffer(Py_buffer * buffer, obj, const void * data,
+        int ndim, Py_ssize_t nrows, Py_ssize_t ncols,
+        Py_ssize_t itemsize, char * fmt, int flags) except -1:
+    r"""
+    Fill ``buffer`` with a C-contiguous view of ``data``
+
+    For ``ndim == 1`` the argument ``ncols`` is ignored. The shape and strides
+    are allocated in ``buffer.internal`` and must be freed with
+    :func:`release_buffer`.
+    """
+    if flags & PyBUF_WRITABLE:
+        raise BufferError("polymake objects are read-only")
+
+    cdef Py_ssize_t * shape = <Py_ssize_t *> PyMem_Malloc(4 * sizeof(Py_ssize_t))
+    if shape == NULL:
+        raise MemoryError
+
+    if ndim == 1:
+        shape[0] = nrows
+        shape[1] = itemsize
+        buffer.len = nrows * itemsize
+    else:
+        shape[0] = nrows
+        shape[1] = ncols
+        shape[2] = ncols * itemsize
+        shape[3] = itemsize
+        buffer.len = nrows * ncols * itemsize
+
+    buffer.buf = <void *> data
+    buffer.obj = obj
+    buffer.readonly = 1
+    buffer.itemsize = itemsize
+    buffer.format = fmt
+    buffer.ndim = ndim
+    buffer.shape = shape
+    buffer.strides = shape + ndim
+    buffer.suboffsets = NULL
+    buffer.internal = <void *> shape
+    return 0
+
+cdef inline void release_buffer(Py_buffer * buffer):
+    PyMem_Free(buffer.internal)
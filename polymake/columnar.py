@@ -0,0 +1,311 @@
+r"""
+Columnar storage of properties of many perl objects
+
+The values of some scalar or vector properties of a collection of perl
+objects are written on disk column by column in fixed-width binary files.
+The reader memory maps these files and returns NumPy arrays, so that the
+analysis of the results does not create any Python object per polytope.
+
+Each column is made of one or several parts (raw binary arrays):
+
+- integers (``Int``, ``Integer``): ``data`` (int64)
+- booleans: ``data`` (uint8)
+- floats: ``data`` (float64)
+- rationals: ``num`` and ``den`` (int64)
+- vectors: ``offsets`` (int64, of length the number of rows plus one) and
+  the concatenated entries in ``data`` (for integer and float vectors) or
+  ``num`` and ``den`` (for rational vectors)
+
+Integers that do not fit in 64 bits are replaced by ``OVERFLOW`` (the
+minimum of int64) in the int64 parts and stored in a side buffer, see
+:meth:`ColumnStore.overflow`.
+
+EXAMPLES:
+
+>>> import os, tempfile
+>>> import polymake
+>>> from polymake.columnar import write_columns, ColumnStore
+>>> path = os.path.join(tempfile.mkdtemp(), "cubes")
+>>> objects = (polymake.cube(d) for d in range(2, 6))
+>>> write_columns(path, objects, ["N_VERTICES", "F_VECTOR", "VOLUME"])
+4
+>>> store = ColumnStore(path)
+>>> store["N_VERTICES"]
+memmap([ 4,  8, 16, 32])
+>>> store["VOLUME"].num
+memmap([ 4,  8, 16, 32])
+>>> store["F_VECTOR"].row(1)
+memmap([ 8, 12,  6])
+"""
+###############################################################################
+#       Copyright (C) 2016      Vincent Delecroix <vincent.delecroix@labri.fr>
+#  Distributed under the terms of the GNU General Public License (GPL),
+#  version 3 or any later version.  The full text of the GPL is available at:
+#                  http://www.gnu.org/licenses/
+###############################################################################
+
+from __future__ import absolute_import
+
+import array
+import json
+import os
+import sys
+
+OVERFLOW = -2**63
+_INT64_MAX = 2**63 - 1
+
+_BUFSIZE = 1 << 16
+
+_PARTS = {
+    "int"             : ("data",),
+    "bool"            : ("data",),
+    "float"           : ("data",),
+    "rational"        : ("num", "den"),
+    "int_vector"      : ("offsets", "data"),
+    "float_vector"    : ("offsets", "data"),
+    "rational_vector" : ("offsets", "num", "den")
+}
+
+def _part_typecode(kind, part):
+    if part == "data":
+        if kind == "bool":
+            return 'B'
+        elif kind in ("float", "float_vector"):
+            return 'd'
+    return 'q'
+
+_NUMPY_TYPES = {'B': 'u1', 'd': 'f8', 'q': 'i8'}
+
+def _column_kind(value):
+    r"""
+    Return the kind of column able to store ``value``
+    """
+    from .integer import Integer
+    from .rational import Rational
+    from .vector import VectorInt, VectorInteger, VectorRational, VectorFloat
+    if isinstance(value, bool):
+        return "bool"
+    elif isinstance(value, (int, Integer)) or type(value).__name__ == 'long':
+        return "int"
+    elif isinstance(value, float):
+        return "float"
+    elif isinstance(value, Rational):
+        return "rational"
+    elif isinstance(value, (VectorInt, VectorInteger)):
+        return "int_vector"
+    elif isinstance(value, VectorFloat):
+        return "float_vector"
+    elif isinstance(value, VectorRational):
+        return "rational_vector"
+    raise TypeError("no columnar storage for {}".format(type(value).__name__))
+
+class _PartWriter(object):
+    r"""
+    Buffered writer of a part of a column (and of its side buffer)
+    """
+    def __init__(self, filename, typecode):
+        self.filename = filename
+        self.typecode = typecode
+        self.file = open(filename, "wb")
+        self.buf = array.array(typecode)
+        self.size = 0
+        self.big = []          # pairs (index, decimal representation)
+
+    def append(self, x):
+        if self.typecode == 'q':
+            x = int(x)
+            if not (OVERFLOW < x <= _INT64_MAX):
+                self.big.append((self.size, str(x)))
+                x = OVERFLOW
+        self.buf.append(x)
+        self.size += 1
+        if len(self.buf) >= _BUFSIZE:
+            self.flush()
+
+    def flush(self):
+        self.buf.tofile(self.file)
+        del self.buf[:]
+
+    def close(self):
+        self.flush()
+        self.file.close()
+        if self.big:
+            index = array.array('q', [i for i, _ in self.big])
+            with open(self.filename + ".bigidx", "wb") as f:
+                index.tofile(f)
+            with open(self.filename + ".big", "w") as f:
+                f.write("\n".join(s for _, s in self.big))
+
+def write_columns(path, objects, properties):
+    r"""
+    Write the values of ``properties`` of ``objects`` in the directory ``path``
+
+    The kind of each column is deduced from the value of the first object.
+    Returns the number of objects written.
+
+    INPUT:
+
+    - ``path`` -- a directory (created if needed)
+
+    - ``objects`` -- an iterable of perl objects
+
+    - ``properties`` -- a list of names of scalar or vector properties
+    """
+    properties = [p.decode('ascii') if isinstance(p, bytes) else p for p in properties]
+    if not os.path.isdir(path):
+        os.makedirs(path)
+
+    writers = None
+    kinds = None
+    nrows = 0
+    try:
+        for p in objects:
+            values = [getattr(p, name) for name in properties]
+            if writers is None:
+                kinds = [_column_kind(v) for v in values]
+                writers = []
+                for name, kind in zip(properties, kinds):
+                    parts = {}
+                    for part in _PARTS[kind]:
+                        filename = os.path.join(path, "{}.{}".format(name, part))
+                        parts[part] = _PartWriter(filename, _part_typecode(kind, part))
+                    if "offsets" in parts:
+                        parts["offsets"].append(0)
+                    writers.append(parts)
+
+            for v, kind, parts in zip(values, kinds, writers):
+                if kind in ("int", "bool", "float"):
+                    parts["data"].append(v)
+                elif kind == "rational":
+                    v = v.python()
+                    parts["num"].append(v.numerator)
+                    parts["den"].append(v.denominator)
+                else:
+                    entries = v.python()
+                    if kind == "rational_vector":
+                        for x in entries:
+                            parts["num"].append(x.numerator)
+                            parts["den"].append(x.denominator)
+                        n = parts["num"].size
+                    else:
+                        for x in entries:
+                            parts["data"].append(x)
+                        n = parts["data"].size
+                    parts["offsets"].append(n)
+            nrows += 1
+    finally:
+        if writers is not None:
+            for parts in writers:
+                for w in parts.values():
+                    w.close()
+
+    if writers is None:
+        raise ValueError("no object to write")
+
+    meta = {
+        "nrows": nrows,
+        "byteorder": sys.byteorder,
+        "columns": {name: kind for name, kind in zip(properties, kinds)}
+    }
+    with open(os.path.join(path, "columns.json"), "w") as f:
+        json.dump(meta, f, indent=1, sort_keys=True)
+    return nrows
+
+class VectorColumn(object):
+    r"""
+    A column of vectors
+
+    The entries of the vector in row ``i`` are ``data[offsets[i]:offsets[i+1]]``
+    (or ``num`` and ``den`` for rational vectors).
+    """
+    def __init__(self, offsets, **parts):
+        self.offsets = offsets
+        for name, value in parts.items():
+            setattr(self, name, value)
+        self._parts = sorted(parts)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def row(self, i):
+        r"""
+        Return the entries of the vector in row ``i`` (a tuple ``(num, den)``
+        for rational vectors)
+        """
+        a = self.offsets[i]
+        b = self.offsets[i + 1]
+        if self._parts == ["data"]:
+            return self.data[a:b]
+        return (self.num[a:b], self.den[a:b])
+
+class RationalColumn(object):
+    r"""
+    A column of rationals given by the arrays ``num`` and ``den``
+    """
+    def __init__(self, num, den):
+        self.num = num
+        self.den = den
+
+    def __len__(self):
+        return len(self.num)
+
+    def to_float(self):
+        r"""
+        Return the (approximate) values as a float64 array
+        """
+        return self.num / self.den.astype('f8')
+
+class ColumnStore(object):
+    r"""
+    Memory mapped reader of the columns written by :func:`write_columns`
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "columns.json")) as f:
+            meta = json.load(f)
+        self.nrows = meta["nrows"]
+        self.kinds = meta["columns"]
+        self._endian = '<' if meta["byteorder"] == "little" else '>'
+
+    def columns(self):
+        r"""
+        Return the list of column names
+        """
+        return sorted(self.kinds)
+
+    def _part(self, name, part):
+        import numpy
+        kind = self.kinds[name]
+        dtype = numpy.dtype(self._endian + _NUMPY_TYPES[_part_typecode(kind, part)])
+        filename = os.path.join(self.path, "{}.{}".format(name, part))
+        if not os.path.getsize(filename):
+            return numpy.empty(0, dtype=dtype)
+        return numpy.memmap(filename, dtype=dtype, mode="r")
+
+    def __getitem__(self, name):
+        r"""
+        Return the column ``name``
+
+        Scalar columns are returned as NumPy arrays, rationals as
+        :class:`RationalColumn` and vectors as :class:`VectorColumn`.
+        """
+        kind = self.kinds[name]
+        if kind in ("int", "bool", "float"):
+            return self._part(name, "data")
+        elif kind == "rational":
+            return RationalColumn(self._part(name, "num"), self._part(name, "den"))
+        return VectorColumn(**{part: self._part(name, part) for part in _PARTS[kind]})
+
+    def overflow(self, name, part="data"):
+        r"""
+        Return the dictionary index -> value of the integers of the part
+        ``part`` of the column ``name`` that do not fit in int64
+        """
+        filename = os.path.join(self.path, "{}.{}".format(name, part))
+        if not os.path.exists(filename + ".bigidx"):
+            return {}
+        import numpy
+        index = numpy.fromfile(filename + ".bigidx", dtype=self._endian + 'i8')
+        with open(filename + ".big") as f:
+            values = f.read().split("\n")
+        return {int(i): int(v) for i, v in zip(index, values)}
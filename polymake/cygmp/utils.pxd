@@ -17,4 +17,7 @@ cdef bytes mpq_get_bytes(mpq_srcptr)
 cdef mpz_get_pylong(mpz_srcptr z)
 cdef mpz_get_pyintlong(mpz_srcptr z)
 cdef int mpz_set_pylong(mpz_ptr z, L) except -1
+cdef int mpz_set_pyint(mpz_ptr z, x) except -1
+cdef int mpq_set_pyints(mpq_ptr q, num, den) except -1
 cdef Py_hash_t mpz_pythonhash(mpz_srcptr z)
+cdef Py_hash_t mpq_pythonhash(mpq_srcptr q) except? -1
@@ -29,13 +29,16 @@ AUTHORS:
 
 from __future__ import absolute_import, print_function
 
+import sys
+
 from libc.stdlib cimport malloc, free
 
 from cpython.object cimport Py_SIZE
 from cpython.longintrepr cimport (_PyLong_New, PyLongObject,
         digit, PyLong_SHIFT, PyLong_MASK)
 from cpython.int cimport PyInt_FromLong
-from cpython.long cimport PyLong_FromLong
+from cpython.long cimport PyLong_FromLong, PyLong_AsLongAndOverflow
+from cpython.version cimport PY_MAJOR_VERSION
 from .mpz cimport *
 from .mpq cimport *
 
@@ -117,12 +120,55 @@ cdef int mpz_set_pylong(mpz_ptr z, L) except -1:
         mpz_neg(z, z)
 
 
+cdef int mpz_set_pyint(mpz_ptr z, x) except -1:
+    """
+    Convert a Python ``int`` or ``long`` `x` to an ``mpz``.
+
+    Values that fit in a C long are set without any temporary.
+    """
+    cdef int overflow
+    cdef long v = PyLong_AsLongAndOverflow(x, &overflow)
+    if overflow:
+        mpz_set_pylong(z, x)
+    else:
+        mpz_set_si(z, v)
+    return 0
+
+
+cdef int mpq_set_pyints(mpq_ptr q, num, den) except -1:
+    """
+    Set ``q`` to ``num / den`` where `num` and `den` are Python ``int`` or
+    ``long``.
+    """
+    if not den:
+        raise ValueError("denominator must not be zero")
+    mpz_set_pyint(mpq_numref(q), num)
+    mpz_set_pyint(mpq_denref(q), den)
+    mpq_canonicalize(q)
+    return 0
+
+
+# modulus of the hash of numbers in Python 3 (2^61 - 1 on 64 bits machines)
+cdef unsigned long hash_modulus = 0
+cdef Py_hash_t hash_inf = 314159
+if PY_MAJOR_VERSION >= 3:
+    hash_modulus = sys.hash_info.modulus
+    hash_inf = sys.hash_info.inf
+
 cdef Py_hash_t mpz_pythonhash(mpz_srcptr z):
     """
     Hash an ``mpz``, where the hash value is the same as the hash value
     of the corresponding Python ``long``, except that we do not replace
     -1 by -2 (the Cython wrapper for ``__hash__`` does that).
     """
+    cdef Py_hash_t h
+    if PY_MAJOR_VERSION >= 3:
+        # hash(n) = sign(n) (|n| mod 2^61 - 1)
+        h = mpz_tdiv_ui(z, hash_modulus)
+        if mpz_sgn(z) < 0:
+            return -h
+        return h
+
     # Add all limbs, adding 1 for every carry
     cdef mp_limb_t h1 = 0
     cdef mp_limb_t h0
@@ -134,7 +180,37 @@ cdef Py_hash_t mpz_pythonhash(mpz_srcptr z):
         # Add 1 on overflow
         if h1 < h0: h1 += 1
 
-    cdef Py_hash_t h = h1
+    h = h1
     if mpz_sgn(z) < 0:
         return -h
     return h
+
+
+cdef Py_hash_t mpq_pythonhash(mpq_srcptr q) except? -1:
+    """
+    Hash an ``mpq``, where the hash value is the same as the hash value
+    of the corresponding ``fractions.Fraction``, except that we do not replace
+    -1 by -2 (the Cython wrapper for ``__hash__`` does that).
+    """
+    if mpz_cmp_ui(mpq_denref(q), 1) == 0:
+        return mpz_pythonhash(mpq_numref(q))
+    if PY_MAJOR_VERSION < 3:
+        from fractions import Fraction
+        return hash(Fraction(mpz_get_pylong(mpq_numref(q)), mpz_get_pylong(mpq_denref(q))))
+
+    # same as Fraction.__hash__: |num| times the inverse of den modulo
+    # 2^61 - 1 (or the hash of infinity if den is not invertible)
+    cdef mpz_t m, t
+    cdef Py_hash_t h
+    mpz_init_set_ui(m, hash_modulus)
+    mpz_init(t)
+    if mpz_invert(t, mpq_denref(q), m):
+        mpz_mul(t, t, mpq_numref(q))
+        h = mpz_tdiv_ui(t, hash_modulus)
+    else:
+        h = hash_inf
+    mpz_clear(m)
+    mpz_clear(t)
+    if mpz_sgn(mpq_numref(q)) < 0:
+        return -h
+    return h
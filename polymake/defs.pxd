@@ -98,10 +98,10 @@ cdef extern from "<utility>":
 cdef extern from "polymake/Main.h" namespace "polymake":
     cdef cppclass Main:
         Main()
-        Main(string)
-        void set_application(string)
+        Main(string) except +
+        void set_application(string) except +
         void set_preference(string)
-        void pm_include "include" (string)
+        void pm_include "include" (string) except +
 
 cdef extern from "polymake/Integer.h" namespace "polymake":
     ctypedef pm_const_Integer "const Integer"
@@ -235,6 +235,7 @@ cdef extern from "polymake/client.h":
     pm_PerlObject call_function "polymake::call_function" (string, int) except+
     pm_PerlObject call_function "polymake::call_function" (string, int, int) except+
     pm_PerlObject call_function "polymake::call_function" (string, int, int, int) except+
+    pm_PerlObject call_function "polymake::call_function" (string, string) except+
     pm_MapStringString call_function "polymake::call_function" (string, pm_PerlObject) except+
 
     pm_PerlObject* new_PerlObject_from_PerlObject "new perl::Object" (pm_PerlObject)
@@ -370,6 +371,7 @@ cdef extern from "polymake/Matrix.h" namespace "polymake":
         pm_MatrixInt()
         pm_MatrixInt(int nr, int nc)
         void assign(int r, int c, int val)
+        void resize(int r, int c)
         Py_ssize_t rows()
         Py_ssize_t cols()
 
@@ -377,6 +379,7 @@ cdef extern from "polymake/Matrix.h" namespace "polymake":
         pm_MatrixFloat()
         pm_MatrixFloat(int nr, int nc)
         void assign(int r, int c, float val)
+        void resize(int r, int c)
         Py_ssize_t rows()
         Py_ssize_t cols()
 
@@ -384,6 +387,7 @@ cdef extern from "polymake/Matrix.h" namespace "polymake":
         pm_MatrixRational()
         pm_MatrixRational(int nr, int nc)
         void assign(int r, int c, pm_Rational val)
+        void resize(int r, int c)
         Py_ssize_t rows()
         Py_ssize_t cols()
 
@@ -391,6 +395,7 @@ cdef extern from "polymake/Matrix.h" namespace "polymake":
         pm_MatrixInteger()
         pm_MatrixInteger(int nr, int nc)
         void assign(int r, int c, pm_Integer val)
+        void resize(int r, int c)
         Py_ssize_t rows()
         Py_ssize_t cols()
 
@@ -0,0 +1,107 @@
+r"""
+Asynchronous access to polymake from Python threads
+
+There is a single perl interpreter embedded in pypolymake and it is only
+accessed from a dedicated thread, the polymake thread (see
+:func:`polymake.main.run_in_polymake_thread`). The synchronous API waits for
+the results of the polymake thread while a :class:`PolymakeExecutor` returns
+futures, so that the other Python threads (e.g. the workers of a web server)
+are free to run while polymake computes.
+
+EXAMPLES:
+
+>>> import polymake
+>>> from polymake.executor import get_executor
+>>> ex = get_executor()
+>>> f = ex.call("cube", 3)
+>>> c = f.result()
+>>> ex.give(c, "N_FACETS").result()
+6
+"""
+###############################################################################
+#       Copyright (C) 2016      Vincent Delecroix <vincent.delecroix@labri.fr>
+#  Distributed under the terms of the GNU General Public License (GPL),
+#  version 3 or any later version.  The full text of the GPL is available at:
+#                  http://www.gnu.org/licenses/
+###############################################################################
+
+from __future__ import absolute_import
+
+import threading
+
+from .main import submit_to_polymake_thread
+
+class PolymakeExecutor(object):
+    r"""
+    Submit polymake requests to the polymake thread
+
+    The requests of all executors are executed one at a time in the order of
+    submission by the polymake thread.
+    """
+    def __init__(self):
+        self._shutdown = False
+
+    def submit(self, fn, *args, **kwds):
+        r"""
+        Schedule ``fn(*args, **kwds)`` and return a future
+        """
+        if self._shutdown:
+            raise RuntimeError("cannot schedule new requests after shutdown")
+        return submit_to_polymake_thread(fn, *args, **kwds)
+
+    def give(self, p, name):
+        r"""
+        Return a future for the property (or method) ``name`` of the perl object ``p``
+
+        >>> import polymake
+        >>> from polymake.executor import PolymakeExecutor
+        >>> ex = PolymakeExecutor()
+        >>> ex.give(polymake.cube(3), "N_VERTICES").result()
+        8
+        >>> ex.shutdown()
+        """
+        if isinstance(name, bytes):
+            name = name.decode('ascii')
+        return self.submit(getattr, p, name)
+
+    def call(self, name, *args, **kwds):
+        r"""
+        Return a future for the result of the polymake function ``name``
+
+        The function must be available in the :mod:`polymake` module.
+
+        >>> import polymake
+        >>> from polymake.executor import PolymakeExecutor
+        >>> ex = PolymakeExecutor()
+        >>> ex.call("cube", 4).result().N_VERTICES
+        16
+        >>> ex.shutdown()
+        """
+        from . import functions
+        return self.submit(getattr(functions, name), *args, **kwds)
+
+    def shutdown(self, wait=True):
+        r"""
+        Stop accepting new requests (the pending requests are still executed)
+
+        If ``wait`` is ``True``, wait for the pending requests. The polymake
+        thread itself keeps running for the other executors and for the
+        synchronous API.
+        """
+        self._shutdown = True
+        if wait:
+            # the requests are executed in order
+            submit_to_polymake_thread(lambda: None).result()
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_executor():
+    r"""
+    Return the default executor (created on first call)
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = PolymakeExecutor()
+        return _executor
@@ -34,6 +34,9 @@ def birkhoff(n, even=False):
     >>> b = polymake.birkhoff(3)
     >>> b.N_VERTICES
     6
+    >>> b = polymake.birkhoff(3, even=True)
+    >>> b.N_VERTICES
+    3
     """
     return call_polymake_function(b"polytope", b"birkhoff", n, even)
 
@@ -106,7 +109,7 @@ def cycle_graph(n):
     """
     return call_polymake_function(b"polytope", b"cycle_graph", n)
 
-def cyclic(d, n):
+def cyclic(d, n, start=None, spherical=False):
     r"""Produce a d-dimensional cyclic polytope with n points.
 
     Prototypical example of a neighborly polytope. Combinatorics completely
@@ -116,19 +119,36 @@ def cyclic(d, n):
     (1/2,0,...,0) and radius 1/2. In this case (the necessarily positive)
     parameter start defaults to 1.
 
+    Keyword arguments:
+
+    d -- the dimension
+    n -- the number of points
+    start -- index of the starting point (default to 0, or 1 if spherical)
+    spherical -- whether the points lie on the sphere (default to False)
+
     >>> import polymake
     >>> polymake.cyclic(2, 4).VERTICES
     1 0 0
     1 1 1
     1 2 4
     1 3 9
+    >>> polymake.cyclic(2, 4, start=2).VERTICES
+    1 2 4
+    1 3 9
+    1 4 16
+    1 5 25
     >>> polymake.cyclic(3, 3)
     Traceback (most recent call last):
     ...
     RuntimeError: cyclic: d >= 2 and n > d required
     <BLANKLINE>
     """
-    return call_polymake_function(b"polytope", b"cyclic", d, n)
+    options = {}
+    if start is not None:
+        options['start'] = start
+    if spherical:
+        options['spherical'] = True
+    return call_polymake_function(b"polytope", b"cyclic", d, n, **options)
 
 def cyclic_caratheodory(d, n):
     r"""Produce a d-dimensional cyclic polytope with n points.
@@ -149,7 +169,8 @@ def delpezzo(d, scale=1):
     Keyword arguments:
 
     d -- the dimension
-    scale -- the absolute value of each non-zero vertex coordinate.
+    scale -- the absolute value of each non-zero vertex coordinate (an
+             integer or a rational).
 
     >>> import polymake
     >>> polymake.delpezzo(2).VERTICES
@@ -159,6 +180,14 @@ def delpezzo(d, scale=1):
     1 0  -1
     1 1 1
     1 -1 -1
+    >>> from fractions import Fraction
+    >>> polymake.delpezzo(2, Fraction(1,2)).VERTICES
+    1 1/2 0
+    1 0 1/2
+    1 -1/2 0
+    1 0 -1/2
+    1 1/2 1/2
+    1 -1/2 -1/2
     """
     return call_polymake_function(b"polytope", b"delpezzo", d, scale)
 
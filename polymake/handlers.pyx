@@ -19,10 +19,9 @@ and "auto_mappings.pxi".
 from libcpp cimport bool
 from libcpp.string cimport string
 
-include "cysignals/signals.pxi"
-
 from .defs cimport *
 from .perl_object cimport *
+from .main cimport perl_lock, perl_unlock
 
 from .array cimport *
 from .incidence_matrix cimport *
@@ -38,9 +37,23 @@ from .set cimport *
 from .sparse_matrix cimport *
 from .vector cimport *
 
+# NOTE: all the functions below run in the polymake thread (see
+# polymake.main.perl_lock). The computation of a property, that might take
+# long, is done by pm_provide_property without the GIL so that other Python
+# threads can run meanwhile. The value is then copied out with GIVE while
+# holding the GIL: polymake values share their storage (with non-atomic
+# reference counts) between the perl side and the Python wrappers, that can be
+# copied or freed in any Python thread. Methods are called with the GIL.
+#
+# The computations can not be interrupted: the polymake thread is not the main
+# thread and cysignals can not be used there. A KeyboardInterrupt only stops
+# the wait of the calling thread while the computation runs to its end.
+cdef extern from "wrap.h":
+    void pm_provide_property "pm_provide" (pm_PerlObject*, string) nogil except +ValueError
+
 cdef extern from "wrap.h" namespace "polymake":
-    void pm_give_PerlObject "GIVE" (pm_PerlObject, pm_PerlObject*, string)
-    void pm_call_method_PerlObject "CALL_METHOD" (pm_PerlObject, pm_PerlObject*, string)
+    void pm_give_PerlObject "GIVE" (pm_PerlObject, pm_PerlObject*, string) except +ValueError
+    void pm_call_method_PerlObject "CALL_METHOD" (pm_PerlObject, pm_PerlObject*, string) except +ValueError
 
     void pm_give_int "GIVE" (int, pm_PerlObject*, string) except +
     void pm_call_method_int "CALL_METHOD" (int, pm_PerlObject*, string) except +
@@ -51,23 +64,33 @@ cdef extern from "wrap.h" namespace "polymake":
 
 def give_generic(PerlObject perl_object, bytes prop):
     cdef pm_PerlObject pm_ans
+    cdef pm_PerlObject * pm_obj = perl_object.pm_obj
     cdef string cprop = prop
-    sig_str("error in polymake while accessing property")
-    pm_give_PerlObject(pm_ans, perl_object.pm_obj, prop)
-    sig_off()
-    if not pm_ans.valid():
-        raise ValueError("invalid property {}".format(prop))
-    return wrap_perl_object(pm_ans)
+    perl_lock()
+    try:
+        with nogil:
+            pm_provide_property(pm_obj, cprop)
+        pm_give_PerlObject(pm_ans, pm_obj, cprop)
+        if not pm_ans.valid():
+            raise ValueError("invalid property {}".format(prop))
+        return wrap_perl_object(pm_ans)
+    finally:
+        pm_ans = pm_PerlObject()
+        perl_unlock()
 
 def call_method_generic(PerlObject perl_object, bytes prop):
     cdef pm_PerlObject pm_ans
+    cdef pm_PerlObject * pm_obj = perl_object.pm_obj
     cdef string cprop = prop
-    sig_str("error in polymke while accessing method")
-    pm_call_method_PerlObject(pm_ans, perl_object.pm_obj, prop)
-    sig_off()
-    if not pm_ans.valid():
-        raise ValueError("invalid property {}".format(prop))
-    return wrap_perl_object(pm_ans)
+    perl_lock()
+    try:
+        pm_call_method_PerlObject(pm_ans, pm_obj, cprop)
+        if not pm_ans.valid():
+            raise ValueError("invalid property {}".format(prop))
+        return wrap_perl_object(pm_ans)
+    finally:
+        pm_ans = pm_PerlObject()
+        perl_unlock()
 
 def give_bool(PerlObject perl_object, bytes prop):
     return give_int(perl_object, prop)
@@ -77,20 +100,48 @@ def call_method_bool(PerlObject perl_object, bytes prop):
 
 def give_int(PerlObject perl_object, bytes prop):
     cdef int ans
-    pm_give_int(ans, perl_object.pm_obj, prop)
+    cdef pm_PerlObject * pm_obj = perl_object.pm_obj
+    cdef string cprop = prop
+    perl_lock()
+    try:
+        with nogil:
+            pm_provide_property(pm_obj, cprop)
+        pm_give_int(ans, pm_obj, cprop)
+    finally:
+        perl_unlock()
     return ans
 def call_method_int(PerlObject perl_object, bytes prop):
     cdef int ans
-    pm_call_method_int(ans, perl_object.pm_obj, prop)
+    cdef pm_PerlObject * pm_obj = perl_object.pm_obj
+    cdef string cprop = prop
+    perl_lock()
+    try:
+        pm_call_method_int(ans, pm_obj, cprop)
+    finally:
+        perl_unlock()
     return ans
 
 def give_float(PerlObject perl_object, bytes prop):
     cdef float ans
-    pm_give_float(ans, perl_object.pm_obj, prop)
+    cdef pm_PerlObject * pm_obj = perl_object.pm_obj
+    cdef string cprop = prop
+    perl_lock()
+    try:
+        with nogil:
+            pm_provide_property(pm_obj, cprop)
+        pm_give_float(ans, pm_obj, cprop)
+    finally:
+        perl_unlock()
     return ans
 def call_method_float(PerlObject perl_object, bytes prop):
     cdef float ans
-    pm_call_method_float(ans, perl_object.pm_obj, prop)
+    cdef pm_PerlObject * pm_obj = perl_object.pm_obj
+    cdef string cprop = prop
+    perl_lock()
+    try:
+        pm_call_method_float(ans, pm_obj, cprop)
+    finally:
+        perl_unlock()
     return ans
 
 include "auto_handlers.pxi"
@@ -9,6 +9,16 @@
 ###############################################################################
 
 from libcpp.string cimport string
+from cpython cimport array
+import array
+
+include "auto_incidence_matrix.pxi"
+
+from .defs cimport pm_SetInt
+from .set cimport SetInt
+
+from .indexing cimport is_entry_index, entry_index
+from .views import matrix_getitem, iter_rows
 
 cdef extern from "<sstream>" namespace "std":
     cdef cppclass ostringstream:
@@ -20,21 +30,26 @@ cdef extern from "wrap.h" namespace "polymake":
 cdef extern from "polymake/IncidenceMatrix.h" namespace "polymake":
     bint pm_IncidenceMatrixNonSymmetric_get "WRAP_CALL" (pm_IncidenceMatrixNonSymmetric, int i, int j)
 
+cdef extern from "wrap.h" namespace "polymake":
+    # rows and columns as sets, minors (see wrap.h and polymake.views)
+    pm_SetInt pm_IncidenceMatrixNonSymmetric_row "pm_row<Set<int> >" (pm_IncidenceMatrixNonSymmetric, int)
+    pm_SetInt pm_IncidenceMatrixNonSymmetric_col "pm_col<Set<int> >" (pm_IncidenceMatrixNonSymmetric, int)
+    pm_IncidenceMatrixNonSymmetric pm_IncidenceMatrixNonSymmetric_minor "pm_minor" (pm_IncidenceMatrixNonSymmetric, const int *, int, const int *, int)
+
 cdef class IncidenceMatrixNonSymmetric(object):
     def __repr__(self):
         cdef ostringstream out
         pm_IncidenceMatrixNonSymmetric_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
 
+    def __reduce__(self):
+        return (from_plain_IncidenceMatrixNonSymmetric, (to_plain_IncidenceMatrixNonSymmetric(self),))
 
     def __getitem__(self, elt):
-        cdef Py_ssize_t nrows, ncols, i,j
-        nrows = self.pm_obj.rows()
-        ncols = self.pm_obj.cols()
-        i,j = elt
-        if not (0 <= i < nrows) or not (0 <= j < ncols):
-            raise IndexError("matrix index out of range")
-
+        if not is_entry_index(elt):
+            return matrix_getitem(self, elt)
+        cdef Py_ssize_t i, j
+        entry_index(elt, self.pm_obj.rows(), self.pm_obj.cols(), &i, &j)
         return pm_IncidenceMatrixNonSymmetric_get(self.pm_obj, i, j)
 
     def rows(self):
@@ -42,5 +57,50 @@ cdef class IncidenceMatrixNonSymmetric(object):
     def cols(self):
         return self.pm_obj.cols()
 
+    def __iter__(self):
+        return iter_rows(self)
+
+    def row(self, Py_ssize_t i):
+        r"""
+        Return the row ``i`` as a set of column indices
+
+        >>> import polymake
+        >>> polymake.cube(3).VERTICES_IN_FACETS.row(1)
+        {1 3 5 7}
+        """
+        if i < 0:
+            i += self.pm_obj.rows()
+        if not (0 <= i < self.pm_obj.rows()):
+            raise IndexError("matrix index out of range")
+        return self._row(i)
+
+    def col(self, Py_ssize_t j):
+        r"""
+        Return the column ``j`` as a set of row indices
+
+        >>> import polymake
+        >>> polymake.cube(3).VERTICES_IN_FACETS.col(0)
+        {0 2 4}
+        """
+        if j < 0:
+            j += self.pm_obj.cols()
+        if not (0 <= j < self.pm_obj.cols()):
+            raise IndexError("matrix index out of range")
+        return self._col(j)
+
+    def _row(self, int i):
+        cdef SetInt ans = SetInt.__new__(SetInt)
+        ans.pm_obj = pm_IncidenceMatrixNonSymmetric_row(self.pm_obj, i)
+        return ans
 
+    def _col(self, int j):
+        cdef SetInt ans = SetInt.__new__(SetInt)
+        ans.pm_obj = pm_IncidenceMatrixNonSymmetric_col(self.pm_obj, j)
+        return ans
 
+    def _minor(self, rows, cols):
+        cdef array.array r = array.array('i', rows)
+        cdef array.array c = array.array('i', cols)
+        cdef IncidenceMatrixNonSymmetric ans = IncidenceMatrixNonSymmetric.__new__(IncidenceMatrixNonSymmetric)
+        ans.pm_obj = pm_IncidenceMatrixNonSymmetric_minor(self.pm_obj, r.data.as_ints, len(r), c.data.as_ints, len(c))
+        return ans
@@ -0,0 +1,33 @@
+###############################################################################
+#       Copyright (C) 2016 Vincent Delecroix <vincent.delecroix@labri.fr>
+#
+#  Distributed under the terms of the GNU General Public License (GPL),
+#  version 3 or any later version.  The full text of the GPL is available at:
+#                  http://www.gnu.org/licenses/
+###############################################################################
+
+# __getitem__ of the matrices (matrix.pyx, sparse_matrix.pyx and
+# incidence_matrix.pyx), the other keys go to polymake/views.py
+cdef inline bint is_entry_index(elt):
+    r"""
+    Whether ``elt`` is a pair of integers (otherwise ``m[elt]`` is a view)
+    """
+    return (type(elt) is tuple and len(<tuple> elt) == 2 and
+            isinstance((<tuple> elt)[0], (int, long)) and
+            isinstance((<tuple> elt)[1], (int, long)))
+
+cdef inline int entry_index(elt, Py_ssize_t nrows, Py_ssize_t ncols,
+                            Py_ssize_t * i, Py_ssize_t * j) except -1:
+    r"""
+    Set ``i`` and ``j`` to the indices of the entry ``elt``, a pair of integers
+
+    Negative indices count from the end, as for the views.
+    """
+    i[0], j[0] = elt
+    if i[0] < 0:
+        i[0] += nrows
+    if j[0] < 0:
+        j[0] += ncols
+    if not (0 <= i[0] < nrows) or not (0 <= j[0] < ncols):
+        raise IndexError("matrix index out of range")
+    return 0
@@ -10,13 +10,17 @@
 
 from cpython.object cimport Py_LT, Py_LE, Py_EQ, Py_NE, Py_GT, Py_GE
 
-from .cygmp.types cimport mpz_t, mpq_t, mpz_srcptr, mpq_srcptr
-from .cygmp.mpz cimport mpz_init, mpz_clear, mpz_set_si
-from .cygmp.utils cimport mpz_set_pylong, mpz_get_bytes, mpq_get_bytes
+from .cygmp.types cimport mpz_t, mpq_t, mpz_ptr, mpz_srcptr, mpq_srcptr
+from .cygmp.mpz cimport mpz_set
+from .cygmp.utils cimport (mpz_set_pyint, mpz_get_pyintlong, mpz_get_bytes,
+        mpq_get_bytes, mpz_pythonhash)
 
 from libcpp.string cimport string
 
+include "auto_integer.pxi"
+
 from .defs cimport pm_Rational
+from .operands cimport integer_operand
 from .rational cimport Rational
 
 cdef extern from "<sstream>" namespace "std":
@@ -26,24 +30,24 @@ cdef extern from "<sstream>" namespace "std":
 cdef extern from "wrap.h" namespace "polymake":
     void pm_Integer_repr "WRAP_wrap_OUT" (ostringstream, pm_Integer)
 
+    void pm_Integer_iadd "WRAP_IADD" (pm_Integer, pm_Integer)
+    void pm_Integer_isub "WRAP_ISUB" (pm_Integer, pm_Integer)
+    void pm_Integer_imul "WRAP_IMUL" (pm_Integer, pm_Integer)
+    void pm_Integer_idiv "WRAP_IDIV" (pm_Integer, pm_Integer)
+
 cdef class Integer(object):
     r"""Polymake integer
     """
     def __init__(self, data):
-        cdef mpz_t z
-
-        if isinstance(data, int):
-            mpz_init(z)
-            mpz_set_si(z, data)
-        elif isinstance(data, long):
-            mpz_init(z)
-            mpz_set_pylong(z, data)
+        # the value is written directly in the GMP integer of pm_obj
+        cdef mpz_ptr z = <mpz_ptr> self.pm_obj.get_rep()
+        if type(data) is int or isinstance(data, (int, long)):
+            mpz_set_pyint(z, data)
+        elif type(data) is Integer:
+            mpz_set(z, <mpz_srcptr> (<Integer> data).pm_obj.get_rep())
         else:
             raise ValueError("Polymake integer can only be initialized from Python int and long")
 
-        self.pm_obj.set_mpz_srcptr(<mpz_srcptr>z)
-        mpz_clear(z)
-
     def _integer_(self, R=None):
         r"""Conversion to Sage integer
 
@@ -65,10 +69,29 @@ cdef class Integer(object):
         pm_Integer_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
 
-    #TODO: overflow!!
+    def __reduce__(self):
+        return (from_plain_Integer, (to_plain_Integer(self),))
+
+    def __hash__(self):
+        r"""
+        >>> import polymake
+        >>> hash(polymake.Integer(-12)) == hash(-12)
+        True
+        >>> hash(polymake.Integer(2**100)) == hash(2**100)
+        True
+        """
+        return mpz_pythonhash(<mpz_srcptr> self.pm_obj.get_rep())
+
     def __int__(self):
-        return <int> self.pm_obj
+        r"""
+        >>> import polymake
+        >>> int(polymake.Integer(2**100)) == 2**100
+        True
+        """
+        return mpz_get_pyintlong(<mpz_srcptr> self.pm_obj.get_rep())
 
+    __long__ = __int__
+    __index__ = __int__
     python = __int__
 
     def __float__(self):
@@ -76,13 +99,16 @@ cdef class Integer(object):
 
     def __richcmp__(self, other, op):
         cdef int c
+        cdef pm_Integer t
 
         if type(self) is type(other):
             c = (<Integer>self).pm_obj.compare((<Integer>other).pm_obj)
-        elif isinstance(self, int):
-            c = -(<Integer>other).pm_obj.compare(<long>self)
-        elif isinstance(other, int):
-            c = (<Integer>self).pm_obj.compare(<long>other)
+        elif isinstance(self, (int, long)):
+            integer_operand(t, self)
+            c = -(<Integer>other).pm_obj.compare(t)
+        elif isinstance(other, (int, long)):
+            integer_operand(t, other)
+            c = (<Integer>self).pm_obj.compare(t)
         else:
            return NotImplemented
 
@@ -95,36 +121,45 @@ cdef class Integer(object):
 
     def __add__(self, other):
         cdef Integer ans = Integer.__new__(Integer)
+        cdef pm_Integer t
         if type(self) is type(other):
             ans.pm_obj = (<Integer>self).pm_obj + (<Integer>other).pm_obj
-        elif isinstance(self, int):
-            ans.pm_obj = (<Integer>other).pm_obj + <long>self
-        elif isinstance(other, int):
-            ans.pm_obj = (<Integer>self).pm_obj + <long>other
+        elif isinstance(self, (int, long)):
+            integer_operand(t, self)
+            ans.pm_obj = t + (<Integer>other).pm_obj
+        elif isinstance(other, (int, long)):
+            integer_operand(t, other)
+            ans.pm_obj = (<Integer>self).pm_obj + t
         else:
             return NotImplemented
         return ans
 
     def __sub__(self, other):
         cdef Integer ans = Integer.__new__(Integer)
+        cdef pm_Integer t
         if type(self) is type(other):
             ans.pm_obj = (<Integer>self).pm_obj - (<Integer>other).pm_obj
-        elif isinstance(self, int):
-            ans.pm_obj = -((<Integer>other).pm_obj - <long>self)
-        elif isinstance(other, int):
-            ans.pm_obj = (<Integer>self).pm_obj - <long>other
+        elif isinstance(self, (int, long)):
+            integer_operand(t, self)
+            ans.pm_obj = t - (<Integer>other).pm_obj
+        elif isinstance(other, (int, long)):
+            integer_operand(t, other)
+            ans.pm_obj = (<Integer>self).pm_obj - t
         else:
             return NotImplemented
         return ans
 
     def __mul__(self, other):
         cdef Integer ans = Integer.__new__(Integer)
+        cdef pm_Integer t
         if type(self) is type(other):
             ans.pm_obj = (<Integer>self).pm_obj * (<Integer>other).pm_obj
-        elif isinstance(self, int):
-            ans.pm_obj = (<Integer>other).pm_obj * <long>self
-        elif isinstance(other, int):
-            ans.pm_obj = (<Integer>self).pm_obj * <long>other
+        elif isinstance(self, (int, long)):
+            integer_operand(t, self)
+            ans.pm_obj = t * (<Integer>other).pm_obj
+        elif isinstance(other, (int, long)):
+            integer_operand(t, other)
+            ans.pm_obj = (<Integer>self).pm_obj * t
         else:
             return NotImplemented
         return ans
@@ -134,19 +169,106 @@ cdef class Integer(object):
             raise ZeroDivisionError("polymake.number.Integer division by zero")
 
         cdef Integer ans = Integer.__new__(Integer)
+        cdef pm_Integer t
         if type(self) is type(other):
             ans.pm_obj = (<Integer>self).pm_obj / (<Integer>other).pm_obj
-        elif isinstance(self, int):
-            ans.pm_obj = (<Integer>Integer(self)).pm_obj / (<Integer>other).pm_obj
-        elif isinstance(other, int):
-            ans.pm_obj = (<Integer>self).pm_obj / <long>other
+        elif isinstance(self, (int, long)):
+            integer_operand(t, self)
+            ans.pm_obj = t / (<Integer>other).pm_obj
+        elif isinstance(other, (int, long)):
+            integer_operand(t, other)
+            ans.pm_obj = (<Integer>self).pm_obj / t
         else:
             return NotImplemented
         return ans
 
     def __div__(self, other):
         return self.__truediv__(other)
-    
+
+    # Integers are immutable for the operators: ``a += b`` builds a new
+    # Integer. The methods below are the explicit in-place API. They modify
+    # ``self``, which is then seen through every reference to it, and must
+    # not be used on an Integer that serves as a dictionary key or set
+    # element (its hash would change).
+
+    def iadd(self, other):
+        r"""
+        Add ``other`` to this integer in place
+
+        >>> import polymake
+        >>> a = polymake.Integer(5)
+        >>> b = a
+        >>> a.iadd(2**70)
+        >>> a
+        1180591620717411303429
+        >>> b is a
+        True
+        >>> c = polymake.Integer(5)
+        >>> d = c
+        >>> c += 3
+        >>> c, d
+        (8, 5)
+        """
+        cdef pm_Integer t
+        if type(other) is Integer:
+            pm_Integer_iadd(self.pm_obj, (<Integer>other).pm_obj)
+        else:
+            integer_operand(t, other)
+            pm_Integer_iadd(self.pm_obj, t)
+
+    def isub(self, other):
+        r"""
+        Subtract ``other`` from this integer in place
+
+        >>> import polymake
+        >>> a = polymake.Integer(5)
+        >>> a.isub(7)
+        >>> a
+        -2
+        """
+        cdef pm_Integer t
+        if type(other) is Integer:
+            pm_Integer_isub(self.pm_obj, (<Integer>other).pm_obj)
+        else:
+            integer_operand(t, other)
+            pm_Integer_isub(self.pm_obj, t)
+
+    def imul(self, other):
+        r"""
+        Multiply this integer by ``other`` in place
+
+        >>> import polymake
+        >>> a = polymake.Integer(5)
+        >>> a.imul(-3)
+        >>> a
+        -15
+        """
+        cdef pm_Integer t
+        if type(other) is Integer:
+            pm_Integer_imul(self.pm_obj, (<Integer>other).pm_obj)
+        else:
+            integer_operand(t, other)
+            pm_Integer_imul(self.pm_obj, t)
+
+    def idiv(self, other):
+        r"""
+        Divide this integer by ``other`` in place (as ``/`` does)
+
+        >>> import polymake
+        >>> a = polymake.Integer(17)
+        >>> a.idiv(5)
+        >>> a
+        3
+        """
+        cdef pm_Integer t
+        if not other:
+            raise ZeroDivisionError("polymake.number.Integer division by zero")
+        if type(other) is Integer:
+            pm_Integer_idiv(self.pm_obj, (<Integer>other).pm_obj)
+        else:
+            integer_operand(t, other)
+            pm_Integer_idiv(self.pm_obj, t)
+
     def sage(self):
         r"""Converts to a Sage integer
 
@@ -0,0 +1,199 @@
+r"""
+Archives of perl objects
+
+An archive is a single file containing a sequence of perl objects in
+polymake data format. Objects are appended one at a time and read back as a
+stream, so that scanning a large collection only needs the memory of a single
+object. Archives can optionally be compressed with gzip, bz2 or xz.
+
+EXAMPLES:
+
+>>> import os, tempfile
+>>> import polymake
+>>> from polymake.io import open_archive, iter_archive
+>>> path = os.path.join(tempfile.mkdtemp(), "cubes.pma.gz")
+>>> with open_archive(path, "w") as archive:
+...     for d in range(2, 6):
+...         archive.append(polymake.cube(d))
+>>> [p.N_VERTICES for p in iter_archive(path)]
+[4, 8, 16, 32]
+>>> [d["N_FACETS"] for d in iter_archive(path, properties=["N_FACETS"])]
+[4, 6, 8, 10]
+"""
+###############################################################################
+#       Copyright (C) 2016      Vincent Delecroix <vincent.delecroix@labri.fr>
+#  Distributed under the terms of the GNU General Public License (GPL),
+#  version 3 or any later version.  The full text of the GPL is available at:
+#                  http://www.gnu.org/licenses/
+###############################################################################
+
+from __future__ import absolute_import
+
+import os
+import struct
+
+# File layout: the magic string followed by records made of the length of
+# the data (8 bytes, big endian) and the data (as in PerlObject.to_bytes)
+MAGIC = b"PYPOLYMAKE-ARCHIVE-1\n"
+_LENGTH = struct.Struct(">Q")
+
+_EXTENSIONS = {
+    ".gz"  : "gzip",
+    ".bz2" : "bz2",
+    ".xz"  : "xz"
+}
+
+_SIGNATURES = [
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz")
+]
+
+def _open(path, mode, compression):
+    if compression is None:
+        return open(path, mode)
+    elif compression == "gzip":
+        import gzip
+        return gzip.open(path, mode)
+    elif compression == "bz2":
+        import bz2
+        return bz2.BZ2File(path, mode)
+    elif compression == "xz":
+        import lzma
+        return lzma.open(path, mode)
+    raise ValueError("unknown compression {!r}".format(compression))
+
+def _guess_compression(path):
+    r"""
+    Return the compression of the existing file ``path`` from its first bytes
+    """
+    with open(path, "rb") as f:
+        head = f.read(6)
+    for signature, compression in _SIGNATURES:
+        if head.startswith(signature):
+            return compression
+    return None
+
+class ArchiveWriter(object):
+    r"""
+    Writer of archives (see :func:`open_archive`)
+    """
+    def __init__(self, path, mode="w", compression="auto"):
+        if compression == "auto":
+            if mode == "a" and os.path.exists(path) and os.path.getsize(path):
+                compression = _guess_compression(path)
+            else:
+                compression = _EXTENSIONS.get(os.path.splitext(path)[1])
+        new = mode == "w" or not os.path.exists(path) or not os.path.getsize(path)
+        self._file = _open(path, mode + "b", compression)
+        if new:
+            self._file.write(MAGIC)
+
+    def append(self, p):
+        r"""
+        Write the perl object ``p`` at the end of the archive
+        """
+        data = p.to_bytes()
+        self._file.write(_LENGTH.pack(len(data)))
+        self._file.write(data)
+
+    def extend(self, objects):
+        r"""
+        Write the perl objects ``objects`` at the end of the archive
+        """
+        for p in objects:
+            self.append(p)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+class ArchiveReader(object):
+    r"""
+    Reader of archives (see :func:`open_archive`)
+
+    Iterating through a reader yields the serialized objects (as bytes) one
+    at a time, see :meth:`objects` for the deserialized version.
+    """
+    def __init__(self, path, compression="auto"):
+        if compression == "auto":
+            compression = _guess_compression(path)
+        self._file = _open(path, "rb", compression)
+        if self._file.read(len(MAGIC)) != MAGIC:
+            self._file.close()
+            raise ValueError("{} is not a polymake archive".format(path))
+
+    def __iter__(self):
+        read = self._file.read
+        while True:
+            head = read(_LENGTH.size)
+            if not head:
+                return
+            if len(head) != _LENGTH.size:
+                raise ValueError("truncated archive")
+            n, = _LENGTH.unpack(head)
+            data = read(n)
+            if len(data) != n:
+                raise ValueError("truncated archive")
+            yield data
+
+    def objects(self, properties=None):
+        r"""
+        Iterate through the objects of the archive
+
+        If ``properties`` is provided, each object is replaced by the
+        dictionary name -> value of the given properties (the objects
+        themselves are discarded as soon as the values are read).
+        """
+        from .perl_object import from_bytes
+        for data in self:
+            p = from_bytes(data)
+            if properties is None:
+                yield p
+            else:
+                yield {name: getattr(p, name) for name in properties}
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+def open_archive(path, mode="r", compression="auto"):
+    r"""
+    Open an archive of perl objects
+
+    INPUT:
+
+    - ``path`` -- the file name
+
+    - ``mode`` -- ``"r"`` (read), ``"w"`` (write) or ``"a"`` (append)
+
+    - ``compression`` -- ``None``, ``"gzip"``, ``"bz2"`` or ``"xz"``. By
+      default it is deduced from the content of the file when reading or
+      appending and from the extension of ``path`` (``.gz``, ``.bz2`` or
+      ``.xz``) when writing.
+    """
+    if mode == "r":
+        return ArchiveReader(path, compression)
+    elif mode in ("w", "a"):
+        return ArchiveWriter(path, mode, compression)
+    raise ValueError("mode must be 'r', 'w' or 'a'")
+
+def iter_archive(path, properties=None, compression="auto"):
+    r"""
+    Iterate through the objects (or the ``properties`` of the objects) of an archive
+
+    See :meth:`ArchiveReader.objects`.
+    """
+    with ArchiveReader(path, compression) as archive:
+        for x in archive.objects(properties):
+            yield x
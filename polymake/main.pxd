@@ -9,4 +9,15 @@
 
 from .defs cimport Main
 
+# NULL until polymake is initialized (see init in main.pyx)
 cdef Main * pm
+
+# the polymake thread, the only thread accessing perl (see main.pyx)
+cdef bint in_polymake_thread()
+cdef int post_to_polymake_thread(fn) except -1
+
+# sections accessing the perl interpreter (see main.pyx)
+cdef int perl_lock() except -1
+cdef void perl_unlock()
+
+cdef int set_application(bytes app) except -1
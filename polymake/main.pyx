@@ -9,31 +9,311 @@
 ###############################################################################
 
 from libcpp.string cimport string
+from cpython.pythread cimport PyThread_get_thread_ident
 
 from .defs cimport pm_ArrayString, pm_ArrayArrayPairStringString
 from .array cimport ArrayString, ArrayArrayPairStringString
 
-# properly initialize the Main
-# FIXME: pass user-settings parameter?
-cdef Main * pm = new Main("@interactive")
-pm.set_application(b"polytope")
-pm.pm_include(b"common::sage.rules")
+import threading
+try:
+    import queue
+except ImportError:
+    import Queue as queue
 
-cdef list apps = [b"common", b"fulton", b"group", b"matroid", b"topaz",
+# The polymake Main (and the perl interpreter it embeds) is created on the
+# first access to perl (see perl_lock) or by an explicit call to init(). It
+# takes several seconds, so importing polymake does not create it.
+cdef Main * pm = NULL
+
+# the current polymake application (see set_application)
+cdef bytes current_application = None
+
+# the rule files loaded with pm_include
+cdef list included_rules = []
+
+# the arguments of the initialization (see init)
+cdef bytes init_user_settings = b"@interactive"
+cdef list init_apps = [b"polytope"]
+
+cdef list all_apps = [b"common", b"fulton", b"group", b"matroid", b"topaz",
     b"fan", b"graph", b"ideal", b"polytope", b"tropical"]
 
+# The embedded perl interpreter is not thread safe and must always be used
+# from the same thread. All the accesses to perl (including the creation of
+# the polymake Main and the deletion of perl objects) are made by a single
+# dedicated thread, the polymake thread, started on first use. The functions
+# of pypolymake that access perl submit their work to that thread and wait for
+# the result (see run_in_polymake_thread), and the computations of properties
+# are run without the GIL so that the other Python threads can run in the
+# meantime (see handlers.pyx).
+#
+# The computations can not be interrupted: a KeyboardInterrupt only stops
+# the wait of the calling thread and the polymake thread finishes the
+# computation.
+cdef long polymake_thread_ident = -1
+cdef object polymake_requests = None
+cdef object polymake_thread_lock = threading.Lock()
+
+def _serve(requests):
+    r"""
+    Main loop of the polymake thread
+
+    The requests are tuples ``(future, fn, args, kwds)`` where ``future`` is
+    either a ``concurrent.futures.Future`` receiving the result of
+    ``fn(*args, **kwds)`` or ``None`` (the result and the errors are then
+    discarded).
+    """
+    global polymake_thread_ident
+    polymake_thread_ident = PyThread_get_thread_ident()
+    while True:
+        future, fn, args, kwds = requests.get()
+        if future is None:
+            try:
+                fn(*args, **kwds)
+            except BaseException:
+                pass
+        elif future.set_running_or_notify_cancel():
+            try:
+                result = fn(*args, **kwds)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+        # the arguments and the result might hold perl objects that must be
+        # released here
+        future = fn = args = kwds = result = None
+
+cdef object polymake_queue():
+    r"""
+    Return the queue of requests of the polymake thread (started if needed)
+    """
+    global polymake_requests
+    with polymake_thread_lock:
+        if polymake_requests is None:
+            requests = queue.Queue()
+            t = threading.Thread(target=_serve, args=(requests,), name="polymake")
+            t.daemon = True
+            t.start()
+            polymake_requests = requests
+    return polymake_requests
+
+cdef bint in_polymake_thread():
+    r"""
+    Whether the calling thread is the polymake thread
+    """
+    return PyThread_get_thread_ident() == polymake_thread_ident
+
+def submit_to_polymake_thread(fn, *args, **kwds):
+    r"""
+    Schedule ``fn(*args, **kwds)`` in the polymake thread and return a
+    ``concurrent.futures.Future``
+
+    The requests are run one at a time in the order of submission.
+
+    >>> from polymake.main import submit_to_polymake_thread, version
+    >>> submit_to_polymake_thread(version).result()   # random
+    b'3.0'
+    """
+    from concurrent.futures import Future
+    future = Future()
+    polymake_queue().put((future, fn, args, kwds))
+    return future
+
+def run_in_polymake_thread(fn, *args, **kwds):
+    r"""
+    Return ``fn(*args, **kwds)`` computed in the polymake thread
+
+    The calling thread waits for the result (unless it is the polymake thread
+    itself, in which case ``fn`` is called directly).
+    """
+    if in_polymake_thread():
+        return fn(*args, **kwds)
+    return submit_to_polymake_thread(fn, *args, **kwds).result()
+
+cdef int post_to_polymake_thread(fn) except -1:
+    r"""
+    Schedule ``fn()`` in the polymake thread without waiting for it
+
+    The result and the errors are discarded.
+    """
+    polymake_queue().put((None, fn, (), {}))
+    return 0
+
+cdef int perl_lock() except -1:
+    r"""
+    Start a section accessing perl
+
+    Check that the calling thread is the polymake thread and initialize
+    polymake if not already done. Each call must be followed by a call to
+    :func:`perl_unlock`. Note that C++ objects holding perl values (such as
+    ``perl::Object``) must be released before the end of the section.
+    """
+    if not in_polymake_thread():
+        raise RuntimeError("perl can only be accessed from the polymake thread (see polymake.main.run_in_polymake_thread)")
+    if pm is NULL:
+        initialize(init_user_settings, init_apps)
+    return 0
+
+cdef void perl_unlock():
+    r"""
+    End a section accessing perl started by :func:`perl_lock`
+
+    There is nothing to release: the sections are serialized by the polymake
+    thread.
+    """
+    pass
+
+cdef int initialize(bytes user_settings, list preload) except -1:
+    r"""
+    Create the polymake Main and load the applications ``preload``
+
+    The first application of ``preload`` becomes the current one. Must be
+    called from the polymake thread.
+    """
+    global pm, current_application
+    cdef Main * m = new Main(user_settings)
+    try:
+        for app in reversed(preload):
+            m.set_application(app)
+        m.pm_include(b"common::sage.rules")
+    except:
+        del m
+        raise
+    pm = m
+    current_application = preload[0]
+    included_rules.append(b"common::sage.rules")
+    return 0
+
+def init(user_settings=b"@interactive", apps=None):
+    r"""
+    Initialize polymake
+
+    This is done automatically on the first use of polymake with the default
+    arguments. Calling this function beforehand allows to choose the user
+    settings and to load once and for all the applications that will be used.
+
+    INPUT:
+
+    - ``user_settings`` -- the user settings file of polymake (the default
+      ``"@interactive"`` uses the settings of the interactive shell)
+
+    - ``apps`` -- list of applications to load (default to ``["polytope"]``).
+      The first one becomes the current application.
+
+    >>> import polymake
+    >>> polymake.init(apps=["polytope", "fan"])   # doctest: +SKIP
+    >>> polymake.main.pm_get_application()        # doctest: +SKIP
+    b'polytope'
+    """
+    if isinstance(user_settings, unicode):
+        user_settings = user_settings.encode('utf-8')
+    if apps is None:
+        apps = [b"polytope"]
+    else:
+        apps = [a.encode('ascii') if isinstance(a, unicode) else a for a in apps]
+        if not apps:
+            raise ValueError("at least one application must be loaded")
+        for a in apps:
+            if a not in all_apps:
+                raise ValueError("unknown application {!r}".format(a))
+
+    run_in_polymake_thread(_init, <bytes?> user_settings, apps)
+
+def _init(bytes user_settings, list apps):
+    global init_user_settings, init_apps
+    if pm is not NULL:
+        raise RuntimeError("polymake is already initialized")
+    init_user_settings = user_settings
+    init_apps = apps
+    perl_lock()
+    perl_unlock()
+
+def is_initialized():
+    r"""
+    Return whether polymake is initialized (see :func:`init`)
+    """
+    return pm is not NULL
+
+cdef int set_application(bytes app) except -1:
+    r"""
+    Make ``app`` the current polymake application
+
+    Nothing is done if ``app`` is already the current application.
+    """
+    global current_application
+    if app == current_application:
+        return 0
+    perl_lock()
+    try:
+        if app != current_application:
+            pm.set_application(app)
+            current_application = app
+    finally:
+        perl_unlock()
+    return 0
+
 def pm_set_application(bytes s):
-    pm.set_application(s)
+    if not in_polymake_thread():
+        return run_in_polymake_thread(pm_set_application, s)
+    set_application(s)
+
+def pm_get_application():
+    r"""
+    Return the name of the current polymake application
+    """
+    if pm is NULL:
+        run_in_polymake_thread(_init_default)
+    return current_application
+
+def _init_default():
+    perl_lock()
+    perl_unlock()
+
+def applications():
+    r"""
+    Return the list of polymake applications
+    """
+    return list(all_apps)
+
+def rules():
+    r"""
+    Return the list of rule files included so far (see :func:`pm_include`)
+    """
+    return list(included_rules)
+
+def settings():
+    r"""
+    Return the pair ``(user_settings, apps)`` polymake is initialized with
+    (see :func:`init`)
+    """
+    return (init_user_settings, list(init_apps))
 
 def pm_include(bytes s):
-    pm.pm_include(s)
+    if not in_polymake_thread():
+        return run_in_polymake_thread(pm_include, s)
+    perl_lock()
+    try:
+        pm.pm_include(s)
+    finally:
+        perl_unlock()
+    included_rules.append(s)
+
+    # new rules might change the properties and methods of existing types
+    from .perl_object import clear_type_cache
+    clear_type_cache()
 
 cdef extern from "polymake/client.h" namespace "polymake":
     pm_ArrayString call_it "call_function" (string) except +
 
 def functions_in_current_application():
+    if not in_polymake_thread():
+        return run_in_polymake_thread(functions_in_current_application)
     cdef ArrayString s = ArrayString.__new__(ArrayString)
-    s.pm_obj = call_it(<string> "Sage::functions_for_object")
+    perl_lock()
+    try:
+        s.pm_obj = call_it(<string> "Sage::functions_for_object")
+    finally:
+        perl_unlock()
     return s.python()
 
 cdef extern from "polymake/client.h" namespace "polymake":
@@ -43,7 +323,33 @@ def arguments(bytes fname):
     r"""
     Return a list of list of pairs of strings.
     """
+    if not in_polymake_thread():
+        return run_in_polymake_thread(arguments, fname)
     cdef ArrayArrayPairStringString a = ArrayArrayPairStringString.__new__(ArrayArrayPairStringString)
-    a.pm_obj = call_it2(<string> "Sage::arguments", <string> fname)
+    perl_lock()
+    try:
+        a.pm_obj = call_it2(<string> "Sage::arguments", <string> fname)
+    finally:
+        perl_unlock()
     return a.python()
 
+cdef extern from "polymake/client.h" namespace "polymake":
+    string call_it3 "call_function" (string) except +
+
+def version():
+    r"""
+    Return the version of polymake
+
+    >>> from polymake.main import version
+    >>> version()   # random
+    b'3.0'
+    """
+    if not in_polymake_thread():
+        return run_in_polymake_thread(version)
+    cdef string v
+    perl_lock()
+    try:
+        v = call_it3(<string> "version")
+    finally:
+        perl_unlock()
+    return <bytes> v
@@ -11,6 +11,8 @@
 from libcpp cimport bool
 from libcpp.string cimport string
 
+include "auto_map.pxi"
+
 from .defs cimport pm_PairStringString, pm_PairIntInt
 from .integer cimport Integer
 from .rational cimport Rational
@@ -45,6 +47,9 @@ cdef class MapStringString(object):
         pm_MapStringString_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
 
+    def __reduce__(self):
+        return (from_plain_MapStringString, (to_plain_MapStringString(self),))
+
     def __getitem__(self, bytes key):
         return self.pm_obj.get(key)
 
@@ -92,6 +97,9 @@ cdef class MapIntInt(object):
         pm_MapIntInt_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
 
+    def __reduce__(self):
+        return (from_plain_MapIntInt, (to_plain_MapIntInt(self),))
+
     def __getitem__(self, int key):
         return self.pm_obj.get(key)
 
@@ -155,6 +163,9 @@ cdef class MapRationalRational(object):
         pm_MapRationalRational_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
 
+    def __reduce__(self):
+        return (from_plain_MapRationalRational, (to_plain_MapRationalRational(self),))
+
     def __getitem__(self, Rational key):
         cdef Rational out = Rational.__new__(Rational)
         out.pm_obj = self.pm_obj.get(key.pm_obj)
@@ -184,6 +195,9 @@ cdef class MapIntegerInt(object):
         pm_MapIntegerInt_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
 
+    def __reduce__(self):
+        return (from_plain_MapIntegerInt, (to_plain_MapIntegerInt(self),))
+
     def __getitem__(self, Integer key):
         return self.pm_obj.get(key.pm_obj)
 
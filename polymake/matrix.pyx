@@ -70,22 +70,38 @@ polymake.matrix.IncidenceMatrixNonSymmetric
 #                  http://www.gnu.org/licenses/
 ###############################################################################
 
+from __future__ import absolute_import
+
 from libcpp cimport bool
 from libcpp.string cimport string
 
 include "auto_matrix.pxi"
 
 from libc.stdlib cimport malloc, free
-from .cygmp.types cimport mpz_t, mpq_t, mpz_srcptr, mpq_srcptr
+from libc.string cimport memcpy
+from libc.stdint cimport int64_t
+from cpython cimport array
+from .cygmp.types cimport (mpz_t, mpq_t, mpz_ptr, mpq_ptr, mpz_srcptr, mpq_srcptr,
+        mp_limb_t, mp_bits_per_limb)
 from .cygmp.mpz cimport *
 from .cygmp.mpq cimport *
 
-from .defs cimport pm_Integer, pm_Rational
+from .defs cimport (pm_Integer, pm_Rational, pm_VectorInt, pm_VectorFloat,
+        pm_VectorInteger, pm_VectorRational)
 
 from .integer cimport Integer
 from .rational cimport Rational
+from .vector cimport VectorInt, VectorFloat, VectorInteger, VectorRational
 
 from .defs cimport pm_MatrixInt_get, pm_MatrixFloat_get, pm_MatrixInteger_get, pm_MatrixRational_get
+from .buffer cimport fill_buffer, release_buffer, pm_MatrixInt_data, pm_MatrixFloat_data
+from .cygmp.utils cimport mpz_get_pylong, mpz_set_pylong, mpz_set_pyint, mpq_set_pyints
+
+from fractions import Fraction
+import array
+from .rational import get_num_den
+from .indexing cimport is_entry_index, entry_index
+from .views import matrix_getitem, iter_rows
 
 
 #cdef extern from "polymake/SparseMatrix.h" namespace "polymake":
@@ -103,51 +119,91 @@ cdef extern from "wrap.h" namespace "polymake":
     void pm_MatrixInteger_repr "WRAP_wrap_OUT" (ostringstream, pm_MatrixInteger)
     void pm_MatrixRational_repr "WRAP_wrap_OUT" (ostringstream, pm_MatrixRational)
 
-#    def python(self):
-#        r"""Converts to a list of list of fractions
-#
-#        >>> import polymake
-#
-#        >>> c = polymake.cube(3)
-#        >>> m = c.DEGREE_ONE_GENERATORS.python()
-#        >>> m
-#        [[1, -1, -1, -1],
-#         [1, -1, -1, 0],
-#         [1, -1, -1, 1],
-#        ...
-#         [1, 1, 1, 0],
-#         [1, 1, 1, 1]]
-#        >>> type(m), type(m[0]), type(m[0][0])
-#        (<type 'list'>, <type 'list'>, <type 'int'>)
-#
-#        >>> c = polymake.cube(3)
-#        >>> m = c.VERTEX_NORMALS.python()
-#        >>> m
-#        [[Fraction(1, 2), Fraction(1, 2), Fraction(1, 2), Fraction(1, 2)],
-#         [Fraction(1, 2), Fraction(-1, 2), Fraction(1, 2), Fraction(1, 2)],
-#         [Fraction(1, 2), Fraction(1, 2), Fraction(-1, 2), Fraction(1, 2)],
-#        ...
-#         [Fraction(1, 2), Fraction(1, 2), Fraction(-1, 2), Fraction(-1, 2)],
-#         [Fraction(1, 2), Fraction(-1, 2), Fraction(-1, 2), Fraction(-1, 2)]]
-#
-#        >>> c = polymake.cube(3)
-#        >>> m = c.EDGE_ORIENTATION.python()
-#        [[0, 4],
-#         [2, 6],
-#         [0, 2],
-#         ...
-#         [2, 3],
-#         [6, 7]]
-#        >>> type(m), type(m[0]), type(m[0][0])
-#        (<type 'list'>, <type 'list'>, <type 'int'>)
-#        """
-#        cdef Py_ssize_t i, j, nrows, ncols
-#        nrows = self.rows()
-#        ncols = self.cols()
-#        try:
-#            return [[self[i,j].python() for j in range(ncols)] for i in range(nrows)]
-#        except AttributeError:
-#            return [[self[i,j] for j in range(ncols)] for i in range(nrows)]
+    # contiguous storage (see wrap.h)
+    const pm_Integer * pm_MatrixInteger_data "pm_matrix_data" (pm_MatrixInteger)
+    const pm_Rational * pm_MatrixRational_data "pm_matrix_data" (pm_MatrixRational)
+    float * pm_MatrixFloat_mutable_data "pm_matrix_mutable_data" (pm_MatrixFloat&)
+    pm_Integer * pm_MatrixInteger_mutable_data "pm_matrix_mutable_data" (pm_MatrixInteger&)
+    pm_Rational * pm_MatrixRational_mutable_data "pm_matrix_mutable_data" (pm_MatrixRational&)
+
+    # rows, columns and minors (see wrap.h and polymake.views)
+    pm_VectorInt pm_MatrixInt_row "pm_row<Vector<int> >" (pm_MatrixInt, int)
+    pm_VectorInt pm_MatrixInt_col "pm_col<Vector<int> >" (pm_MatrixInt, int)
+    pm_MatrixInt pm_MatrixInt_minor "pm_minor" (pm_MatrixInt, const int *, int, const int *, int)
+    pm_VectorFloat pm_MatrixFloat_row "pm_row<Vector<float> >" (pm_MatrixFloat, int)
+    pm_VectorFloat pm_MatrixFloat_col "pm_col<Vector<float> >" (pm_MatrixFloat, int)
+    pm_MatrixFloat pm_MatrixFloat_minor "pm_minor" (pm_MatrixFloat, const int *, int, const int *, int)
+    pm_VectorInteger pm_MatrixInteger_row "pm_row<Vector<Integer> >" (pm_MatrixInteger, int)
+    pm_VectorInteger pm_MatrixInteger_col "pm_col<Vector<Integer> >" (pm_MatrixInteger, int)
+    pm_MatrixInteger pm_MatrixInteger_minor "pm_minor" (pm_MatrixInteger, const int *, int, const int *, int)
+    pm_VectorRational pm_MatrixRational_row "pm_row<Vector<Rational> >" (pm_MatrixRational, int)
+    pm_VectorRational pm_MatrixRational_col "pm_col<Vector<Rational> >" (pm_MatrixRational, int)
+    pm_MatrixRational pm_MatrixRational_minor "pm_minor" (pm_MatrixRational, const int *, int, const int *, int)
+
+    # arithmetic and linear algebra (see wrap.h)
+    pm_MatrixRational pm_MatrixRational_add "pm_add" (pm_MatrixRational, pm_MatrixRational) except +ValueError
+    pm_MatrixRational pm_MatrixRational_sub "pm_sub" (pm_MatrixRational, pm_MatrixRational) except +ValueError
+    pm_MatrixRational pm_MatrixRational_neg "pm_neg" (pm_MatrixRational)
+    pm_MatrixRational pm_MatrixRational_scale "pm_scale" (pm_MatrixRational, pm_Rational)
+    pm_MatrixRational pm_MatrixRational_product "pm_matrix_product" (pm_MatrixRational, pm_MatrixRational) except +ValueError
+    pm_VectorRational pm_MatrixRational_vector_product "pm_matrix_vector_product" (pm_MatrixRational, pm_VectorRational) except +ValueError
+    pm_VectorRational pm_VectorRational_matrix_product "pm_vector_matrix_product" (pm_VectorRational, pm_MatrixRational) except +ValueError
+    pm_MatrixRational pm_MatrixRational_transpose "pm_transpose" (pm_MatrixRational)
+    int pm_MatrixRational_rank "pm_rank" (pm_MatrixRational)
+    pm_Rational pm_MatrixRational_det "pm_det" (pm_MatrixRational) except +ValueError
+    pm_MatrixRational pm_MatrixRational_null_space "pm_null_space" (pm_MatrixRational)
+    pm_VectorRational pm_MatrixRational_lin_solve "pm_lin_solve" (pm_MatrixRational, pm_VectorRational) except +ValueError
+
+cdef inline int set_rational(pm_Rational * r, num, den) except -1:
+    r"""
+    Set ``r`` to ``num / den`` where ``num`` and ``den`` are Python integers
+    """
+    return mpq_set_pyints(<mpq_ptr> r.get_rep(), num, den)
+
+cdef limb_typecode():
+    r"""
+    Return the typecode of the arrays of GMP limbs (see :meth:`MatrixRational.export_limbs`)
+
+    It depends on the size of ``mp_limb_t`` which is not always an unsigned
+    long (e.g. on 64 bits Windows). GMP builds with nails (where some bits of
+    the limbs are unused) are not supported.
+    """
+    if mp_bits_per_limb != 8 * sizeof(mp_limb_t):
+        raise RuntimeError("GMP limbs with nails are not supported")
+    if sizeof(mp_limb_t) == sizeof(unsigned long):
+        return 'L'
+    elif sizeof(mp_limb_t) == sizeof(unsigned long long):
+        return 'Q'
+    raise RuntimeError("no array type for GMP limbs of {} bytes".format(sizeof(mp_limb_t)))
+
+cdef int check_same_shape(MatrixRational a, MatrixRational b) except -1:
+    if a.pm_obj.rows() != b.pm_obj.rows() or a.pm_obj.cols() != b.pm_obj.cols():
+        raise ValueError("matrices of different shapes")
+    return 0
+
+cdef tuple nested_shape(data):
+    r"""
+    Return the shape ``(nrows, ncols)`` of a list of rows
+    """
+    cdef Py_ssize_t nr = len(data)
+    cdef Py_ssize_t nc = len(data[0]) if nr else 0
+    for row in data:
+        if len(row) != nc:
+            raise ValueError("rows of different lengths")
+    return (nr, nc)
+
+def _numpy_kind(dtype):
+    r"""
+    Return ``'O'`` (Python objects) or ``'f'`` (float64) for the NumPy
+    data type ``dtype``
+    """
+    import numpy
+    dtype = numpy.dtype(dtype)
+    if dtype.kind == 'O':
+        return 'O'
+    elif dtype.kind == 'f' and dtype.itemsize == 8:
+        return 'f'
+    raise ValueError("dtype must be object or float64, got {}".format(dtype))
 
 cdef class MatrixInt(object):
     def __repr__(self):
@@ -155,21 +211,63 @@ cdef class MatrixInt(object):
         pm_MatrixInt_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
 
-    def __getitem__(self, elt):
-        cdef Py_ssize_t nrows, ncols, i,j
-        nrows = self.pm_obj.rows()
-        ncols = self.pm_obj.cols()
-        i,j = elt
-        if not (0 <= i < nrows) or not (0 <= j < ncols):
-            raise IndexError("matrix index out of range")
+    def __reduce__(self):
+        return (from_plain_MatrixInt, (to_plain_MatrixInt(self),))
 
+    def __getitem__(self, elt):
+        if not is_entry_index(elt):
+            return matrix_getitem(self, elt)
+        cdef Py_ssize_t i, j
+        entry_index(elt, self.pm_obj.rows(), self.pm_obj.cols(), &i, &j)
         return pm_MatrixInt_get(self.pm_obj, i, j)
 
+    def __getbuffer__(self, Py_buffer * buffer, int flags):
+        r"""
+        Read-only buffer on the entries of the matrix (no copy)
+
+        >>> import polymake
+        >>> import numpy
+        >>> c = polymake.cube(3)
+        >>> m = c.EDGE_ORIENTATION
+        >>> a = numpy.asarray(m)
+        >>> a.shape
+        (12, 2)
+        >>> a.dtype
+        dtype('int32')
+        >>> memoryview(m).tolist()
+        [[0, 4], [2, 6], [0, 2], ... [6, 7]]
+        """
+        fill_buffer(buffer, self, pm_MatrixInt_data(self.pm_obj), 2,
+                self.pm_obj.rows(), self.pm_obj.cols(), sizeof(int), b'i', flags)
+
+    def __releasebuffer__(self, Py_buffer * buffer):
+        release_buffer(buffer)
+
     def rows(self):
         return self.pm_obj.rows()
     def cols(self):
         return self.pm_obj.cols()
 
+    def __iter__(self):
+        return iter_rows(self)
+
+    def _row(self, int i):
+        cdef VectorInt ans = VectorInt.__new__(VectorInt)
+        ans.pm_obj = pm_MatrixInt_row(self.pm_obj, i)
+        return ans
+
+    def _col(self, int j):
+        cdef VectorInt ans = VectorInt.__new__(VectorInt)
+        ans.pm_obj = pm_MatrixInt_col(self.pm_obj, j)
+        return ans
+
+    def _minor(self, rows, cols):
+        cdef array.array r = array.array('i', rows)
+        cdef array.array c = array.array('i', cols)
+        cdef MatrixInt ans = MatrixInt.__new__(MatrixInt)
+        ans.pm_obj = pm_MatrixInt_minor(self.pm_obj, r.data.as_ints, len(r), c.data.as_ints, len(c))
+        return ans
+
     def sage(self):
         r"""Converts into a Sage matrix
 
@@ -195,35 +293,122 @@ cdef class MatrixFloat(object):
         pm_MatrixFloat_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
 
-    def __getitem__(self, elt):
-        cdef Py_ssize_t nrows, ncols, i,j
-        nrows = self.pm_obj.rows()
-        ncols = self.pm_obj.cols()
-        i,j = elt
-        if not (0 <= i < nrows) or not (0 <= j < ncols):
-            raise IndexError("matrix index out of range")
+    def __reduce__(self):
+        return (from_plain_MatrixFloat, (to_plain_MatrixFloat(self),))
 
+    def __getitem__(self, elt):
+        if not is_entry_index(elt):
+            return matrix_getitem(self, elt)
+        cdef Py_ssize_t i, j
+        entry_index(elt, self.pm_obj.rows(), self.pm_obj.cols(), &i, &j)
         return pm_MatrixFloat_get(self.pm_obj, i, j)
 
+    def __getbuffer__(self, Py_buffer * buffer, int flags):
+        r"""
+        Read-only buffer on the entries of the matrix (no copy)
+        """
+        fill_buffer(buffer, self, pm_MatrixFloat_data(self.pm_obj), 2,
+                self.pm_obj.rows(), self.pm_obj.cols(), sizeof(float), b'f', flags)
+
+    def __releasebuffer__(self, Py_buffer * buffer):
+        release_buffer(buffer)
+
     def rows(self):
         return self.pm_obj.rows()
     def cols(self):
         return self.pm_obj.cols()
 
+    def __iter__(self):
+        return iter_rows(self)
+
+    def _row(self, int i):
+        cdef VectorFloat ans = VectorFloat.__new__(VectorFloat)
+        ans.pm_obj = pm_MatrixFloat_row(self.pm_obj, i)
+        return ans
+
+    def _col(self, int j):
+        cdef VectorFloat ans = VectorFloat.__new__(VectorFloat)
+        ans.pm_obj = pm_MatrixFloat_col(self.pm_obj, j)
+        return ans
+
+    def _minor(self, rows, cols):
+        cdef array.array r = array.array('i', rows)
+        cdef array.array c = array.array('i', cols)
+        cdef MatrixFloat ans = MatrixFloat.__new__(MatrixFloat)
+        ans.pm_obj = pm_MatrixFloat_minor(self.pm_obj, r.data.as_ints, len(r), c.data.as_ints, len(c))
+        return ans
+
+    @staticmethod
+    def from_buffer(data):
+        r"""Build a float matrix from a two dimensional float64 buffer
+
+        The entries are copied in a single loop if ``data`` is a float64
+        buffer (e.g. a NumPy array). Otherwise, ``data`` is considered as a list
+        of rows.
+
+        >>> import polymake
+        >>> from polymake.matrix import MatrixFloat
+        >>> import numpy
+        >>> MatrixFloat.from_buffer(numpy.array([[1.5, 2.], [0., 3.25]]))
+        1.5 2
+        0 3.25
+        >>> MatrixFloat.from_buffer([[1.5, 2.], [0., 3.25]])
+        1.5 2
+        0 3.25
+        """
+        cdef MatrixFloat ans = MatrixFloat.__new__(MatrixFloat)
+        cdef const double[:, :] a
+        cdef float * out
+        cdef Py_ssize_t i, j, nr, nc
+
+        try:
+            a = data
+        except (TypeError, ValueError):
+            a = None
+
+        if a is not None:
+            nr = a.shape[0]
+            nc = a.shape[1]
+            ans.pm_obj.resize(nr, nc)
+            out = pm_MatrixFloat_mutable_data(ans.pm_obj)
+            for i in range(nr):
+                for j in range(nc):
+                    out[i * nc + j] = <float> a[i, j]
+        else:
+            nr, nc = nested_shape(data)
+            ans.pm_obj.resize(nr, nc)
+            out = pm_MatrixFloat_mutable_data(ans.pm_obj)
+            for i, row in enumerate(data):
+                for j, x in enumerate(row):
+                    out[i * nc + j] = <float> x
+
+        return ans
+
+cdef list MatrixInteger_flat_python(MatrixInteger m):
+    r"""
+    Return the list of entries (row by row) as Python integers
+    """
+    cdef Py_ssize_t k, n = m.pm_obj.rows() * m.pm_obj.cols()
+    cdef const pm_Integer * data = pm_MatrixInteger_data(m.pm_obj)
+    cdef list ans = [None] * n
+    for k in range(n):
+        ans[k] = mpz_get_pylong(data[k].get_rep())
+    return ans
+
 cdef class MatrixInteger(object):
     def __repr__(self):
         cdef ostringstream out
         pm_MatrixInteger_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
 
-    def __getitem__(self, elt):
-        cdef Py_ssize_t nrows, ncols, i,j
-        nrows = self.pm_obj.rows()
-        ncols = self.pm_obj.cols()
-        i,j = elt
-        if not (0 <= i < nrows) or not (0 <= j < ncols):
-            raise IndexError("matrix index out of range")
+    def __reduce__(self):
+        return (from_plain_MatrixInteger, (to_plain_MatrixInteger(self),))
 
+    def __getitem__(self, elt):
+        if not is_entry_index(elt):
+            return matrix_getitem(self, elt)
+        cdef Py_ssize_t i, j
+        entry_index(elt, self.pm_obj.rows(), self.pm_obj.cols(), &i, &j)
         cdef Integer ans = Integer.__new__(Integer)
         ans.pm_obj.set_mpz_srcptr(pm_MatrixInteger_get(self.pm_obj, i, j).get_rep())
         return ans
@@ -233,6 +418,126 @@ cdef class MatrixInteger(object):
     def cols(self):
         return self.pm_obj.cols()
 
+    def __iter__(self):
+        return iter_rows(self)
+
+    def _row(self, int i):
+        cdef VectorInteger ans = VectorInteger.__new__(VectorInteger)
+        ans.pm_obj = pm_MatrixInteger_row(self.pm_obj, i)
+        return ans
+
+    def _col(self, int j):
+        cdef VectorInteger ans = VectorInteger.__new__(VectorInteger)
+        ans.pm_obj = pm_MatrixInteger_col(self.pm_obj, j)
+        return ans
+
+    def _minor(self, rows, cols):
+        cdef array.array r = array.array('i', rows)
+        cdef array.array c = array.array('i', cols)
+        cdef MatrixInteger ans = MatrixInteger.__new__(MatrixInteger)
+        ans.pm_obj = pm_MatrixInteger_minor(self.pm_obj, r.data.as_ints, len(r), c.data.as_ints, len(c))
+        return ans
+
+    def python(self):
+        r"""Converts to a list of list of Python integers
+
+        >>> import polymake
+        >>> c = polymake.cube(3)
+        >>> m = c.DEGREE_ONE_GENERATORS.python()
+        >>> m
+        [[1, -1, -1, -1],
+         [1, -1, -1, 0],
+         [1, -1, -1, 1],
+        ...
+         [1, 1, 1, 0],
+         [1, 1, 1, 1]]
+        >>> type(m), type(m[0]), type(m[0][0])
+        (<class 'list'>, <class 'list'>, <class 'int'>)
+        """
+        cdef Py_ssize_t i, nc = self.pm_obj.cols()
+        cdef list flat = MatrixInteger_flat_python(self)
+        return [flat[i * nc: (i + 1) * nc] for i in range(self.pm_obj.rows())]
+
+    tolist = python
+
+    def to_numpy(self, dtype=object):
+        r"""Converts to a NumPy array
+
+        INPUT:
+
+        - ``dtype`` -- either ``object`` (exact Python integers, the default)
+          or ``float`` (lossy conversion to float64)
+
+        >>> import polymake
+        >>> c = polymake.cube(3)
+        >>> a = c.DEGREE_ONE_GENERATORS.to_numpy()
+        >>> a.shape, a.dtype
+        ((27, 4), dtype('O'))
+        >>> a = c.DEGREE_ONE_GENERATORS.to_numpy(float)
+        >>> a[0]
+        array([ 1., -1., -1., -1.])
+        """
+        import numpy
+        cdef Py_ssize_t k, nr = self.pm_obj.rows(), nc = self.pm_obj.cols()
+        cdef const pm_Integer * data
+        cdef double[::1] out
+
+        if _numpy_kind(dtype) == 'O':
+            ans = numpy.empty(nr * nc, dtype=object)
+            ans[:] = MatrixInteger_flat_python(self)
+        else:
+            ans = numpy.empty(nr * nc, dtype=numpy.float64)
+            out = ans
+            data = pm_MatrixInteger_data(self.pm_obj)
+            for k in range(nr * nc):
+                out[k] = mpz_get_d(data[k].get_rep())
+        return ans.reshape((nr, nc))
+
+    @staticmethod
+    def from_buffer(data):
+        r"""Build an integer matrix from a two dimensional int64 buffer
+
+        The entries are copied in a single loop if ``data`` is an int64
+        buffer (e.g. a NumPy array). Otherwise, ``data`` is considered as a list
+        of rows of Python integers (of arbitrary size).
+
+        >>> import polymake
+        >>> from polymake.matrix import MatrixInteger
+        >>> import numpy
+        >>> MatrixInteger.from_buffer(numpy.array([[1, -2], [3, 4]]))
+        1 -2
+        3 4
+        >>> MatrixInteger.from_buffer([[2**100, 0]])
+        1267650600228229401496703205376 0
+        """
+        cdef MatrixInteger ans = MatrixInteger.__new__(MatrixInteger)
+        cdef const int64_t[:, :] a
+        cdef pm_Integer * out
+        cdef Py_ssize_t i, j, nr, nc
+
+        try:
+            a = data
+        except (TypeError, ValueError):
+            a = None
+
+        if a is not None:
+            nr = a.shape[0]
+            nc = a.shape[1]
+            ans.pm_obj.resize(nr, nc)
+            out = pm_MatrixInteger_mutable_data(ans.pm_obj)
+            for i in range(nr):
+                for j in range(nc):
+                    mpz_set_si(<mpz_ptr> out[i * nc + j].get_rep(), a[i, j])
+        else:
+            nr, nc = nested_shape(data)
+            ans.pm_obj.resize(nr, nc)
+            out = pm_MatrixInteger_mutable_data(ans.pm_obj)
+            for i, row in enumerate(data):
+                for j, x in enumerate(row):
+                    mpz_set_pyint(<mpz_ptr> out[i * nc + j].get_rep(), x)
+
+        return ans
+
     def sage(self):
         r"""Converts to a Sage integer matrix
 
@@ -264,6 +569,18 @@ cdef class MatrixInteger(object):
         from .sage_conversion import MatrixInteger_to_sage
         return MatrixInteger_to_sage(self)
 
+cdef list MatrixRational_flat_python(MatrixRational m):
+    r"""
+    Return the list of entries (row by row) as Python fractions
+    """
+    cdef Py_ssize_t k, n = m.pm_obj.rows() * m.pm_obj.cols()
+    cdef const pm_Rational * data = pm_MatrixRational_data(m.pm_obj)
+    cdef mpq_srcptr q
+    cdef list ans = [None] * n
+    for k in range(n):
+        q = data[k].get_rep()
+        ans[k] = Fraction(mpz_get_pylong(mpq_numref(q)), mpz_get_pylong(mpq_denref(q)))
+    return ans
 
 cdef class MatrixRational(object):
     def __repr__(self):
@@ -271,14 +588,14 @@ cdef class MatrixRational(object):
         pm_MatrixRational_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
 
-    def __getitem__(self, elt):
-        cdef Py_ssize_t nrows, ncols, i, j
-        nrows = self.pm_obj.rows()
-        ncols = self.pm_obj.cols()
-        i,j = elt
-        if not (0 <= i < nrows) or not (0 <= j < ncols):
-            raise IndexError("matrix index out of range")
+    def __reduce__(self):
+        return (from_plain_MatrixRational, (to_plain_MatrixRational(self),))
 
+    def __getitem__(self, elt):
+        if not is_entry_index(elt):
+            return matrix_getitem(self, elt)
+        cdef Py_ssize_t i, j
+        entry_index(elt, self.pm_obj.rows(), self.pm_obj.cols(), &i, &j)
         cdef Rational ans = Rational.__new__(Rational)
         cdef mpq_srcptr q = pm_MatrixRational_get(self.pm_obj, i, j).get_rep()
         ans.pm_obj.set_mpq_srcptr(q)
@@ -289,6 +606,435 @@ cdef class MatrixRational(object):
     def cols(self):
         return self.pm_obj.cols()
 
+    def __iter__(self):
+        return iter_rows(self)
+
+    def _row(self, int i):
+        cdef VectorRational ans = VectorRational.__new__(VectorRational)
+        ans.pm_obj = pm_MatrixRational_row(self.pm_obj, i)
+        return ans
+
+    def _col(self, int j):
+        cdef VectorRational ans = VectorRational.__new__(VectorRational)
+        ans.pm_obj = pm_MatrixRational_col(self.pm_obj, j)
+        return ans
+
+    def _minor(self, rows, cols):
+        cdef array.array r = array.array('i', rows)
+        cdef array.array c = array.array('i', cols)
+        cdef MatrixRational ans = MatrixRational.__new__(MatrixRational)
+        ans.pm_obj = pm_MatrixRational_minor(self.pm_obj, r.data.as_ints, len(r), c.data.as_ints, len(c))
+        return ans
+
+    def __neg__(self):
+        cdef MatrixRational ans = MatrixRational.__new__(MatrixRational)
+        ans.pm_obj = pm_MatrixRational_neg(self.pm_obj)
+        return ans
+
+    def __add__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+        check_same_shape(<MatrixRational> self, <MatrixRational> other)
+        cdef MatrixRational ans = MatrixRational.__new__(MatrixRational)
+        ans.pm_obj = pm_MatrixRational_add((<MatrixRational> self).pm_obj, (<MatrixRational> other).pm_obj)
+        return ans
+
+    def __sub__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+        check_same_shape(<MatrixRational> self, <MatrixRational> other)
+        cdef MatrixRational ans = MatrixRational.__new__(MatrixRational)
+        ans.pm_obj = pm_MatrixRational_sub((<MatrixRational> self).pm_obj, (<MatrixRational> other).pm_obj)
+        return ans
+
+    def __mul__(self, other):
+        r"""
+        Multiplication by a rational number (or an integer)
+
+        Use ``@`` for the product of matrices.
+
+        >>> import polymake
+        >>> m = polymake.cube(2).VERTICES
+        >>> m * 2
+        2 -2 -2
+        2 2 -2
+        2 -2 2
+        2 2 2
+        """
+        cdef MatrixRational m
+        if type(self) is MatrixRational:
+            m = <MatrixRational> self
+            x = other
+        else:
+            m = <MatrixRational> other
+            x = self
+        if type(x) is not Rational:
+            if not isinstance(x, (int, long, Integer)) and not hasattr(x, 'denominator'):
+                return NotImplemented
+            x = Rational(x)
+        cdef MatrixRational ans = MatrixRational.__new__(MatrixRational)
+        ans.pm_obj = pm_MatrixRational_scale(m.pm_obj, (<Rational> x).pm_obj)
+        return ans
+
+    def __matmul__(self, other):
+        r"""
+        Product of matrices (or of a matrix and a vector)
+
+        >>> import polymake
+        >>> m = polymake.cube(2).VERTICES
+        >>> m @ m.transpose()
+        3 1 1 -1
+        1 3 -1 1
+        1 -1 3 1
+        -1 1 1 3
+        >>> m @ polymake.cube(2).CENTROID
+        1 1 1 1
+        """
+        cdef MatrixRational a, ma
+        cdef VectorRational v, va
+        if type(self) is MatrixRational and type(other) is MatrixRational:
+            a = <MatrixRational> self
+            b = <MatrixRational> other
+            if a.pm_obj.cols() != (<MatrixRational> b).pm_obj.rows():
+                raise ValueError("matrices of incompatible shapes")
+            ma = MatrixRational.__new__(MatrixRational)
+            ma.pm_obj = pm_MatrixRational_product(a.pm_obj, (<MatrixRational> b).pm_obj)
+            return ma
+        elif type(self) is MatrixRational and type(other) is VectorRational:
+            a = <MatrixRational> self
+            v = <VectorRational> other
+            if a.pm_obj.cols() != v.pm_obj.size():
+                raise ValueError("matrix and vector of incompatible sizes")
+            va = VectorRational.__new__(VectorRational)
+            va.pm_obj = pm_MatrixRational_vector_product(a.pm_obj, v.pm_obj)
+            return va
+        elif type(self) is VectorRational and type(other) is MatrixRational:
+            v = <VectorRational> self
+            a = <MatrixRational> other
+            if a.pm_obj.rows() != v.pm_obj.size():
+                raise ValueError("matrix and vector of incompatible sizes")
+            va = VectorRational.__new__(VectorRational)
+            va.pm_obj = pm_VectorRational_matrix_product(v.pm_obj, a.pm_obj)
+            return va
+        return NotImplemented
+
+    def transpose(self):
+        r"""
+        Return the transposed matrix
+
+        >>> import polymake
+        >>> polymake.cube(2).VERTICES.transpose()
+        1 1 1 1
+        -1 1 -1 1
+        -1 -1 1 1
+        """
+        cdef MatrixRational ans = MatrixRational.__new__(MatrixRational)
+        ans.pm_obj = pm_MatrixRational_transpose(self.pm_obj)
+        return ans
+
+    def rank(self):
+        r"""
+        Return the rank of the matrix
+
+        >>> import polymake
+        >>> polymake.cube(3).VERTICES.rank()
+        4
+        """
+        return pm_MatrixRational_rank(self.pm_obj)
+
+    def det(self):
+        r"""
+        Return the determinant of the (square) matrix
+
+        >>> import polymake
+        >>> m = polymake.cube(2).VERTICES
+        >>> (m.transpose() @ m).det()
+        64
+        """
+        if self.pm_obj.rows() != self.pm_obj.cols():
+            raise ValueError("the matrix must be square")
+        cdef Rational ans = Rational.__new__(Rational)
+        ans.pm_obj = pm_MatrixRational_det(self.pm_obj)
+        return ans
+
+    def null_space(self):
+        r"""
+        Return a matrix whose rows form a basis of the kernel of the matrix
+        (the vectors ``v`` such that ``self @ v`` is zero)
+
+        >>> import polymake
+        >>> m = polymake.cube(2).VERTICES
+        >>> k = m.transpose().null_space()
+        >>> k.rows()
+        1
+        >>> (m.transpose() @ k.transpose()).rank()
+        0
+        """
+        cdef MatrixRational ans = MatrixRational.__new__(MatrixRational)
+        ans.pm_obj = pm_MatrixRational_null_space(self.pm_obj)
+        return ans
+
+    def solve(self, VectorRational b):
+        r"""
+        Return a vector ``x`` such that ``self @ x == b``
+
+        A ``ValueError`` is raised if there is no solution.
+
+        >>> import polymake
+        >>> m = polymake.cube(2).VERTICES
+        >>> b = m @ polymake.cube(2).CENTROID
+        >>> m.solve(b)
+        1 0 0
+        """
+        if self.pm_obj.rows() != b.pm_obj.size():
+            raise ValueError("matrix and vector of incompatible sizes")
+        cdef VectorRational ans = VectorRational.__new__(VectorRational)
+        ans.pm_obj = pm_MatrixRational_lin_solve(self.pm_obj, b.pm_obj)
+        return ans
+
+    def python(self):
+        r"""Converts to a list of list of fractions
+
+        >>> import polymake
+        >>> c = polymake.cube(3)
+        >>> m = c.VERTEX_NORMALS.python()
+        >>> m
+        [[Fraction(1, 2), Fraction(1, 2), Fraction(1, 2), Fraction(1, 2)],
+         [Fraction(1, 2), Fraction(-1, 2), Fraction(1, 2), Fraction(1, 2)],
+         [Fraction(1, 2), Fraction(1, 2), Fraction(-1, 2), Fraction(1, 2)],
+        ...
+         [Fraction(1, 2), Fraction(1, 2), Fraction(-1, 2), Fraction(-1, 2)],
+         [Fraction(1, 2), Fraction(-1, 2), Fraction(-1, 2), Fraction(-1, 2)]]
+        """
+        cdef Py_ssize_t i, nc = self.pm_obj.cols()
+        cdef list flat = MatrixRational_flat_python(self)
+        return [flat[i * nc: (i + 1) * nc] for i in range(self.pm_obj.rows())]
+
+    tolist = python
+
+    def to_numpy(self, dtype=object):
+        r"""Converts to a NumPy array
+
+        INPUT:
+
+        - ``dtype`` -- either ``object`` (exact Python fractions, the default)
+          or ``float`` (lossy conversion to float64)
+
+        >>> import polymake
+        >>> c = polymake.cube(3)
+        >>> a = c.VERTEX_NORMALS.to_numpy()
+        >>> a[1,1]
+        Fraction(-1, 2)
+        >>> a = c.VERTEX_NORMALS.to_numpy(float)
+        >>> a[1]
+        array([ 0.5, -0.5,  0.5,  0.5])
+        """
+        import numpy
+        cdef Py_ssize_t k, nr = self.pm_obj.rows(), nc = self.pm_obj.cols()
+        cdef const pm_Rational * data
+        cdef double[::1] out
+
+        if _numpy_kind(dtype) == 'O':
+            ans = numpy.empty(nr * nc, dtype=object)
+            ans[:] = MatrixRational_flat_python(self)
+        else:
+            ans = numpy.empty(nr * nc, dtype=numpy.float64)
+            out = ans
+            data = pm_MatrixRational_data(self.pm_obj)
+            for k in range(nr * nc):
+                out[k] = mpq_get_d(data[k].get_rep())
+        return ans.reshape((nr, nc))
+
+    @staticmethod
+    def from_numpy(num, den=None):
+        r"""Build a rational matrix from numerators and denominators
+
+        INPUT:
+
+        - ``num`` -- the numerators as a two dimensional int64 buffer (e.g. a
+          NumPy array) or a list of rows. In the latter case, if ``den`` is not
+          provided, each entry can be an integer, a fraction, a pair
+          ``(num, den)`` or a float
+
+        - ``den`` -- optional denominators (same shape as ``num``)
+
+        When both ``num`` and ``den`` are int64 buffers the matrix is filled in
+        a single loop. Python integers of arbitrary size are supported in lists.
+
+        >>> import polymake
+        >>> from polymake.matrix import MatrixRational
+        >>> import numpy
+        >>> num = numpy.array([[1, 2], [3, 4]])
+        >>> den = numpy.array([[2, 2], [2, 2]])
+        >>> MatrixRational.from_numpy(num, den)
+        1/2 1
+        3/2 2
+        >>> from fractions import Fraction
+        >>> MatrixRational.from_numpy([[1, Fraction(1,3)], [(2,3), 0.5]])
+        1 1/3
+        2/3 1/2
+        """
+        cdef MatrixRational ans = MatrixRational.__new__(MatrixRational)
+        cdef const int64_t[:, :] a
+        cdef const int64_t[:, :] b = None
+        cdef pm_Rational * out
+        cdef mpq_ptr q
+        cdef Py_ssize_t i, j, nr, nc
+
+        try:
+            a = num
+            if den is not None:
+                b = den
+        except (TypeError, ValueError):
+            a = None
+
+        if a is not None:
+            nr = a.shape[0]
+            nc = a.shape[1]
+            if b is not None and (b.shape[0] != nr or b.shape[1] != nc):
+                raise ValueError("numerators and denominators of different shapes")
+            ans.pm_obj.resize(nr, nc)
+            out = pm_MatrixRational_mutable_data(ans.pm_obj)
+            for i in range(nr):
+                for j in range(nc):
+                    q = <mpq_ptr> out[i * nc + j].get_rep()
+                    mpz_set_si(mpq_numref(q), a[i, j])
+                    if b is not None:
+                        if b[i, j] == 0:
+                            raise ValueError("denominator must not be zero")
+                        mpz_set_si(mpq_denref(q), b[i, j])
+                        mpq_canonicalize(q)
+            return ans
+
+        nr, nc = nested_shape(num)
+        if den is not None and nested_shape(den) != (nr, nc):
+            raise ValueError("numerators and denominators of different shapes")
+        ans.pm_obj.resize(nr, nc)
+        out = pm_MatrixRational_mutable_data(ans.pm_obj)
+        for i, row in enumerate(num):
+            for j, x in enumerate(row):
+                if den is not None:
+                    set_rational(out + i * nc + j, x, den[i][j])
+                elif type(x) is int:
+                    set_rational(out + i * nc + j, x, 1)
+                else:
+                    if isinstance(x, float):
+                        x = Fraction(x)
+                    x, y = get_num_den(x)
+                    set_rational(out + i * nc + j, x, y)
+        return ans
+
+    def export_limbs(self):
+        r"""Export the entries as contiguous buffers of GMP limbs
+
+        No Python object is created per entry. The result is a dictionary
+        with the following keys
+
+        - ``nrows``, ``ncols`` -- the dimensions of the matrix
+
+        - ``signs`` -- a ``array('b')`` of length ``nrows * ncols`` with the
+          signs (-1, 0 or 1) of the entries, in row major order
+
+        - ``num_limbs``, ``den_limbs`` -- arrays containing the limbs (least
+          significant first) of the absolute values of the numerators and of
+          the denominators of all entries. Their typecode is ``'L'`` or
+          ``'Q'`` depending on the size of the GMP limbs on the platform.
+
+        - ``num_offsets``, ``den_offsets`` -- ``array('q')`` of length
+          ``nrows * ncols + 1``, the numerator of the ``k``-th entry is made of
+          the limbs ``num_limbs[num_offsets[k]:num_offsets[k+1]]`` (and
+          similarly for the denominator)
+
+        See also :meth:`export_int64` for matrices with small entries.
+
+        >>> import polymake
+        >>> m = polymake.cube(2).VERTEX_NORMALS
+        >>> d = m.export_limbs()
+        >>> d['nrows'], d['ncols']
+        (4, 3)
+        >>> d['signs']
+        array('b', [1, 1, 1, 1, -1, 1, 1, 1, -1, 1, -1, -1])
+        >>> list(d['num_limbs'])
+        [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
+        >>> list(d['den_limbs'])
+        [2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]
+        """
+        typecode = limb_typecode()
+        cdef Py_ssize_t k, n = self.pm_obj.rows() * self.pm_obj.cols()
+        cdef const pm_Rational * data = pm_MatrixRational_data(self.pm_obj)
+        cdef mpq_srcptr q
+        cdef size_t s
+
+        cdef array.array signs = array.clone(array.array('b'), n, False)
+        cdef array.array num_offsets = array.clone(array.array('q'), n + 1, False)
+        cdef array.array den_offsets = array.clone(array.array('q'), n + 1, False)
+
+        # sizes
+        num_offsets.data.as_longlongs[0] = 0
+        den_offsets.data.as_longlongs[0] = 0
+        for k in range(n):
+            q = data[k].get_rep()
+            signs.data.as_schars[k] = mpz_sgn(mpq_numref(q))
+            num_offsets.data.as_longlongs[k + 1] = num_offsets.data.as_longlongs[k] + mpz_size(mpq_numref(q))
+            den_offsets.data.as_longlongs[k + 1] = den_offsets.data.as_longlongs[k] + mpz_size(mpq_denref(q))
+
+        # limbs
+        cdef array.array num_limbs = array.clone(array.array(typecode), num_offsets.data.as_longlongs[n], False)
+        cdef array.array den_limbs = array.clone(array.array(typecode), den_offsets.data.as_longlongs[n], False)
+        for k in range(n):
+            q = data[k].get_rep()
+            s = mpz_size(mpq_numref(q))
+            memcpy(<mp_limb_t *> num_limbs.data.as_voidptr + num_offsets.data.as_longlongs[k],
+                   mpq_numref(q)._mp_d, s * sizeof(mp_limb_t))
+            s = mpz_size(mpq_denref(q))
+            memcpy(<mp_limb_t *> den_limbs.data.as_voidptr + den_offsets.data.as_longlongs[k],
+                   mpq_denref(q)._mp_d, s * sizeof(mp_limb_t))
+
+        return {'nrows': self.pm_obj.rows(),
+                'ncols': self.pm_obj.cols(),
+                'signs': signs,
+                'num_offsets': num_offsets,
+                'num_limbs': num_limbs,
+                'den_offsets': den_offsets,
+                'den_limbs': den_limbs}
+
+    def export_int64(self):
+        r"""Export the entries as two arrays of 64 bits integers
+
+        Return a triple ``(num, den, overflow)`` where ``num`` and ``den`` are
+        ``array('q')`` of length ``nrows * ncols`` containing the numerators and
+        denominators of the entries in row major order. If some entry does not
+        fit, ``overflow`` is ``True`` and the arrays are meaningless (use
+        :meth:`export_limbs` instead).
+
+        >>> import polymake
+        >>> m = polymake.cube(2).VERTEX_NORMALS
+        >>> num, den, overflow = m.export_int64()
+        >>> num
+        array('q', [1, 1, 1, 1, -1, 1, 1, 1, -1, 1, -1, -1])
+        >>> den
+        array('q', [2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2])
+        >>> overflow
+        False
+        """
+        cdef Py_ssize_t k, n = self.pm_obj.rows() * self.pm_obj.cols()
+        cdef const pm_Rational * data = pm_MatrixRational_data(self.pm_obj)
+        cdef mpq_srcptr q
+        cdef array.array num = array.clone(array.array('q'), n, False)
+        cdef array.array den = array.clone(array.array('q'), n, False)
+
+        if sizeof(long) < 8:
+            raise RuntimeError("export_int64 is not available on this platform")
+
+        for k in range(n):
+            q = data[k].get_rep()
+            if not mpz_fits_slong_p(mpq_numref(q)) or not mpz_fits_slong_p(mpq_denref(q)):
+                return (num, den, True)
+            num.data.as_longlongs[k] = mpz_get_si(mpq_numref(q))
+            den.data.as_longlongs[k] = mpz_get_si(mpq_denref(q))
+
+        return (num, den, False)
+
     def sage(self):
         r"""Converts into a Sage matrix
 
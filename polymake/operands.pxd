@@ -0,0 +1,18 @@
+###############################################################################
+#       Copyright (C) 2016 Vincent Delecroix <vincent.delecroix@labri.fr>
+#
+#  Distributed under the terms of the GNU General Public License (GPL),
+#  version 3 or any later version.  The full text of the GPL is available at:
+#                  http://www.gnu.org/licenses/
+###############################################################################
+
+from .defs cimport pm_Integer
+from .cygmp.types cimport mpz_ptr
+from .cygmp.utils cimport mpz_set_pyint
+
+# Python int operands of the scalar arithmetic (integer.pyx and rational.pyx)
+cdef inline int integer_operand(pm_Integer& t, x) except -1:
+    r"""Set ``t`` to the value of the Python integer ``x`` (of any size)"""
+    if not isinstance(x, (int, long)):
+        raise TypeError("unsupported operand type: {}".format(type(x).__name__))
+    return mpz_set_pyint(<mpz_ptr> t.get_rep(), x)
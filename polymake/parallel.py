@@ -0,0 +1,111 @@
+r"""
+Parallel evaluation of properties of many independent objects
+
+The perl interpreter embedded in polymake can only be used by one thread at
+a time. This module distributes the computations among worker processes,
+each of them running its own polymake instance. The objects are sent to the
+workers in polymake's native file format and the properties are converted to
+Python objects before being sent back.
+
+EXAMPLES:
+
+>>> import polymake
+>>> from polymake.parallel import map_property
+>>> objects = [polymake.cube(d) for d in range(2, 5)]
+>>> for i, d in sorted(map_property(objects, ["N_VERTICES", "F_VECTOR"], workers=2)):
+...     print(i, d["N_VERTICES"], d["F_VECTOR"])
+0 4 [4, 4]
+1 8 [8, 12, 6]
+2 16 [16, 32, 24, 8]
+"""
+###############################################################################
+#       Copyright (C) 2016      Vincent Delecroix <vincent.delecroix@labri.fr>
+#  Distributed under the terms of the GNU General Public License (GPL),
+#  version 3 or any later version.  The full text of the GPL is available at:
+#                  http://www.gnu.org/licenses/
+###############################################################################
+
+from __future__ import absolute_import
+
+import multiprocessing
+
+# tags of the transported values
+_PYTHON = 0
+_PERL_OBJECT = 1
+
+def _to_transport(value):
+    from .perl_object import PerlObject
+    if isinstance(value, PerlObject):
+        return (_PERL_OBJECT, value.to_bytes())
+    if hasattr(value, 'python'):
+        value = value.python()
+    return (_PYTHON, value)
+
+def _from_transport(tagged):
+    tag, value = tagged
+    if tag == _PERL_OBJECT:
+        from .perl_object import from_bytes
+        return from_bytes(value)
+    return value
+
+def _init_worker():
+    # initializes the embedded polymake once per process
+    from .main import init
+    init()
+
+def _work(task):
+    index, kind, payload, properties = task
+    if kind == _PERL_OBJECT:
+        from .perl_object import from_bytes
+        p = from_bytes(payload)
+    else:
+        p = payload()
+    ans = {}
+    for name in properties:
+        ans[name] = _to_transport(getattr(p, name))
+    return (index, ans)
+
+def map_property(objects, properties, workers=None, chunksize=1):
+    r"""
+    Iterate through the values of ``properties`` for each of the ``objects``
+
+    The pairs ``(index, values)`` are yielded in completion order where
+    ``index`` is the position in ``objects`` and ``values`` is a dictionary
+    property name -> value. Small types are converted with their ``python()``
+    method and perl objects are sent back in polymake format.
+
+    INPUT:
+
+    - ``objects`` -- an iterable of perl objects or of picklable callables
+      without argument building them in the worker (e.g.
+      ``functools.partial(polymake.cube, 5)``)
+
+    - ``properties`` -- a list of property (or method) names
+
+    - ``workers`` -- number of worker processes (default to the number of
+      cpus)
+
+    - ``chunksize`` -- number of objects sent at once to a worker
+    """
+    from .perl_object import PerlObject
+
+    properties = [p.decode('ascii') if isinstance(p, bytes) else p for p in properties]
+
+    def tasks():
+        for i, obj in enumerate(objects):
+            if isinstance(obj, PerlObject):
+                yield (i, _PERL_OBJECT, obj.to_bytes(), properties)
+            elif callable(obj):
+                yield (i, None, obj, properties)
+            else:
+                raise TypeError("invalid object {!r}: must be a perl object or a callable".format(obj))
+
+    # no fork: the perl interpreter of the parent must not be duplicated
+    ctx = multiprocessing.get_context('spawn')
+    pool = ctx.Pool(workers, initializer=_init_worker)
+    try:
+        for index, values in pool.imap_unordered(_work, tasks(), chunksize):
+            yield index, {name: _from_transport(v) for name, v in values.items()}
+    finally:
+        pool.terminate()
+        pool.join()
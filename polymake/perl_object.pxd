@@ -11,8 +11,16 @@ from .defs cimport pm_PerlObject, pm_MapStringString
 cdef class PerlObject:
     cdef pm_PerlObject * pm_obj       # underlying perl object
     cdef ref                          # reference to other perl object
-    cdef dict properties              # polymake properties
-    cdef dict methods                 # polymake methods
+    cdef dict properties              # polymake properties (set lazily)
+    cdef dict methods                 # polymake methods (set lazily)
+    cdef dict resolved                # attribute name -> (handler, bname, is_property) (set lazily)
+    cdef dict values                  # cached property values (None if disabled)
 
-cdef PerlObject wrap_perl_object(pm_PerlObject pm_obj)
+    cdef int _load_tables(self) except -1
+    cdef tuple _resolve(self, name)
+    cdef tuple _entry(self, name)
+    cdef _get(self, name, tuple entry)
+
+cdef tuple get_type_tables(PerlObject p)
+cdef PerlObject wrap_perl_object(pm_PerlObject& pm_obj)
 
@@ -9,14 +9,35 @@
 ###############################################################################
 
 from libcpp.string cimport string
+from libcpp.vector cimport vector
 
 from .defs cimport (call_function,
         new_PerlObject_from_PerlObject, pm_PerlObject, pm_MapStringString)
 from .map cimport MapStringString
-from .main cimport pm
+from .main cimport (perl_lock, perl_unlock, set_application, in_polymake_thread,
+        post_to_polymake_thread)
+from .main import run_in_polymake_thread
 
 from .handlers cimport get_property_handler, get_method_handler
 
+from libcpp cimport bool as cbool
+from .defs cimport (pm_Integer, pm_Rational, pm_MatrixInt, pm_MatrixFloat,
+        pm_MatrixInteger, pm_MatrixRational, pm_VectorInt, pm_VectorFloat,
+        pm_VectorInteger, pm_VectorRational, pm_SetInt,
+        pm_IncidenceMatrixNonSymmetric)
+from .integer cimport Integer
+from .rational cimport Rational
+from .matrix cimport MatrixInt, MatrixFloat, MatrixInteger, MatrixRational
+from .vector cimport VectorInt, VectorFloat, VectorInteger, VectorRational
+from .set cimport SetInt
+from .incidence_matrix cimport IncidenceMatrixNonSymmetric
+
+from .set import from_plain_SetInt
+
+from fractions import Fraction
+import numbers
+import operator
+
 cdef int DEBUG = 0
 
 def set_debug():
@@ -26,6 +47,23 @@ def uset_debug():
     global DEBUG
     DEBUG = 0
 
+# whether newly created perl objects keep the Python wrappers of their
+# properties (see PerlObject.cache_properties)
+cdef int CACHE_PROPERTIES = 0
+
+def set_property_cache():
+    r"""
+    Enable the property value cache on all perl objects created from now on
+    """
+    global CACHE_PROPERTIES
+    CACHE_PROPERTIES = 1
+def unset_property_cache():
+    r"""
+    Disable the property value cache on all perl objects created from now on
+    """
+    global CACHE_PROPERTIES
+    CACHE_PROPERTIES = 0
+
 # this is a bug in Cython!
 def _NOT_TO_BE_USED_():
     raise ValueError
@@ -46,10 +84,16 @@ cpdef dict get_properties(PerlObject p):
     >>> c = polymake.cube(3)
     >>> m = get_properties(c)
     """
+    if not in_polymake_thread():
+        return run_in_polymake_thread(get_properties, p)
     cdef MapStringString s = MapStringString.__new__(MapStringString)
     if DEBUG:
         print("  pypolymake debug WARNING: properties_for_object...")
-    s.pm_obj = call_function(<string> "Sage::properties_for_object", p.pm_obj[0])
+    perl_lock()
+    try:
+        s.pm_obj = call_function(<string> "Sage::properties_for_object", p.pm_obj[0])
+    finally:
+        perl_unlock()
     cdef dict d  = s.python()
     for k in list(s.keys()):
         if d[k].startswith(b"Visual::"):
@@ -67,53 +111,437 @@ cpdef dict get_methods(PerlObject p):
     >>> c = polymake.cube(3)
     >>> m = get_methods(c)
     """
+    if not in_polymake_thread():
+        return run_in_polymake_thread(get_methods, p)
     cdef MapStringString s = MapStringString.__new__(MapStringString)
     if DEBUG:
         print("  pypolymake debug WARNING: methods_for_object...")
-    s.pm_obj = call_function(<string> "Sage::methods_for_object", p.pm_obj[0])
+    perl_lock()
+    try:
+        s.pm_obj = call_function(<string> "Sage::methods_for_object", p.pm_obj[0])
+    finally:
+        perl_unlock()
     cdef dict d = s.python()
     for k in list(s.keys()):
         if d[k].startswith(b"Visual::"):
             del d[k]
     return d
 
+# The tables of properties and methods only depend on the polymake type of a
+# perl object. They are computed once per type and the very same dictionaries
+# are shared by all the PerlObject of that type (they must hence be considered
+# as read-only). The same holds for the cache of resolved attribute handlers.
+cdef dict type_tables = {}
+
+def clear_type_cache():
+    r"""
+    Forget the cached tables of properties and methods
+
+    This must be called whenever new rules are loaded in polymake (see
+    :func:`polymake.main.pm_include`) since they might add new properties or
+    methods to existing types.
+
+    EXAMPLES:
+
+    >>> import polymake
+    >>> from polymake.perl_object import clear_type_cache
+    >>> clear_type_cache()
+    """
+    type_tables.clear()
+
+cdef tuple get_type_tables(PerlObject p):
+    r"""
+    Return the triple ``(properties, methods, resolved)`` associated to the
+    type of ``p``
+
+    The last dictionary is filled by :meth:`PerlObject.__getattr__` and
+    associates to attribute names the triple ``(handler, bname, is_property)``.
+    """
+    cdef bytes type_name
+    cdef tuple tables
+    perl_lock()
+    try:
+        type_name = p.pm_obj.type().name()
+    finally:
+        perl_unlock()
+    try:
+        return <tuple> type_tables[type_name]
+    except KeyError:
+        if DEBUG:
+            print("  pypolymake debug WARNING: new type {}".format(type_name))
+        tables = (get_properties(p), get_methods(p), {})
+        type_tables[type_name] = tables
+        return tables
+
+cdef class PerlObjectDeleter:
+    r"""
+    Deletion of a ``perl::Object`` in the polymake thread
+
+    See :meth:`PerlObject.__dealloc__`.
+    """
+    cdef pm_PerlObject * pm_obj
+
+    def __call__(self):
+        del self.pm_obj
+        self.pm_obj = NULL
+
 # Hand written handlers
-cdef PerlObject wrap_perl_object(pm_PerlObject pm_obj):
+cdef PerlObject wrap_perl_object(pm_PerlObject& pm_obj):
+    # NOTE: the tables of properties and methods are only looked up on the
+    # first attribute access (see PerlObject._load_tables)
+    # NOTE: copying a perl object is a perl operation and this function must
+    # be called from the polymake thread (see polymake.main.perl_lock)
     cdef PerlObject ans = PerlObject.__new__(PerlObject)
     ans.pm_obj = new_PerlObject_from_PerlObject(pm_obj)
-    ans.properties = get_properties(ans)
-    ans.methods = get_methods(ans)
+    if CACHE_PROPERTIES:
+        ans.values = {}
     return ans
 
-def call_polymake_function(bytes app, bytes name, *args):
-    from .main import pm_set_application
-    pm_set_application(app)
+cdef extern from "wrap.h":
+    void pm_provide(pm_PerlObject *, const vector[string]&) nogil except +
+
+cdef extern from "wrap.h":
+    cdef cppclass pm_FunctionCall "pm_FunctionCall":
+        pm_FunctionCall(string) except +ValueError
+        pm_PerlObject call() nogil except +
+
+        void push_bool "push" (cbool) except +
+        void push_long "push" (long) except +
+        void push_double "push" (double) except +
+        void push_string "push" (string) except +
+        void push_Integer "push" (pm_Integer) except +
+        void push_Rational "push" (pm_Rational) except +
+        void push_PerlObject "push" (pm_PerlObject) except +
+        void push_MatrixInt "push" (pm_MatrixInt) except +
+        void push_MatrixFloat "push" (pm_MatrixFloat) except +
+        void push_MatrixInteger "push" (pm_MatrixInteger) except +
+        void push_MatrixRational "push" (pm_MatrixRational) except +
+        void push_VectorInt "push" (pm_VectorInt) except +
+        void push_VectorFloat "push" (pm_VectorFloat) except +
+        void push_VectorInteger "push" (pm_VectorInteger) except +
+        void push_VectorRational "push" (pm_VectorRational) except +
+        void push_SetInt "push" (pm_SetInt) except +
+        void push_IncidenceMatrix "push" (pm_IncidenceMatrixNonSymmetric) except +
+
+        void option_bool "option" (string, cbool) except +
+        void option_long "option" (string, long) except +
+        void option_double "option" (string, double) except +
+        void option_string "option" (string, string) except +
+        void option_Integer "option" (string, pm_Integer) except +
+        void option_Rational "option" (string, pm_Rational) except +
+        void option_PerlObject "option" (string, pm_PerlObject) except +
+        void option_MatrixInt "option" (string, pm_MatrixInt) except +
+        void option_MatrixFloat "option" (string, pm_MatrixFloat) except +
+        void option_MatrixInteger "option" (string, pm_MatrixInteger) except +
+        void option_MatrixRational "option" (string, pm_MatrixRational) except +
+        void option_VectorInt "option" (string, pm_VectorInt) except +
+        void option_VectorFloat "option" (string, pm_VectorFloat) except +
+        void option_VectorInteger "option" (string, pm_VectorInteger) except +
+        void option_VectorRational "option" (string, pm_VectorRational) except +
+        void option_SetInt "option" (string, pm_SetInt) except +
+        void option_IncidenceMatrix "option" (string, pm_IncidenceMatrixNonSymmetric) except +
+
+# Marshalling of the arguments of polymake functions. Each argument is first
+# converted to a pair (kind, value) where value is either a C-convertible
+# Python scalar or a pypolymake wrapper. The kind only depends on the type of
+# the argument and is cached in argument_kinds. For lists, tuples and arrays
+# the conversion also depends on the shape of the value and is decided for
+# each value (see prepare_argument).
+cdef enum:
+    ARG_BOOL
+    ARG_INT            # Python integer (fits in a long or converted to Integer)
+    ARG_DOUBLE
+    ARG_STRING
+    ARG_INTEGER
+    ARG_RATIONAL
+    ARG_FRACTION       # converted to Rational
+    ARG_SEQUENCE       # list or tuple, converted to a rational matrix or vector
+    ARG_ARRAY          # NumPy array (or similar), converted to a rational matrix or vector
+    ARG_PYSET          # Python set, converted to SetInt
+    ARG_PERL_OBJECT
+    ARG_MATRIX_INT
+    ARG_MATRIX_FLOAT
+    ARG_MATRIX_INTEGER
+    ARG_MATRIX_RATIONAL
+    ARG_VECTOR_INT
+    ARG_VECTOR_FLOAT
+    ARG_VECTOR_INTEGER
+    ARG_VECTOR_RATIONAL
+    ARG_SET_INT
+    ARG_INCIDENCE_MATRIX
+
+cdef dict argument_kinds = {
+    bool            : ARG_BOOL,
+    int             : ARG_INT,
+    long            : ARG_INT,
+    float           : ARG_DOUBLE,
+    bytes           : ARG_STRING,
+    unicode         : ARG_STRING,
+    Integer         : ARG_INTEGER,
+    Rational        : ARG_RATIONAL,
+    Fraction        : ARG_FRACTION,
+    list            : ARG_SEQUENCE,
+    tuple           : ARG_SEQUENCE,
+    set             : ARG_PYSET,
+    frozenset       : ARG_PYSET,
+    MatrixInt       : ARG_MATRIX_INT,
+    MatrixFloat     : ARG_MATRIX_FLOAT,
+    MatrixInteger   : ARG_MATRIX_INTEGER,
+    MatrixRational  : ARG_MATRIX_RATIONAL,
+    VectorInt       : ARG_VECTOR_INT,
+    VectorFloat     : ARG_VECTOR_FLOAT,
+    VectorInteger   : ARG_VECTOR_INTEGER,
+    VectorRational  : ARG_VECTOR_RATIONAL,
+    SetInt          : ARG_SET_INT,
+    IncidenceMatrixNonSymmetric : ARG_INCIDENCE_MATRIX,
+}
+
+cdef bint is_row(x):
+    r"""
+    Whether ``x`` is a row of a matrix given as a list of rows
+    """
+    return isinstance(x, (list, tuple)) or getattr(x, 'ndim', 0) == 1
+
+cdef tuple rational_matrix_or_vector(x, int ndim):
+    r"""
+    Return the pair ``(kind, value)`` for the rational matrix (if ``ndim`` is
+    2) or the rational vector (if ``ndim`` is 1) with entries ``x``
+    """
+    if ndim == 2:
+        return (ARG_MATRIX_RATIONAL, MatrixRational.from_numpy(x))
+    elif ndim == 1:
+        return (ARG_VECTOR_RATIONAL, MatrixRational.from_numpy([x])._row(0))
+    raise TypeError("can not pass an array of dimension {} to polymake".format(ndim))
+
+cdef tuple prepare_argument(x):
+    r"""
+    Return the pair ``(kind, value)`` to be pushed for the argument ``x``
+    """
+    cdef int kind
+    t = type(x)
+    try:
+        kind = argument_kinds[t]
+    except KeyError:
+        if isinstance(x, PerlObject):
+            kind = ARG_PERL_OBJECT
+        elif isinstance(x, numbers.Integral):
+            # NumPy integers (and similar)
+            kind = ARG_INT
+        elif isinstance(x, numbers.Rational):
+            kind = ARG_FRACTION
+        elif isinstance(x, numbers.Real):
+            kind = ARG_DOUBLE
+        elif getattr(x, 'ndim', 0) >= 1 and hasattr(x, 'shape'):
+            # NumPy arrays (and similar)
+            kind = ARG_ARRAY
+        else:
+            raise TypeError("can not pass an argument of type {} to polymake".format(t.__name__))
+        argument_kinds[t] = kind
+
+    if kind == ARG_INT:
+        try:
+            <long> x
+        except OverflowError:
+            return (ARG_INTEGER, Integer(operator.index(x)))
+    elif kind == ARG_STRING:
+        if not isinstance(x, bytes):
+            x = x.encode('utf-8')
+    elif kind == ARG_FRACTION:
+        return (ARG_RATIONAL, Rational(x.numerator, x.denominator))
+    elif kind == ARG_SEQUENCE:
+        # a list of rows is a matrix, a list of numbers a vector
+        return rational_matrix_or_vector(x, 2 if len(x) and is_row(x[0]) else 1)
+    elif kind == ARG_ARRAY:
+        return rational_matrix_or_vector(x, x.ndim)
+    elif kind == ARG_PYSET:
+        return (ARG_SET_INT, from_plain_SetInt("{{{}}}".format(" ".join(str(int(i)) for i in sorted(x))).encode('ascii')))
+    return (kind, x)
+
+cdef int push_argument(pm_FunctionCall * call, int kind, x) except -1:
+    if kind == ARG_BOOL: call.push_bool(x)
+    elif kind == ARG_INT: call.push_long(x)
+    elif kind == ARG_DOUBLE: call.push_double(x)
+    elif kind == ARG_STRING: call.push_string(x)
+    elif kind == ARG_INTEGER: call.push_Integer((<Integer> x).pm_obj)
+    elif kind == ARG_RATIONAL: call.push_Rational((<Rational> x).pm_obj)
+    elif kind == ARG_PERL_OBJECT: call.push_PerlObject((<PerlObject> x).pm_obj[0])
+    elif kind == ARG_MATRIX_INT: call.push_MatrixInt((<MatrixInt> x).pm_obj)
+    elif kind == ARG_MATRIX_FLOAT: call.push_MatrixFloat((<MatrixFloat> x).pm_obj)
+    elif kind == ARG_MATRIX_INTEGER: call.push_MatrixInteger((<MatrixInteger> x).pm_obj)
+    elif kind == ARG_MATRIX_RATIONAL: call.push_MatrixRational((<MatrixRational> x).pm_obj)
+    elif kind == ARG_VECTOR_INT: call.push_VectorInt((<VectorInt> x).pm_obj)
+    elif kind == ARG_VECTOR_FLOAT: call.push_VectorFloat((<VectorFloat> x).pm_obj)
+    elif kind == ARG_VECTOR_INTEGER: call.push_VectorInteger((<VectorInteger> x).pm_obj)
+    elif kind == ARG_VECTOR_RATIONAL: call.push_VectorRational((<VectorRational> x).pm_obj)
+    elif kind == ARG_SET_INT: call.push_SetInt((<SetInt> x).pm_obj)
+    elif kind == ARG_INCIDENCE_MATRIX: call.push_IncidenceMatrix((<IncidenceMatrixNonSymmetric> x).pm_obj)
+    else: raise RuntimeError("invalid argument kind {}".format(kind))
+    return 0
+
+cdef int push_option(pm_FunctionCall * call, string key, int kind, x) except -1:
+    if kind == ARG_BOOL: call.option_bool(key, x)
+    elif kind == ARG_INT: call.option_long(key, x)
+    elif kind == ARG_DOUBLE: call.option_double(key, x)
+    elif kind == ARG_STRING: call.option_string(key, x)
+    elif kind == ARG_INTEGER: call.option_Integer(key, (<Integer> x).pm_obj)
+    elif kind == ARG_RATIONAL: call.option_Rational(key, (<Rational> x).pm_obj)
+    elif kind == ARG_PERL_OBJECT: call.option_PerlObject(key, (<PerlObject> x).pm_obj[0])
+    elif kind == ARG_MATRIX_INT: call.option_MatrixInt(key, (<MatrixInt> x).pm_obj)
+    elif kind == ARG_MATRIX_FLOAT: call.option_MatrixFloat(key, (<MatrixFloat> x).pm_obj)
+    elif kind == ARG_MATRIX_INTEGER: call.option_MatrixInteger(key, (<MatrixInteger> x).pm_obj)
+    elif kind == ARG_MATRIX_RATIONAL: call.option_MatrixRational(key, (<MatrixRational> x).pm_obj)
+    elif kind == ARG_VECTOR_INT: call.option_VectorInt(key, (<VectorInt> x).pm_obj)
+    elif kind == ARG_VECTOR_FLOAT: call.option_VectorFloat(key, (<VectorFloat> x).pm_obj)
+    elif kind == ARG_VECTOR_INTEGER: call.option_VectorInteger(key, (<VectorInteger> x).pm_obj)
+    elif kind == ARG_VECTOR_RATIONAL: call.option_VectorRational(key, (<VectorRational> x).pm_obj)
+    elif kind == ARG_SET_INT: call.option_SetInt(key, (<SetInt> x).pm_obj)
+    elif kind == ARG_INCIDENCE_MATRIX: call.option_IncidenceMatrix(key, (<IncidenceMatrixNonSymmetric> x).pm_obj)
+    else: raise RuntimeError("invalid argument kind {}".format(kind))
+    return 0
+
+def call_polymake_function(bytes app, bytes name, *args, **options):
+    r"""
+    Call the polymake function ``name`` of the application ``app``
+
+    The function must return a big object. The positional arguments and the
+    options (keyword arguments) can be booleans, integers, floats, strings,
+    integers and rationals (from pypolymake or ``fractions``), perl objects,
+    and pypolymake matrices, vectors, sets and incidence matrices. Lists of
+    rows and two dimensional NumPy arrays are converted to rational matrices,
+    lists of numbers and one dimensional arrays to rational vectors and Python
+    sets of integers to sets.
+
+    EXAMPLES:
+
+    >>> from fractions import Fraction
+    >>> from polymake.perl_object import call_polymake_function
+    >>> call_polymake_function(b"polytope", b"cube", 2, Fraction(1,2), 0).VERTICES
+    1 0 0
+    1 1/2 0
+    1 0 1/2
+    1 1/2 1/2
+    >>> call_polymake_function(b"polytope", b"cyclic", 2, 4, start=1).VERTICES
+    1 1 1
+    1 2 4
+    1 3 9
+    1 4 16
+    """
+    if not in_polymake_thread():
+        return run_in_polymake_thread(call_polymake_function, app, name, *args, **options)
+    cdef list prepared_args = [prepare_argument(x) for x in args]
+    cdef list prepared_options = []
+    for key, value in options.items():
+        if not isinstance(key, bytes):
+            key = key.encode('ascii')
+        prepared_options.append((key,) + prepare_argument(value))
+
+    cdef pm_FunctionCall * call = NULL
     cdef pm_PerlObject pm_obj
-    if len(args) == 0:
-        pm_obj = call_function(<string> name)
-    elif len(args) == 1:
-        pm_obj = call_function(<string> name, <int> args[0])
-    elif len(args) == 2:
-        pm_obj = call_function(<string> name, <int> args[0], <int> args[1])
-    elif len(args) == 3:
-        pm_obj = call_function(<string> name, <int> args[0], <int> args[1], <int> args[2])
-    else:
-        raise NotImplementedError("can only handle 0-3 arguments")
-
-    return wrap_perl_object(pm_obj)
+    perl_lock()
+    try:
+        set_application(app)
+        call = new pm_FunctionCall(name)
+        for kind, x in prepared_args:
+            push_argument(call, kind, x)
+        for key, kind, x in prepared_options:
+            push_option(call, key, kind, x)
+        with nogil:
+            pm_obj = call.call()
+        return wrap_perl_object(pm_obj)
+    finally:
+        del call
+        pm_obj = pm_PerlObject()
+        perl_unlock()
+
+def load(filename):
+    r"""
+    Load a perl object from a file in polymake format
+
+    EXAMPLES:
+
+    >>> import os, tempfile
+    >>> import polymake
+    >>> from polymake.perl_object import load
+    >>> filename = os.path.join(tempfile.mkdtemp(), "cube.poly")
+    >>> polymake.cube(3)._save(filename.encode())
+    >>> load(filename).N_VERTICES
+    8
+    """
+    if not in_polymake_thread():
+        return run_in_polymake_thread(load, filename)
+    if not isinstance(filename, bytes):
+        filename = filename.encode('utf-8')
+    cdef pm_PerlObject pm_obj
+    perl_lock()
+    try:
+        pm_obj = call_function(<string> b"load", <string> filename)
+        return wrap_perl_object(pm_obj)
+    finally:
+        pm_obj = pm_PerlObject()
+        perl_unlock()
+
+def from_bytes(bytes data):
+    r"""
+    Return the perl object serialized in ``data`` (see :meth:`PerlObject.to_bytes`)
+
+    EXAMPLES:
+
+    >>> import polymake
+    >>> from polymake.perl_object import from_bytes
+    >>> c = polymake.cube(3)
+    >>> from_bytes(c.to_bytes()).N_VERTICES
+    8
+    """
+    import os, shutil, tempfile
+    tmpdir = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(tmpdir, "object.poly")
+        with open(filename, 'wb') as f:
+            f.write(data)
+        return load(filename)
+    finally:
+        shutil.rmtree(tmpdir)
 
 cdef class PerlObject:
     def __dealloc__(self):
-        del self.pm_obj
+        # the perl object must be deleted in the polymake thread (the
+        # wrapper might be garbage collected in any thread)
+        cdef PerlObjectDeleter deleter
+        if self.pm_obj is NULL:
+            return
+        if in_polymake_thread():
+            del self.pm_obj
+            return
+        deleter = PerlObjectDeleter.__new__(PerlObjectDeleter)
+        deleter.pm_obj = self.pm_obj
+        self.pm_obj = NULL
+        try:
+            post_to_polymake_thread(deleter)
+        except Exception:
+            # interpreter shutdown: the perl object is leaked
+            deleter.pm_obj = NULL
+
+    cdef int _load_tables(self) except -1:
+        r"""
+        Set the tables of properties and methods if not already done
+        """
+        if self.properties is None:
+            self.properties, self.methods, self.resolved = get_type_tables(self)
+        return 0
 
-    def __getattr__(self, name):
+    cdef tuple _resolve(self, name):
+        r"""
+        Return the triple ``(handler, bname, is_property)`` used to access the
+        attribute ``name`` or ``None`` if ``name`` is not a registered attribute
+        """
         cdef bytes bname = name.encode('utf-8')
         if DEBUG:
-            print("  pypolymake debug WARNING: __getattr__: name = {}".format(type(self), bname))
+            print("  pypolymake debug WARNING: _resolve: name = {}".format(type(self), bname))
 
         if bname in self.properties:
             pm_type = self.properties[bname]
             handler = get_property_handler(pm_type)
+            is_property = True
             if DEBUG:
                 print("  pypolymake debug WARNING: attribute found as a property")
                 print("  pypolymake debug WARNING: pm_type = {}".format(pm_type))
@@ -124,36 +552,244 @@ cdef class PerlObject:
             if not pm_type:
                 raise ValueError("polymake documentation is incomplete: type of {}->{} not available. Send a request to polymake developers!".format(self, name))
             handler = get_method_handler(pm_type)
+            is_property = False
             if DEBUG:
                 print("  pypolymake debug WARNING: attribute found as a method")
                 print("  pypolymake debug WARNING: pm_type = {}".format(pm_type))
                 print("  pypolymake debug WARNING: handler = {}".format(handler))
 
         else:
+            return None
+
+        return (handler, bname, is_property)
+
+    cdef tuple _entry(self, name):
+        r"""
+        Return the resolved entry of the attribute ``name``
+
+        The resolved handlers are shared by all objects of the same type
+        (unknown names are cached as ``None``).
+        """
+        self._load_tables()
+
+        cdef tuple entry
+        try:
+            entry = <tuple> self.resolved[name]
+        except KeyError:
+            entry = self._resolve(name)
+            self.resolved[name] = entry
+
+        if entry is None:
             raise AttributeError("{} not a registered attribute".format(name))
+        return entry
+
+    cdef _get(self, name, tuple entry):
+        r"""
+        Return the value of the attribute ``name`` using the resolved ``entry``
+        """
+        # methods are not cached since they might have side effects
+        if self.values is None or not entry[2]:
+            return entry[0](self, entry[1])
+
+        try:
+            return self.values[name]
+        except KeyError:
+            value = self.values[name] = entry[0](self, entry[1])
+            return value
+
+    def __getattr__(self, name):
+        if not in_polymake_thread():
+            # cached values and unknown names are answered without going
+            # through the polymake thread (only the Python caches are read)
+            values = self.values
+            if values is not None:
+                try:
+                    return values[name]
+                except KeyError:
+                    pass
+            if self.resolved is not None and self.resolved.get(name, ()) is None:
+                raise AttributeError("{} not a registered attribute".format(name))
+            return run_in_polymake_thread(getattr, self, name)
+        return self._get(name, self._entry(name))
+
+    def give_many(self, props):
+        r"""
+        Return a dictionary with the values of the properties in ``props``
+
+        All names are checked before any computation starts, so that a
+        misspelled property does not waste a long computation. The missing
+        properties are then computed together with a single call to the perl
+        method ``provide`` (so that the rule scheduler plans all of them at
+        once) and the values are finally read and converted one by one.
 
-        return handler(self, bname)
+        INPUT:
+
+        - ``props`` -- a list of property names (either ``str`` or ``bytes``)
+
+        >>> import polymake
+        >>> c = polymake.cube(3)
+        >>> d = c.give_many([b"N_VERTICES", b"N_FACETS"])
+        >>> d[b"N_VERTICES"], d[b"N_FACETS"]
+        (8, 6)
+        >>> c.give_many(["N_VERTICES", "NOT_A_PROPERTY"])
+        Traceback (most recent call last):
+        ...
+        AttributeError: NOT_A_PROPERTY not a registered attribute
+        """
+        if not in_polymake_thread():
+            return run_in_polymake_thread(self.give_many, props)
+        cdef list todo = []
+        cdef vector[string] provide
+        cdef tuple entry
+        for prop in props:
+            name = prop.decode('ascii') if isinstance(prop, bytes) else prop
+            entry = self._entry(name)
+            todo.append((prop, name, entry))
+            if entry[2] and (self.values is None or name not in self.values):
+                provide.push_back(<bytes> entry[1])
+
+        if provide.size() > 1:
+            perl_lock()
+            try:
+                with nogil:
+                    pm_provide(self.pm_obj, provide)
+            finally:
+                perl_unlock()
+
+        cdef dict ans = {}
+        for prop, name, entry in todo:
+            ans[prop] = self._get(name, entry)
+        return ans
+
+    def agive(self, name, timeout=None):
+        r"""
+        Return an awaitable for the property (or method) ``name``
+
+        The computation is run in the polymake thread (see
+        :mod:`polymake.aio`).
+
+        >>> import asyncio
+        >>> import polymake
+        >>> c = polymake.cube(3)
+        >>> asyncio.get_event_loop().run_until_complete(c.agive("N_VERTICES"))
+        8
+        """
+        from .aio import agive
+        return agive(self, name, timeout)
+
+    def cache_properties(self, flag=True):
+        r"""
+        Enable or disable the cache of property values on this object
+
+        When enabled, each property is converted only once and subsequent
+        accesses return the very same Python object without calling polymake.
+        The cache can be enabled for all new objects with
+        :func:`polymake.perl_object.set_property_cache`.
+
+        >>> import polymake
+        >>> c = polymake.cube(3)
+        >>> c.cache_properties()
+        >>> c.FACETS is c.FACETS
+        True
+        >>> c.cache_properties(False)
+        >>> c.FACETS is c.FACETS
+        False
+        """
+        if not flag:
+            self.values = None
+        elif self.values is None:
+            self.values = {}
+
+    def _invalidate_cache(self):
+        r"""
+        Forget the cached property values (if any)
+
+        This must be called by any function that modifies the underlying
+        perl object.
+        """
+        if self.values is not None:
+            self.values.clear()
 
     def __dir__(self):
+        if not in_polymake_thread():
+            return run_in_polymake_thread(self.__dir__)
+        self._load_tables()
         return dir(self.__class__) + [x.decode('ascii') for x in self.properties] + [x.decode('ascii') for x in self.methods]
 
     def _save(self, filename):
         """
         Saves this polytope to a file using polymake's representation.
         """
-        self.pm_obj.save(filename)
+        if not in_polymake_thread():
+            return run_in_polymake_thread(self._save, filename)
+        self._invalidate_cache()
+        perl_lock()
+        try:
+            self.pm_obj.save(filename)
+        finally:
+            perl_unlock()
+
+    def to_bytes(self):
+        r"""
+        Return the serialization of this object in polymake data format
+
+        All the properties computed so far are stored, so they are not
+        recomputed after deserialization with :func:`from_bytes`. The
+        serialization goes through a temporary file since polymake only
+        provides file based input and output.
+
+        >>> import pickle
+        >>> import polymake
+        >>> c = polymake.cube(3)
+        >>> c.F_VECTOR
+        8 12 6
+        >>> b"F_VECTOR" in c.to_bytes()
+        True
+        >>> pickle.loads(pickle.dumps(c)).F_VECTOR
+        8 12 6
+        """
+        import os, shutil, tempfile
+        tmpdir = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(tmpdir, "object.poly")
+            self._save(filename.encode('utf-8'))
+            with open(filename, 'rb') as f:
+                return f.read()
+        finally:
+            shutil.rmtree(tmpdir)
+
+    from_bytes = staticmethod(from_bytes)
+
+    def __reduce__(self):
+        return (from_bytes, (self.to_bytes(),))
 
     def type_name(self):
         r"""
         Return the name of the type of this object
         """
-        return (<bytes> self.pm_obj.type().name()).decode('ascii')
+        if not in_polymake_thread():
+            return run_in_polymake_thread(self.type_name)
+        cdef string name
+        perl_lock()
+        try:
+            name = self.pm_obj.type().name()
+        finally:
+            perl_unlock()
+        return (<bytes> name).decode('ascii')
 
     def __str__(self): return self.type_name()
     def __repr__(self): return self.type_name()
 
     def name(self):
-        return (<bytes> self.pm_obj.name()).decode('ascii')
+        if not in_polymake_thread():
+            return run_in_polymake_thread(self.name)
+        cdef string name
+        perl_lock()
+        try:
+            name = self.pm_obj.name()
+        finally:
+            perl_unlock()
+        return (<bytes> name).decode('ascii')
 
     def sage(self):
         r"""Converts to a Sage object
@@ -10,15 +10,21 @@
 
 from cpython.object cimport Py_LT, Py_LE, Py_EQ, Py_NE, Py_GT, Py_GE
 
-from .cygmp.types cimport mpz_t, mpq_t, mpz_srcptr, mpq_srcptr
-from .cygmp.mpz cimport mpz_init, mpz_clear, mpz_set_si
-from .cygmp.mpq cimport mpq_init, mpq_clear, mpq_numref, mpq_denref, mpq_canonicalize
-from .cygmp.utils cimport mpz_set_pylong, mpz_get_bytes, mpq_get_bytes
+from .cygmp.types cimport mpz_t, mpq_t, mpz_srcptr, mpq_ptr, mpq_srcptr
+from .cygmp.mpz cimport mpz_set, mpz_set_ui
+from .cygmp.mpq cimport mpq_set, mpq_numref, mpq_denref
+from .cygmp.utils cimport (mpz_set_pyint, mpq_set_pyints, mpz_get_pyintlong,
+        mpz_get_bytes, mpq_get_bytes, mpq_pythonhash)
 
 from libcpp.string cimport string
 
+from fractions import Fraction
+
+include "auto_rational.pxi"
+
 from .defs cimport pm_Integer
 from .integer cimport Integer
+from .operands cimport integer_operand
 
 cdef extern from "<sstream>" namespace "std":
     cdef cppclass ostringstream:
@@ -27,6 +33,15 @@ cdef extern from "<sstream>" namespace "std":
 cdef extern from "wrap.h" namespace "polymake":
     void pm_Rational_repr "WRAP_wrap_OUT" (ostringstream, pm_Rational)
 
+    void pm_Rational_iadd "WRAP_IADD" (pm_Rational, pm_Rational)
+    void pm_Rational_iadd_Integer "WRAP_IADD" (pm_Rational, pm_Integer)
+    void pm_Rational_isub "WRAP_ISUB" (pm_Rational, pm_Rational)
+    void pm_Rational_isub_Integer "WRAP_ISUB" (pm_Rational, pm_Integer)
+    void pm_Rational_imul "WRAP_IMUL" (pm_Rational, pm_Rational)
+    void pm_Rational_imul_Integer "WRAP_IMUL" (pm_Rational, pm_Integer)
+    void pm_Rational_idiv "WRAP_IDIV" (pm_Rational, pm_Rational)
+    void pm_Rational_idiv_Integer "WRAP_IDIV" (pm_Rational, pm_Integer)
+
 def get_num_den(elt):
     num = None
     den = None
@@ -52,29 +67,54 @@ cdef class Rational(object):
     r"""Polymake rational
     """
     def __init__(self, num, den=None):
+        # the value is written directly in the GMP rational of pm_obj
+        cdef mpq_ptr q = <mpq_ptr> self.pm_obj.get_rep()
         if den is None:
+            if type(num) is int or type(num) is long:
+                mpz_set_pyint(mpq_numref(q), num)
+                mpz_set_ui(mpq_denref(q), 1)
+                return
+            elif type(num) is Fraction:
+                # already in canonical form
+                mpz_set_pyint(mpq_numref(q), num.numerator)
+                mpz_set_pyint(mpq_denref(q), num.denominator)
+                return
+            elif type(num) is Rational:
+                mpq_set(q, (<Rational> num).pm_obj.get_rep())
+                return
+            elif type(num) is Integer:
+                mpz_set(mpq_numref(q), <mpz_srcptr> (<Integer> num).pm_obj.get_rep())
+                mpz_set_ui(mpq_denref(q), 1)
+                return
             num, den = get_num_den(num)
 
-        if not den:
-            raise ValueError("denominator must not be zero")
+        if not isinstance(num, (int, long)) or not isinstance(den, (int, long)):
+            raise ValueError("Polymake rational can only be initialized from Python int and long")
+        mpq_set_pyints(q, num, den)
 
-        cdef mpq_t z
-        mpq_init(z)
-        if isinstance(num, int):
-            mpz_set_si(mpq_numref(z), <int>num)
-        elif isinstance(num, long):
-            mpz_set_pylong(mpq_numref(z), num)
-        else:
-            raise ValueError("Polymake integer can only be initialized from Python int and long")
-        if isinstance(den, int):
-            mpz_set_si(mpq_denref(z), <int>den)
-        elif isinstance(num, long):
-            mpz_set_pylong(mpq_denref(z), den)
+    @staticmethod
+    def from_pairs(nums, dens):
+        r"""
+        Return the list of rationals ``nums[i] / dens[i]``
+
+        INPUT:
 
-        mpq_canonicalize(z)
-        self.pm_obj.set_mpq_srcptr(<mpq_srcptr>z)
-        mpq_clear(z)
+        - ``nums``, ``dens`` -- sequences of Python integers of the same length
 
+        >>> import polymake
+        >>> polymake.Rational.from_pairs([1, 2, -3], [2, 4, 5])
+        [1/2, 1/2, -3/5]
+        """
+        if len(nums) != len(dens):
+            raise ValueError("nums and dens must have the same length")
+        cdef list ans = [None] * len(nums)
+        cdef Rational r
+        cdef Py_ssize_t i
+        for i in range(len(ans)):
+            r = Rational.__new__(Rational)
+            mpq_set_pyints(<mpq_ptr> r.pm_obj.get_rep(), nums[i], dens[i])
+            ans[i] = r
+        return ans
     def sage(self):
         r"""Converts rational to Sage
 
@@ -104,13 +144,15 @@ cdef class Rational(object):
         >>> c = polymake.Rational(12, 5)
         """
         from fractions import Fraction
-        return Fraction(self.numerator().python(), self.denominator().python())
+        cdef mpq_srcptr z = self.pm_obj.get_rep()
+        return Fraction(mpz_get_pyintlong(mpq_numref(z)), mpz_get_pyintlong(mpq_denref(z)))
 
     def __nonzero__(self):
         return not self.pm_obj.is_zero()
 
     def __richcmp__(self, other, op):
         cdef int c
+        cdef pm_Integer t
 
         if type(self) is type(other):
             c = (<Rational>self).pm_obj.compare((<Rational>other).pm_obj)
@@ -118,10 +160,12 @@ cdef class Rational(object):
             c = (<Rational>other).pm_obj.compare((<Integer>self).pm_obj)
         elif isinstance(other, Integer):
             c = (<Rational>self).pm_obj.compare((<Integer>other).pm_obj)
-        elif isinstance(self, int):
-            c = (<Rational>other).pm_obj.compare(<long>self)
-        elif isinstance(other, int):
-            c = (<Rational>self).pm_obj.compare(<long>other)
+        elif isinstance(self, (int, long)):
+            integer_operand(t, self)
+            c = (<Rational>other).pm_obj.compare(t)
+        elif isinstance(other, (int, long)):
+            integer_operand(t, other)
+            c = (<Rational>self).pm_obj.compare(t)
         else:
            return NotImplemented
 
@@ -137,6 +181,20 @@ cdef class Rational(object):
         pm_Rational_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
 
+    def __reduce__(self):
+        return (from_plain_Rational, (to_plain_Rational(self),))
+
+    def __hash__(self):
+        r"""
+        >>> import polymake
+        >>> from fractions import Fraction
+        >>> hash(polymake.Rational(-3, 7)) == hash(Fraction(-3, 7))
+        True
+        >>> hash(polymake.Rational(4, 1)) == hash(4)
+        True
+        """
+        return mpq_pythonhash(self.pm_obj.get_rep())
+
     def numerator(self):
         cdef Integer ans = Integer.__new__(Integer)
         cdef mpq_srcptr z = self.pm_obj.get_rep()
@@ -151,48 +209,57 @@ cdef class Rational(object):
 
     def __add__(self, other):
         cdef Rational ans = Rational.__new__(Rational)
+        cdef pm_Integer t
         if type(self) is type(other):
             ans.pm_obj = (<Rational>self).pm_obj + (<Rational>other).pm_obj
         elif type(self) is Integer:
             ans.pm_obj = (<Rational>other).pm_obj + (<Integer>self).pm_obj
         elif type(other) is Integer:
             ans.pm_obj = (<Rational>self).pm_obj + (<Integer>other).pm_obj
-        elif isinstance(self, int):
-            ans.pm_obj = (<Rational>other).pm_obj + <long>self
-        elif isinstance(other, int):
-            ans.pm_obj = (<Rational>self).pm_obj + <long>other
+        elif isinstance(self, (int, long)):
+            integer_operand(t, self)
+            ans.pm_obj = (<Rational>other).pm_obj + t
+        elif isinstance(other, (int, long)):
+            integer_operand(t, other)
+            ans.pm_obj = (<Rational>self).pm_obj + t
         else:
             return NotImplemented
         return ans
 
     def __sub__(self, other):
         cdef Rational ans = Rational.__new__(Rational)
+        cdef pm_Integer t
         if type(self) is type(other):
             ans.pm_obj = (<Rational>self).pm_obj - (<Rational>other).pm_obj
         elif type(self) is Integer:
             ans.pm_obj = -((<Rational>other).pm_obj - (<Integer>self).pm_obj)
         elif type(other) is Integer:
             ans.pm_obj = (<Rational>self).pm_obj - (<Integer>other).pm_obj
-        elif isinstance(self, int):
-            ans.pm_obj = -((<Rational>other).pm_obj - <long>self)
-        elif isinstance(other, int):
-            ans.pm_obj = (<Rational>self).pm_obj - <long>other
+        elif isinstance(self, (int, long)):
+            integer_operand(t, self)
+            ans.pm_obj = -((<Rational>other).pm_obj - t)
+        elif isinstance(other, (int, long)):
+            integer_operand(t, other)
+            ans.pm_obj = (<Rational>self).pm_obj - t
         else:
             return NotImplemented
         return ans
 
     def __mul__(self, other):
         cdef Rational ans = Rational.__new__(Rational)
+        cdef pm_Integer t
         if type(self) is type(other):
             ans.pm_obj = (<Rational>self).pm_obj * (<Rational>other).pm_obj
         elif type(self) is Integer:
             ans.pm_obj = (<Rational>other).pm_obj * (<Integer>self).pm_obj
         elif type(other) is Integer:
             ans.pm_obj = (<Rational>self).pm_obj * (<Integer>other).pm_obj
-        elif isinstance(self, int):
-            ans.pm_obj = (<Rational>other).pm_obj * <long>self
-        elif isinstance(other, int):
-            ans.pm_obj = (<Rational>self).pm_obj * <long>other
+        elif isinstance(self, (int, long)):
+            integer_operand(t, self)
+            ans.pm_obj = (<Rational>other).pm_obj * t
+        elif isinstance(other, (int, long)):
+            integer_operand(t, other)
+            ans.pm_obj = (<Rational>self).pm_obj * t
         else:
             return NotImplemented
         return ans
@@ -203,12 +270,14 @@ cdef class Rational(object):
             raise ZeroDivisionError("polymake.number.Rational division by zero")
 
         cdef Rational ans = Rational.__new__(Rational)
+        cdef pm_Integer t
         if type(self) is type(other):
             ans.pm_obj = (<Rational>self).pm_obj / (<Rational>other).pm_obj
         elif type(other) is Integer:
             ans.pm_obj = (<Rational>self).pm_obj / (<Integer>other).pm_obj
-        elif isinstance(other, int):
-            ans.pm_obj = (<Rational>self).pm_obj / <long>other
+        elif isinstance(other, (int, long)):
+            integer_operand(t, other)
+            ans.pm_obj = (<Rational>self).pm_obj / t
         else:
             if not type(self) is Rational:
                 try:
@@ -221,3 +290,91 @@ cdef class Rational(object):
     def __div__(self, other):
         return self.__truediv__(other)
 
+    # As for Integer, ``a += b`` builds a new Rational and the methods below
+    # are the explicit in-place API. They modify ``self``, seen through every
+    # reference to it, and must not be used on a Rational that serves as a
+    # dictionary key or set element.
+
+    def iadd(self, other):
+        r"""
+        Add ``other`` to this rational in place
+
+        >>> import polymake
+        >>> a = polymake.Rational(1, 2)
+        >>> b = a
+        >>> a.iadd(polymake.Rational(1, 3))
+        >>> a, b
+        (5/6, 5/6)
+        >>> c = polymake.Rational(1, 2)
+        >>> d = c
+        >>> c += 1
+        >>> c, d
+        (3/2, 1/2)
+        """
+        cdef pm_Integer t
+        if type(other) is Rational:
+            pm_Rational_iadd(self.pm_obj, (<Rational>other).pm_obj)
+        elif type(other) is Integer:
+            pm_Rational_iadd_Integer(self.pm_obj, (<Integer>other).pm_obj)
+        else:
+            integer_operand(t, other)
+            pm_Rational_iadd_Integer(self.pm_obj, t)
+
+    def isub(self, other):
+        r"""
+        Subtract ``other`` from this rational in place
+
+        >>> import polymake
+        >>> a = polymake.Rational(1, 2)
+        >>> a.isub(2**70)
+        >>> a
+        -2361183241434822606847/2
+        """
+        cdef pm_Integer t
+        if type(other) is Rational:
+            pm_Rational_isub(self.pm_obj, (<Rational>other).pm_obj)
+        elif type(other) is Integer:
+            pm_Rational_isub_Integer(self.pm_obj, (<Integer>other).pm_obj)
+        else:
+            integer_operand(t, other)
+            pm_Rational_isub_Integer(self.pm_obj, t)
+
+    def imul(self, other):
+        r"""
+        Multiply this rational by ``other`` in place
+
+        >>> import polymake
+        >>> a = polymake.Rational(1, 6)
+        >>> a.imul(4)
+        >>> a
+        2/3
+        """
+        cdef pm_Integer t
+        if type(other) is Rational:
+            pm_Rational_imul(self.pm_obj, (<Rational>other).pm_obj)
+        elif type(other) is Integer:
+            pm_Rational_imul_Integer(self.pm_obj, (<Integer>other).pm_obj)
+        else:
+            integer_operand(t, other)
+            pm_Rational_imul_Integer(self.pm_obj, t)
+
+    def idiv(self, other):
+        r"""
+        Divide this rational by ``other`` in place
+
+        >>> import polymake
+        >>> a = polymake.Rational(2, 3)
+        >>> a.idiv(polymake.Rational(4, 5))
+        >>> a
+        5/6
+        """
+        cdef pm_Integer t
+        if not other:
+            raise ZeroDivisionError("polymake.number.Rational division by zero")
+        if type(other) is Rational:
+            pm_Rational_idiv(self.pm_obj, (<Rational>other).pm_obj)
+        elif type(other) is Integer:
+            pm_Rational_idiv_Integer(self.pm_obj, (<Integer>other).pm_obj)
+        else:
+            integer_operand(t, other)
+            pm_Rational_idiv_Integer(self.pm_obj, t)
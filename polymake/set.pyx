@@ -31,6 +31,9 @@ cdef class SetInt(object):
         cdef ostringstream out
         pm_SetInt_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
+
+    def __reduce__(self):
+        return (from_plain_SetInt, (to_plain_SetInt(self),))
     def __iter__(self):
         cdef pm_SetInt_iterator it = entire_SetInt(self.pm_obj)
         while not it.at_end():
@@ -0,0 +1,196 @@
+r"""
+Catalogue of the functions of the polymake applications
+
+Querying perl for the functions of each application and for their arguments
+(see :func:`polymake.main.functions_in_current_application` and
+:func:`polymake.main.arguments`) is slow. The catalogue built by
+:func:`signatures` is stored on disk and reused by the next sessions (and by
+worker processes) as long as the polymake version, the user settings (which
+determine the loaded extensions) and the included rule files are the same.
+
+The cache directory is ``$POLYMAKE_SIGNATURE_CACHE`` if set and
+``$XDG_CACHE_HOME/pypolymake`` (or ``~/.cache/pypolymake``) otherwise.
+
+EXAMPLES:
+
+>>> import polymake
+>>> from polymake.signatures import signatures, functions_in_application
+>>> s = signatures()
+>>> 'cube' in s['polytope']
+True
+>>> 'cube' in functions_in_application('polytope')
+True
+"""
+###############################################################################
+#       Copyright (C) 2016      Vincent Delecroix <vincent.delecroix@labri.fr>
+#  Distributed under the terms of the GNU General Public License (GPL),
+#  version 3 or any later version.  The full text of the GPL is available at:
+#                  http://www.gnu.org/licenses/
+###############################################################################
+
+from __future__ import absolute_import
+
+import hashlib
+import json
+import os
+import tempfile
+
+# catalogues already loaded in this process (cache key -> catalogue)
+_loaded = {}
+
+def cache_directory():
+    r"""
+    Return the directory where the catalogues are stored
+    """
+    path = os.environ.get("POLYMAKE_SIGNATURE_CACHE")
+    if path:
+        return path
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "pypolymake")
+
+def _settings_files(user_settings):
+    r"""
+    Return the files read by polymake for the user settings ``user_settings``
+    (see :func:`polymake.main.init`)
+
+    The special settings starting with ``@`` (such as ``@interactive``) use
+    the files of the polymake user directory.
+    """
+    if not user_settings.startswith(b"@"):
+        return [user_settings.decode('utf-8')]
+    directory = os.environ.get("POLYMAKE_USER_DIR") or os.path.join(os.path.expanduser("~"), ".polymake")
+    return [os.path.join(directory, name) for name in ("customize.pl", "prefer.pl", "settings")]
+
+def cache_key():
+    r"""
+    Return the key identifying the catalogue of the running polymake
+
+    It depends on the version of polymake, on the user settings (the content
+    of the settings files, that list the extensions to load), on the
+    applications loaded at initialization and on the included rule files.
+    """
+    from .main import version, rules, settings
+    h = hashlib.sha1(version())
+    user_settings, apps = settings()
+    for x in [user_settings] + apps:
+        h.update(b"\0")
+        h.update(x)
+    for filename in _settings_files(user_settings):
+        h.update(b"\0")
+        h.update(filename.encode('utf-8'))
+        try:
+            with open(filename, 'rb') as f:
+                h.update(b"\1")
+                h.update(f.read())
+        except (IOError, OSError):
+            pass
+    for r in rules():
+        h.update(b"\0")
+        h.update(r)
+    return h.hexdigest()
+
+def _decode(x):
+    if isinstance(x, bytes):
+        return x.decode('utf-8')
+    elif isinstance(x, (list, tuple)):
+        return [_decode(y) for y in x]
+    return x
+
+def _build():
+    r"""
+    Query perl for the catalogue of all applications
+
+    The whole loop runs as a single request of the polymake thread, so that
+    no other request can switch the current application in the meantime.
+    """
+    from .main import run_in_polymake_thread
+    return run_in_polymake_thread(_query_all)
+
+def _query_all():
+    from .main import (applications, arguments, functions_in_current_application,
+            pm_get_application, pm_set_application)
+    ans = {}
+    current = pm_get_application()
+    try:
+        for app in applications():
+            pm_set_application(app)
+            functions = ans[app.decode('ascii')] = {}
+            for f in functions_in_current_application():
+                if not isinstance(f, bytes):
+                    f = f.encode('ascii')
+                functions[_decode(f)] = _decode(arguments(f))
+    finally:
+        pm_set_application(current)
+    return ans
+
+def signatures(refresh=False):
+    r"""
+    Return the catalogue of functions as a dictionary app -> function name ->
+    list of signatures (each signature is a list of pairs ``[name, type]``)
+
+    INPUT:
+
+    - ``refresh`` -- if ``True``, query perl again and rewrite the cache
+    """
+    key = cache_key()
+    if not refresh:
+        try:
+            return _loaded[key]
+        except KeyError:
+            pass
+
+    filename = os.path.join(cache_directory(), "signatures-{}.json".format(key))
+    catalogue = None
+    if not refresh:
+        try:
+            with open(filename) as f:
+                catalogue = json.load(f)
+        except (IOError, OSError, ValueError):
+            catalogue = None
+
+    if catalogue is None:
+        catalogue = _build()
+        try:
+            directory = cache_directory()
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(catalogue, f)
+            os.rename(tmp, filename)
+        except (IOError, OSError):
+            # no writable cache directory: keep the catalogue in memory only
+            pass
+
+    _loaded[key] = catalogue
+    return catalogue
+
+def functions_in_application(app):
+    r"""
+    Return the sorted list of functions of the application ``app``
+    """
+    if isinstance(app, bytes):
+        app = app.decode('ascii')
+    return sorted(signatures()[app])
+
+def function_signatures(app, name):
+    r"""
+    Return the list of signatures of the function ``name`` of ``app``
+    """
+    if isinstance(app, bytes):
+        app = app.decode('ascii')
+    if isinstance(name, bytes):
+        name = name.decode('ascii')
+    return signatures()[app][name]
+
+def clear_signature_cache():
+    r"""
+    Remove the catalogues stored on disk and in memory
+    """
+    _loaded.clear()
+    directory = cache_directory()
+    if not os.path.isdir(directory):
+        return
+    for f in os.listdir(directory):
+        if f.startswith("signatures-") and f.endswith(".json"):
+            os.remove(os.path.join(directory, f))
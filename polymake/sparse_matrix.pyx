@@ -10,15 +10,38 @@
 
 from libcpp.string cimport string
 
-from .defs cimport pm_Integer, pm_Rational
+include "auto_sparse_matrix.pxi"
+
+from cpython cimport array
+import array
+
+from libc.stdint cimport int64_t
+from libc.stdlib cimport malloc, free
+
+from .cygmp.types cimport mpq_srcptr
+from .cygmp.mpz cimport mpz_cmp_ui, mpz_fits_slong_p, mpz_get_si
+from .cygmp.mpq cimport mpq_numref, mpq_denref, mpq_get_d
+from .cygmp.utils cimport mpz_get_pyintlong
+
+from .defs cimport pm_Integer, pm_Rational, pm_VectorInt, pm_VectorRational
 
 from .integer cimport Integer
 from .rational cimport Rational
+from .vector cimport VectorInt, VectorRational
+
+from .indexing cimport is_entry_index, entry_index
+from .views import matrix_getitem, iter_rows
+
+cdef extern from "wrap.h" namespace "polymake":
+    # const access to the entries (no copy, see wrap.h)
+    long pm_SparseMatrixIntNonSymmetric_get "pm_sparse_get" (pm_SparseMatrixIntNonSymmetric, int i, int j)
+    const pm_Rational& pm_SparseMatrixRationalNonSymmetric_get "pm_sparse_get" (pm_SparseMatrixRationalNonSymmetric, int i, int j)
 
-cdef extern from "polymake/SparseMatrix.h" namespace "polymake":
-    # WRAP_CALL(t,i,j) -> t(i,j)
-    long pm_SparseMatrixIntNonSymmetric_get "WRAP_CALL" (pm_SparseMatrixIntNonSymmetric, int i, int j)
-    pm_Rational pm_SparseMatrixRationalNonSymmetric_get "WRAP_CALL" (pm_SparseMatrixRationalNonSymmetric, int i, int j)
+    # nonzero entries of rows
+    int pm_SparseMatrixIntNonSymmetric_row_size "pm_sparse_row_size" (pm_SparseMatrixIntNonSymmetric, int i)
+    int pm_SparseMatrixIntNonSymmetric_row_nonzeros "pm_sparse_row_nonzeros" (pm_SparseMatrixIntNonSymmetric, int i, int * cols, const int ** values)
+    int pm_SparseMatrixRationalNonSymmetric_row_size "pm_sparse_row_size" (pm_SparseMatrixRationalNonSymmetric, int i)
+    int pm_SparseMatrixRationalNonSymmetric_row_nonzeros "pm_sparse_row_nonzeros" (pm_SparseMatrixRationalNonSymmetric, int i, int * cols, const pm_Rational ** values)
 
 cdef extern from "<sstream>" namespace "std":
     cdef cppclass ostringstream:
@@ -28,20 +51,53 @@ cdef extern from "wrap.h" namespace "polymake":
     void pm_SparseMatrixIntNonSymmetric_repr "WRAP_wrap_OUT" (ostringstream, pm_SparseMatrixIntNonSymmetric)
     void pm_SparseMatrixRationalNonSymmetric_repr "WRAP_wrap_OUT" (ostringstream, pm_SparseMatrixRationalNonSymmetric)
 
+    # rows and columns as dense vectors, minors (see wrap.h and polymake.views)
+    pm_VectorInt pm_SparseMatrixIntNonSymmetric_row "pm_row<Vector<int> >" (pm_SparseMatrixIntNonSymmetric, int)
+    pm_VectorInt pm_SparseMatrixIntNonSymmetric_col "pm_col<Vector<int> >" (pm_SparseMatrixIntNonSymmetric, int)
+    pm_SparseMatrixIntNonSymmetric pm_SparseMatrixIntNonSymmetric_minor "pm_minor" (pm_SparseMatrixIntNonSymmetric, const int *, int, const int *, int)
+    pm_VectorRational pm_SparseMatrixRationalNonSymmetric_row "pm_row<Vector<Rational> >" (pm_SparseMatrixRationalNonSymmetric, int)
+    pm_VectorRational pm_SparseMatrixRationalNonSymmetric_col "pm_col<Vector<Rational> >" (pm_SparseMatrixRationalNonSymmetric, int)
+    pm_SparseMatrixRationalNonSymmetric pm_SparseMatrixRationalNonSymmetric_minor "pm_minor" (pm_SparseMatrixRationalNonSymmetric, const int *, int, const int *, int)
+
+# kinds of values of the exported arrays (see to_coo)
+cdef enum:
+    VALUES_INT64
+    VALUES_FLOAT64
+    VALUES_OBJECT
+
+cdef int values_kind(dtype) except -1:
+    import numpy
+    kind = numpy.dtype(dtype).kind
+    if kind in 'iu':
+        return VALUES_INT64
+    elif kind == 'f':
+        return VALUES_FLOAT64
+    elif kind == 'O':
+        return VALUES_OBJECT
+    raise ValueError("dtype must be an integer, float or object type")
+
+cdef values_array(Py_ssize_t n, int kind):
+    import numpy
+    if kind == VALUES_INT64:
+        return numpy.empty(n, dtype=numpy.int64)
+    elif kind == VALUES_FLOAT64:
+        return numpy.empty(n, dtype=numpy.float64)
+    return numpy.empty(n, dtype=object)
+
 cdef class SparseMatrixIntNonSymmetric(object):
     def __repr__(self):
         cdef ostringstream out
         pm_SparseMatrixIntNonSymmetric_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
 
-    def __getitem__(self, elt):
-        cdef Py_ssize_t nrows, ncols, i,j
-        nrows = self.pm_obj.rows()
-        ncols = self.pm_obj.cols()
-        i,j = elt
-        if not (0 <= i < nrows) or not (0 <= j < ncols):
-            raise IndexError("matrix index out of range")
+    def __reduce__(self):
+        return (from_plain_SparseMatrixIntNonSymmetric, (to_plain_SparseMatrixIntNonSymmetric(self),))
 
+    def __getitem__(self, elt):
+        if not is_entry_index(elt):
+            return matrix_getitem(self, elt)
+        cdef Py_ssize_t i, j
+        entry_index(elt, self.pm_obj.rows(), self.pm_obj.cols(), &i, &j)
         return pm_SparseMatrixIntNonSymmetric_get(self.pm_obj, i, j)
 
     def rows(self):
@@ -49,24 +105,112 @@ cdef class SparseMatrixIntNonSymmetric(object):
     def cols(self):
         return self.pm_obj.cols()
 
+    def nnz(self):
+        r"""
+        Return the number of nonzero entries
+        """
+        cdef Py_ssize_t i, n = 0
+        for i in range(self.pm_obj.rows()):
+            n += pm_SparseMatrixIntNonSymmetric_row_size(self.pm_obj, i)
+        return n
+
+    def nonzeros(self):
+        r"""
+        Iterate through the nonzero entries as triples ``(i, j, value)``
+        (ordered by rows and columns)
+        """
+        cdef int i, k, n
+        cdef int * cols = <int *> malloc(max(self.pm_obj.cols(), 1) * sizeof(int))
+        cdef const int ** values = <const int **> malloc(max(self.pm_obj.cols(), 1) * sizeof(int *))
+        if cols == NULL or values == NULL:
+            free(cols)
+            free(values)
+            raise MemoryError
+        try:
+            for i in range(self.pm_obj.rows()):
+                n = pm_SparseMatrixIntNonSymmetric_row_nonzeros(self.pm_obj, i, cols, values)
+                for k in range(n):
+                    value = values[k][0]
+                    yield (i, cols[k], value)
+        finally:
+            free(cols)
+            free(values)
+
+    def to_coo(self, dtype='int64'):
+        r"""
+        Return the nonzero entries as NumPy arrays ``(data, row, col)``
+
+        The result can be given to ``scipy.sparse.coo_matrix((data, (row, col)),
+        shape=(m.rows(), m.cols()))``.
+
+        INPUT:
+
+        - ``dtype`` -- the type of ``data``: an integer type (values as
+          int64), a float type (float64) or ``object``
+        """
+        import numpy
+        cdef int kind = values_kind(dtype)
+        cdef Py_ssize_t nnz = self.nnz()
+        row = numpy.empty(nnz, dtype=numpy.int64)
+        col = numpy.empty(nnz, dtype=numpy.int64)
+        data = values_array(nnz, kind)
+        fill_SparseMatrixIntNonSymmetric(self, row, None, col, data, kind)
+        return (data, row, col)
+
+    def to_csr(self, dtype='int64'):
+        r"""
+        Return the nonzero entries in compressed sparse row format as NumPy
+        arrays ``(data, indices, indptr)``
+
+        The result can be given to ``scipy.sparse.csr_matrix((data, indices,
+        indptr), shape=(m.rows(), m.cols()))``. See :meth:`to_coo` for
+        ``dtype``.
+        """
+        import numpy
+        cdef int kind = values_kind(dtype)
+        cdef Py_ssize_t nnz = self.nnz()
+        indptr = numpy.empty(self.pm_obj.rows() + 1, dtype=numpy.int64)
+        indices = numpy.empty(nnz, dtype=numpy.int64)
+        data = values_array(nnz, kind)
+        fill_SparseMatrixIntNonSymmetric(self, None, indptr, indices, data, kind)
+        return (data, indices, indptr)
+
+    def __iter__(self):
+        return iter_rows(self)
+
+    def _row(self, int i):
+        cdef VectorInt ans = VectorInt.__new__(VectorInt)
+        ans.pm_obj = pm_SparseMatrixIntNonSymmetric_row(self.pm_obj, i)
+        return ans
+
+    def _col(self, int j):
+        cdef VectorInt ans = VectorInt.__new__(VectorInt)
+        ans.pm_obj = pm_SparseMatrixIntNonSymmetric_col(self.pm_obj, j)
+        return ans
+
+    def _minor(self, rows, cols):
+        cdef array.array r = array.array('i', rows)
+        cdef array.array c = array.array('i', cols)
+        cdef SparseMatrixIntNonSymmetric ans = SparseMatrixIntNonSymmetric.__new__(SparseMatrixIntNonSymmetric)
+        ans.pm_obj = pm_SparseMatrixIntNonSymmetric_minor(self.pm_obj, r.data.as_ints, len(r), c.data.as_ints, len(c))
+        return ans
+
 cdef class SparseMatrixRationalNonSymmetric(object):
     def __repr__(self):
         cdef ostringstream out
         pm_SparseMatrixRationalNonSymmetric_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
 
-    def __getitem__(self, elt):
-        cdef Py_ssize_t nrows, ncols, i,j
-        nrows = self.pm_obj.rows()
-        ncols = self.pm_obj.cols()
-        i,j = elt
-        if not (0 <= i < nrows) or not (0 <= j < ncols):
-            raise IndexError("matrix index out of range")
-
+    def __reduce__(self):
+        return (from_plain_SparseMatrixRationalNonSymmetric, (to_plain_SparseMatrixRationalNonSymmetric(self),))
 
+    def __getitem__(self, elt):
+        if not is_entry_index(elt):
+            return matrix_getitem(self, elt)
+        cdef Py_ssize_t i, j
+        entry_index(elt, self.pm_obj.rows(), self.pm_obj.cols(), &i, &j)
         cdef Rational ans = Rational.__new__(Rational)
-        cdef pm_Rational q = pm_SparseMatrixRationalNonSymmetric_get(self.pm_obj, i, j)
-        ans.pm_obj.set_mpq_srcptr(q.get_rep())
+        ans.pm_obj.set_mpq_srcptr(pm_SparseMatrixRationalNonSymmetric_get(self.pm_obj, i, j).get_rep())
         return ans
 
     def rows(self):
@@ -74,4 +218,212 @@ cdef class SparseMatrixRationalNonSymmetric(object):
     def cols(self):
         return self.pm_obj.cols()
 
+    def nnz(self):
+        r"""
+        Return the number of nonzero entries
+        """
+        cdef Py_ssize_t i, n = 0
+        for i in range(self.pm_obj.rows()):
+            n += pm_SparseMatrixRationalNonSymmetric_row_size(self.pm_obj, i)
+        return n
+
+    def nonzeros(self):
+        r"""
+        Iterate through the nonzero entries as triples ``(i, j, value)``
+        (ordered by rows and columns)
+
+        >>> import polymake
+        >>> e = polymake.associahedron(3).COCIRCUIT_EQUATIONS
+        >>> all(e[i, j] == x and x != 0 for i, j, x in e.nonzeros())
+        True
+        >>> sum(1 for _ in e.nonzeros()) == e.nnz()
+        True
+        """
+        cdef int i, k, n
+        cdef int * cols = <int *> malloc(max(self.pm_obj.cols(), 1) * sizeof(int))
+        cdef const pm_Rational ** values = <const pm_Rational **> malloc(max(self.pm_obj.cols(), 1) * sizeof(pm_Rational *))
+        if cols == NULL or values == NULL:
+            free(cols)
+            free(values)
+            raise MemoryError
+        try:
+            for i in range(self.pm_obj.rows()):
+                n = pm_SparseMatrixRationalNonSymmetric_row_nonzeros(self.pm_obj, i, cols, values)
+                for k in range(n):
+                    value = Rational.__new__(Rational)
+                    (<Rational> value).pm_obj.set_mpq_srcptr(values[k].get_rep())
+                    yield (i, cols[k], value)
+        finally:
+            free(cols)
+            free(values)
+
+    def to_coo(self, dtype=float):
+        r"""
+        Return the nonzero entries as NumPy arrays ``(data, row, col)``
+
+        The result can be given to ``scipy.sparse.coo_matrix((data, (row, col)),
+        shape=(m.rows(), m.cols()))``.
+
+        INPUT:
+
+        - ``dtype`` -- the type of ``data``: an integer type (values as
+          int64), a float type (float64) or ``object``
+
+        >>> import polymake
+        >>> from scipy.sparse import coo_matrix
+        >>> e = polymake.associahedron(3).COCIRCUIT_EQUATIONS
+        >>> data, row, col = e.to_coo()
+        >>> s = coo_matrix((data, (row, col)), shape=(e.rows(), e.cols()))
+        >>> s.nnz == e.nnz()
+        True
+        """
+        import numpy
+        cdef int kind = values_kind(dtype)
+        cdef Py_ssize_t nnz = self.nnz()
+        row = numpy.empty(nnz, dtype=numpy.int64)
+        col = numpy.empty(nnz, dtype=numpy.int64)
+        data = values_array(nnz, kind)
+        fill_SparseMatrixRationalNonSymmetric(self, row, None, col, data, kind)
+        return (data, row, col)
+
+    def to_csr(self, dtype=float):
+        r"""
+        Return the nonzero entries in compressed sparse row format as NumPy
+        arrays ``(data, indices, indptr)``
+
+        The result can be given to ``scipy.sparse.csr_matrix((data, indices,
+        indptr), shape=(m.rows(), m.cols()))``. See :meth:`to_coo` for
+        ``dtype``.
+
+        >>> import polymake
+        >>> from scipy.sparse import csr_matrix
+        >>> e = polymake.associahedron(3).COCIRCUIT_EQUATIONS
+        >>> data, indices, indptr = e.to_csr()
+        >>> s = csr_matrix((data, indices, indptr), shape=(e.rows(), e.cols()))
+        >>> s.shape == (e.rows(), e.cols())
+        True
+        """
+        import numpy
+        cdef int kind = values_kind(dtype)
+        cdef Py_ssize_t nnz = self.nnz()
+        indptr = numpy.empty(self.pm_obj.rows() + 1, dtype=numpy.int64)
+        indices = numpy.empty(nnz, dtype=numpy.int64)
+        data = values_array(nnz, kind)
+        fill_SparseMatrixRationalNonSymmetric(self, None, indptr, indices, data, kind)
+        return (data, indices, indptr)
+
+    def __iter__(self):
+        return iter_rows(self)
+
+    def _row(self, int i):
+        cdef VectorRational ans = VectorRational.__new__(VectorRational)
+        ans.pm_obj = pm_SparseMatrixRationalNonSymmetric_row(self.pm_obj, i)
+        return ans
+
+    def _col(self, int j):
+        cdef VectorRational ans = VectorRational.__new__(VectorRational)
+        ans.pm_obj = pm_SparseMatrixRationalNonSymmetric_col(self.pm_obj, j)
+        return ans
+
+    def _minor(self, rows, cols):
+        cdef array.array r = array.array('i', rows)
+        cdef array.array c = array.array('i', cols)
+        cdef SparseMatrixRationalNonSymmetric ans = SparseMatrixRationalNonSymmetric.__new__(SparseMatrixRationalNonSymmetric)
+        ans.pm_obj = pm_SparseMatrixRationalNonSymmetric_minor(self.pm_obj, r.data.as_ints, len(r), c.data.as_ints, len(c))
+        return ans
+
+cdef int fill_SparseMatrixIntNonSymmetric(SparseMatrixIntNonSymmetric m,
+        int64_t[:] row, int64_t[:] indptr, int64_t[:] col, data, int kind) except -1:
+    r"""
+    Fill the arrays of :meth:`SparseMatrixIntNonSymmetric.to_coo` (if ``row``
+    is not ``None``) or :meth:`SparseMatrixIntNonSymmetric.to_csr` (if
+    ``indptr`` is not ``None``)
+    """
+    cdef int i, k, n
+    cdef Py_ssize_t pos = 0
+    cdef int64_t[:] vi
+    cdef double[:] vf
+    if kind == VALUES_INT64:
+        vi = data
+    elif kind == VALUES_FLOAT64:
+        vf = data
+    cdef int * cols = <int *> malloc(max(m.pm_obj.cols(), 1) * sizeof(int))
+    cdef const int ** values = <const int **> malloc(max(m.pm_obj.cols(), 1) * sizeof(int *))
+    if cols == NULL or values == NULL:
+        free(cols)
+        free(values)
+        raise MemoryError
+    try:
+        for i in range(m.pm_obj.rows()):
+            if indptr is not None:
+                indptr[i] = pos
+            n = pm_SparseMatrixIntNonSymmetric_row_nonzeros(m.pm_obj, i, cols, values)
+            for k in range(n):
+                if row is not None:
+                    row[pos] = i
+                col[pos] = cols[k]
+                if kind == VALUES_INT64:
+                    vi[pos] = values[k][0]
+                elif kind == VALUES_FLOAT64:
+                    vf[pos] = values[k][0]
+                else:
+                    data[pos] = values[k][0]
+                pos += 1
+        if indptr is not None:
+            indptr[m.pm_obj.rows()] = pos
+    finally:
+        free(cols)
+        free(values)
+    return 0
+
+cdef int fill_SparseMatrixRationalNonSymmetric(SparseMatrixRationalNonSymmetric m,
+        int64_t[:] row, int64_t[:] indptr, int64_t[:] col, data, int kind) except -1:
+    r"""
+    Fill the arrays of :meth:`SparseMatrixRationalNonSymmetric.to_coo` (if
+    ``row`` is not ``None``) or :meth:`SparseMatrixRationalNonSymmetric.to_csr`
+    (if ``indptr`` is not ``None``)
 
+    Integer values must be integers that fit in int64 and object values are
+    Python fractions.
+    """
+    from fractions import Fraction
+    cdef int i, k, n
+    cdef Py_ssize_t pos = 0
+    cdef mpq_srcptr q
+    cdef int64_t[:] vi
+    cdef double[:] vf
+    if kind == VALUES_INT64:
+        vi = data
+    elif kind == VALUES_FLOAT64:
+        vf = data
+    cdef int * cols = <int *> malloc(max(m.pm_obj.cols(), 1) * sizeof(int))
+    cdef const pm_Rational ** values = <const pm_Rational **> malloc(max(m.pm_obj.cols(), 1) * sizeof(pm_Rational *))
+    if cols == NULL or values == NULL:
+        free(cols)
+        free(values)
+        raise MemoryError
+    try:
+        for i in range(m.pm_obj.rows()):
+            if indptr is not None:
+                indptr[i] = pos
+            n = pm_SparseMatrixRationalNonSymmetric_row_nonzeros(m.pm_obj, i, cols, values)
+            for k in range(n):
+                if row is not None:
+                    row[pos] = i
+                col[pos] = cols[k]
+                q = values[k].get_rep()
+                if kind == VALUES_INT64:
+                    if mpz_cmp_ui(mpq_denref(q), 1) or not mpz_fits_slong_p(mpq_numref(q)):
+                        raise ValueError("entry ({}, {}) is not an int64".format(i, cols[k]))
+                    vi[pos] = mpz_get_si(mpq_numref(q))
+                elif kind == VALUES_FLOAT64:
+                    vf[pos] = mpq_get_d(q)
+                else:
+                    data[pos] = Fraction(mpz_get_pyintlong(mpq_numref(q)), mpz_get_pyintlong(mpq_denref(q)))
+                pos += 1
+        if indptr is not None:
+            indptr[m.pm_obj.rows()] = pos
+    finally:
+        free(cols)
+        free(values)
+    return 0
@@ -10,17 +10,130 @@
 
 from .integer cimport Integer
 from .rational cimport Rational
+from .buffer cimport fill_buffer, release_buffer, pm_VectorInt_data, pm_VectorFloat_data
+from .defs cimport pm_Integer, pm_Rational
 
 from libcpp.string cimport string
 
+include "auto_vector.pxi"
+
 cdef extern from "<sstream>" namespace "std":
     cdef cppclass ostringstream:
         string str()
 
 cdef extern from "wrap.h" namespace "polymake":
+    void pm_VectorInt_repr "WRAP_wrap_OUT" (ostringstream, pm_VectorInt)
+    void pm_VectorFloat_repr "WRAP_wrap_OUT" (ostringstream, pm_VectorFloat)
     void pm_VectorInteger_repr "WRAP_wrap_OUT" (ostringstream, pm_VectorInteger)
     void pm_VectorRational_repr "WRAP_wrap_OUT" (ostringstream, pm_VectorRational)
 
+    # arithmetic (see wrap.h)
+    pm_VectorInteger pm_VectorInteger_add "pm_add" (pm_VectorInteger, pm_VectorInteger) except +ValueError
+    pm_VectorInteger pm_VectorInteger_sub "pm_sub" (pm_VectorInteger, pm_VectorInteger) except +ValueError
+    pm_VectorInteger pm_VectorInteger_neg "pm_neg" (pm_VectorInteger)
+    pm_VectorInteger pm_VectorInteger_scale "pm_scale" (pm_VectorInteger, pm_Integer)
+    pm_Integer pm_VectorInteger_dot "pm_dot" (pm_VectorInteger, pm_VectorInteger) except +ValueError
+
+    pm_VectorRational pm_VectorRational_add "pm_add" (pm_VectorRational, pm_VectorRational) except +ValueError
+    pm_VectorRational pm_VectorRational_sub "pm_sub" (pm_VectorRational, pm_VectorRational) except +ValueError
+    pm_VectorRational pm_VectorRational_neg "pm_neg" (pm_VectorRational)
+    pm_VectorRational pm_VectorRational_scale "pm_scale" (pm_VectorRational, pm_Rational)
+    pm_Rational pm_VectorRational_dot "pm_dot" (pm_VectorRational, pm_VectorRational) except +ValueError
+
+cdef Integer as_integer(x):
+    r"""
+    Return ``x`` as an :class:`Integer` (or ``None`` if ``x`` is not an integer)
+    """
+    if type(x) is Integer:
+        return <Integer> x
+    elif isinstance(x, (int, long)):
+        return Integer(x)
+    return None
+
+cdef Rational as_rational(x):
+    r"""
+    Return ``x`` as a :class:`Rational` (or ``None`` if ``x`` is not a
+    rational number)
+    """
+    if type(x) is Rational:
+        return <Rational> x
+    elif isinstance(x, (int, long, Integer)) or hasattr(x, 'denominator'):
+        return Rational(x)
+    return None
+
+cdef int check_same_size(int n, int m) except -1:
+    if n != m:
+        raise ValueError("vectors of different sizes ({} and {})".format(n, m))
+    return 0
+
+cdef class VectorInt(object):
+    def __len__(self):
+        return self.pm_obj.size()
+
+    def __getitem__(self, _i):
+        cdef Py_ssize_t size = self.pm_obj.size()
+        cdef Py_ssize_t i = <Py_ssize_t?> _i
+
+        if not (0 <= i < size):
+            raise IndexError("integer vector out of range")
+
+        return self.pm_obj.get(i)
+
+    def __repr__(self):
+        cdef ostringstream out
+        pm_VectorInt_repr(out, self.pm_obj)
+        return (<bytes>out.str()).decode('ascii')
+
+    def __reduce__(self):
+        return (from_plain_VectorInt, (to_plain_VectorInt(self),))
+
+    def __getbuffer__(self, Py_buffer * buffer, int flags):
+        r"""
+        Read-only buffer on the entries of the vector (no copy)
+        """
+        fill_buffer(buffer, self, pm_VectorInt_data(self.pm_obj), 1,
+                self.pm_obj.size(), 0, sizeof(int), b'i', flags)
+
+    def __releasebuffer__(self, Py_buffer * buffer):
+        release_buffer(buffer)
+
+    def python(self):
+        return [x for x in self]
+
+cdef class VectorFloat(object):
+    def __len__(self):
+        return self.pm_obj.size()
+
+    def __getitem__(self, _i):
+        cdef Py_ssize_t size = self.pm_obj.size()
+        cdef Py_ssize_t i = <Py_ssize_t?> _i
+
+        if not (0 <= i < size):
+            raise IndexError("float vector out of range")
+
+        return self.pm_obj.get(i)
+
+    def __repr__(self):
+        cdef ostringstream out
+        pm_VectorFloat_repr(out, self.pm_obj)
+        return (<bytes>out.str()).decode('ascii')
+
+    def __reduce__(self):
+        return (from_plain_VectorFloat, (to_plain_VectorFloat(self),))
+
+    def __getbuffer__(self, Py_buffer * buffer, int flags):
+        r"""
+        Read-only buffer on the entries of the vector (no copy)
+        """
+        fill_buffer(buffer, self, pm_VectorFloat_data(self.pm_obj), 1,
+                self.pm_obj.size(), 0, sizeof(float), b'f', flags)
+
+    def __releasebuffer__(self, Py_buffer * buffer):
+        release_buffer(buffer)
+
+    def python(self):
+        return [x for x in self]
+
 cdef class VectorInteger(object):
     def __len__(self):
         return self.pm_obj.size()
@@ -41,9 +154,78 @@ cdef class VectorInteger(object):
         pm_VectorInteger_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
 
+    def __reduce__(self):
+        return (from_plain_VectorInteger, (to_plain_VectorInteger(self),))
+
     def python(self):
         return [x.python() for x in self]
 
+    def __neg__(self):
+        cdef VectorInteger ans = VectorInteger.__new__(VectorInteger)
+        ans.pm_obj = pm_VectorInteger_neg(self.pm_obj)
+        return ans
+
+    def __add__(self, other):
+        r"""
+        >>> import polymake
+        >>> v = polymake.cube(3).F_VECTOR
+        >>> v + v
+        16 24 12
+        """
+        if type(self) is not type(other):
+            return NotImplemented
+        check_same_size((<VectorInteger> self).pm_obj.size(), (<VectorInteger> other).pm_obj.size())
+        cdef VectorInteger ans = VectorInteger.__new__(VectorInteger)
+        ans.pm_obj = pm_VectorInteger_add((<VectorInteger> self).pm_obj, (<VectorInteger> other).pm_obj)
+        return ans
+
+    def __sub__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+        check_same_size((<VectorInteger> self).pm_obj.size(), (<VectorInteger> other).pm_obj.size())
+        cdef VectorInteger ans = VectorInteger.__new__(VectorInteger)
+        ans.pm_obj = pm_VectorInteger_sub((<VectorInteger> self).pm_obj, (<VectorInteger> other).pm_obj)
+        return ans
+
+    def __mul__(self, other):
+        r"""
+        Multiplication by an integer
+
+        >>> import polymake
+        >>> v = polymake.cube(3).F_VECTOR
+        >>> 2 * v
+        16 24 12
+        """
+        cdef VectorInteger v
+        cdef Integer x
+        if type(self) is VectorInteger:
+            v = <VectorInteger> self
+            x = as_integer(other)
+        else:
+            v = <VectorInteger> other
+            x = as_integer(self)
+        if x is None:
+            return NotImplemented
+        cdef VectorInteger ans = VectorInteger.__new__(VectorInteger)
+        ans.pm_obj = pm_VectorInteger_scale(v.pm_obj, x.pm_obj)
+        return ans
+
+    def __matmul__(self, other):
+        r"""
+        Scalar product
+
+        >>> import polymake
+        >>> v = polymake.cube(3).F_VECTOR
+        >>> v @ v
+        244
+        """
+        if type(self) is not type(other):
+            return NotImplemented
+        check_same_size((<VectorInteger> self).pm_obj.size(), (<VectorInteger> other).pm_obj.size())
+        cdef Integer ans = Integer.__new__(Integer)
+        ans.pm_obj = pm_VectorInteger_dot((<VectorInteger> self).pm_obj, (<VectorInteger> other).pm_obj)
+        return ans
+
     def sage(self):
         r"""
         Convert to a Sage integer vector
@@ -80,9 +262,80 @@ cdef class VectorRational(object):
         pm_VectorRational_repr(out, self.pm_obj)
         return (<bytes>out.str()).decode('ascii')
 
+    def __reduce__(self):
+        return (from_plain_VectorRational, (to_plain_VectorRational(self),))
+
     def python(self):
         return [x.python() for x in self]
 
+    def __neg__(self):
+        cdef VectorRational ans = VectorRational.__new__(VectorRational)
+        ans.pm_obj = pm_VectorRational_neg(self.pm_obj)
+        return ans
+
+    def __add__(self, other):
+        r"""
+        >>> import polymake
+        >>> v = polymake.cube(3).CENTROID
+        >>> v + v
+        2 0 0 0
+        """
+        if type(self) is not type(other):
+            return NotImplemented
+        check_same_size((<VectorRational> self).pm_obj.size(), (<VectorRational> other).pm_obj.size())
+        cdef VectorRational ans = VectorRational.__new__(VectorRational)
+        ans.pm_obj = pm_VectorRational_add((<VectorRational> self).pm_obj, (<VectorRational> other).pm_obj)
+        return ans
+
+    def __sub__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+        check_same_size((<VectorRational> self).pm_obj.size(), (<VectorRational> other).pm_obj.size())
+        cdef VectorRational ans = VectorRational.__new__(VectorRational)
+        ans.pm_obj = pm_VectorRational_sub((<VectorRational> self).pm_obj, (<VectorRational> other).pm_obj)
+        return ans
+
+    def __mul__(self, other):
+        r"""
+        Multiplication by a rational number (or an integer)
+
+        >>> import polymake
+        >>> from fractions import Fraction
+        >>> v = polymake.cube(3).CENTROID
+        >>> v * Fraction(1, 3)
+        1/3 0 0 0
+        """
+        cdef VectorRational v
+        cdef Rational x
+        if type(self) is VectorRational:
+            v = <VectorRational> self
+            x = as_rational(other)
+        else:
+            v = <VectorRational> other
+            x = as_rational(self)
+        if x is None:
+            return NotImplemented
+        cdef VectorRational ans = VectorRational.__new__(VectorRational)
+        ans.pm_obj = pm_VectorRational_scale(v.pm_obj, x.pm_obj)
+        return ans
+
+    def __matmul__(self, other):
+        r"""
+        Scalar product (or product with a matrix, see
+        :meth:`polymake.matrix.MatrixRational.__matmul__`)
+
+        >>> import polymake
+        >>> v = polymake.cube(3).CENTROID
+        >>> v @ v
+        1
+        """
+        if type(self) is not type(other):
+            return NotImplemented
+        check_same_size((<VectorRational> self).pm_obj.size(), (<VectorRational> other).pm_obj.size())
+        cdef Rational ans = Rational.__new__(Rational)
+        ans.pm_obj = pm_VectorRational_dot((<VectorRational> self).pm_obj, (<VectorRational> other).pm_obj)
+        return ans
+
     def sage(self):
         r"""
         Convert to a Sage rational vector
@@ -0,0 +1,261 @@
+r"""
+Views on rows, columns and minors of matrices
+
+Indexing a matrix with anything else than a pair of integers returns a view:
+``m[i]`` (or ``m[i, :]``) is the row ``i``, ``m[:, j]`` the column ``j`` and
+``m[rows, cols]`` (where ``rows`` and ``cols`` are slices or sequences of
+indices) a minor. A view only stores the matrix it comes from and the
+selected indices. Single entries are read from the matrix on demand while
+iteration and :meth:`python` first copy the selected entries to a polymake
+vector, set or matrix (see :meth:`copy`) in one pass.
+
+EXAMPLES:
+
+>>> import polymake
+>>> m = polymake.cube(3).VERTICES
+>>> m[2]
+1 -1 1 -1
+>>> m[2][3]
+-1
+>>> m[:, 1].copy()
+-1 1 -1 1 -1 1 -1 1
+>>> m[1:3, [0, 2]]
+1 -1
+1 1
+>>> [len(r) for r in m]
+[4, 4, 4, 4, 4, 4, 4, 4]
+
+>>> f = polymake.cube(3).VERTICES_IN_FACETS
+>>> f.row(0)
+{0 2 4 6}
+"""
+###############################################################################
+#       Copyright (C) 2016      Vincent Delecroix <vincent.delecroix@labri.fr>
+#  Distributed under the terms of the GNU General Public License (GPL),
+#  version 3 or any later version.  The full text of the GPL is available at:
+#                  http://www.gnu.org/licenses/
+###############################################################################
+
+from __future__ import absolute_import
+
+import operator
+
+from .set import SetInt
+
+def _index(i, n):
+    r"""
+    Return the (non-negative) index ``i`` in a range of length ``n``
+    """
+    if i < 0:
+        i += n
+    if not (0 <= i < n):
+        raise IndexError("matrix index out of range")
+    return i
+
+def _indices(key, n):
+    r"""
+    Return an index or the list of indices selected by ``key`` in a range of
+    length ``n``
+    """
+    if isinstance(key, slice):
+        return list(range(*key.indices(n)))
+    try:
+        i = operator.index(key)
+    except TypeError:
+        return [_index(operator.index(k), n) for k in key]
+    return _index(i, n)
+
+def _select(key, indices):
+    r"""
+    Compose the selection ``key`` with the list of ``indices``
+    """
+    sub = _indices(key, len(indices))
+    if isinstance(sub, list):
+        return [indices[k] for k in sub]
+    return indices[sub]
+
+def matrix_getitem(m, key):
+    r"""
+    Implementation of ``m[key]`` for the keys that are not pairs of integers
+    """
+    if isinstance(key, tuple):
+        if len(key) != 2:
+            raise IndexError("matrices have two indices")
+        r, c = key
+    else:
+        r = key
+        c = slice(None)
+    rows = _indices(r, m.rows())
+    cols = _indices(c, m.cols())
+    if isinstance(cols, list) and len(cols) == m.cols() and cols == list(range(m.cols())):
+        cols = None
+    if isinstance(rows, list) and len(rows) == m.rows() and rows == list(range(m.rows())):
+        rows = None
+
+    if isinstance(rows, int):
+        if isinstance(cols, int):
+            return m[rows, cols]
+        return RowView(m, rows, cols)
+    elif isinstance(cols, int):
+        return ColumnView(m, cols, rows)
+    return MinorView(m, rows, cols)
+
+def _line_entries(line, n):
+    r"""
+    Return the ``n`` entries of ``line``, a copy of a row or column (a
+    polymake vector, or the set of the nonzero indices for incidence matrices)
+    """
+    if isinstance(line, SetInt):
+        nonzero = set(line)
+        return [k in nonzero for k in range(n)]
+    return list(line)
+
+def iter_rows(m):
+    r"""
+    Iterate through the rows of ``m`` (as :class:`RowView`)
+    """
+    for i in range(m.rows()):
+        yield RowView(m, i)
+
+class _LineView(object):
+    r"""
+    Common code of :class:`RowView` and :class:`ColumnView`
+    """
+    __slots__ = ("matrix", "index", "indices")
+
+    def __init__(self, matrix, index, indices=None):
+        self.matrix = matrix
+        self.index = index
+        self.indices = indices
+
+    def __len__(self):
+        if self.indices is None:
+            return self._full_length()
+        return len(self.indices)
+
+    def __getitem__(self, k):
+        if self.indices is None:
+            k = _indices(k, self._full_length())
+        else:
+            k = _select(k, self.indices)
+        if isinstance(k, list):
+            if not k:
+                return []
+            return type(self)(self.matrix, self.index, k)._entries()
+        return self._entry(k)
+
+    def __iter__(self):
+        return iter(self._entries())
+
+    def __repr__(self):
+        return repr(self.copy())
+
+    def _entries(self):
+        r"""
+        Return the list of the entries (as given by indexing the matrix)
+        """
+        return _line_entries(self.copy(), len(self))
+
+    def python(self):
+        r"""
+        Return the entries as Python objects (see :meth:`copy`)
+        """
+        line = self.copy()
+        if isinstance(line, SetInt):
+            return _line_entries(line, len(self))
+        return line.python()
+
+class RowView(_LineView):
+    r"""
+    View on a row of a matrix (or on some of its entries)
+    """
+    __slots__ = ()
+
+    def _full_length(self):
+        return self.matrix.cols()
+
+    def _entry(self, j):
+        return self.matrix[self.index, j]
+
+    def copy(self):
+        r"""
+        Return the row as a polymake vector (or as a set for incidence matrices)
+        """
+        if self.indices is None:
+            return self.matrix._row(self.index)
+        return self.matrix._minor([self.index], self.indices)._row(0)
+
+class ColumnView(_LineView):
+    r"""
+    View on a column of a matrix (or on some of its entries)
+    """
+    __slots__ = ()
+
+    def _full_length(self):
+        return self.matrix.rows()
+
+    def _entry(self, i):
+        return self.matrix[i, self.index]
+
+    def copy(self):
+        r"""
+        Return the column as a polymake vector (or as a set for incidence matrices)
+        """
+        if self.indices is None:
+            return self.matrix._col(self.index)
+        return self.matrix._minor(self.indices, [self.index])._col(0)
+
+class MinorView(object):
+    r"""
+    View on the minor of a matrix made of some rows and columns
+
+    ``row_indices`` and ``col_indices`` are lists of indices (``None`` for
+    all rows or all columns).
+    """
+    __slots__ = ("matrix", "row_indices", "col_indices")
+
+    def __init__(self, matrix, row_indices=None, col_indices=None):
+        self.matrix = matrix
+        self.row_indices = row_indices
+        self.col_indices = col_indices
+
+    def rows(self):
+        return self.matrix.rows() if self.row_indices is None else len(self.row_indices)
+
+    def cols(self):
+        return self.matrix.cols() if self.col_indices is None else len(self.col_indices)
+
+    def _all_rows(self):
+        return list(range(self.matrix.rows())) if self.row_indices is None else self.row_indices
+
+    def _all_cols(self):
+        return list(range(self.matrix.cols())) if self.col_indices is None else self.col_indices
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            if len(key) != 2:
+                raise IndexError("matrices have two indices")
+            r, c = key
+        else:
+            r = key
+            c = slice(None)
+        return matrix_getitem(self.matrix, (_select(r, self._all_rows()), _select(c, self._all_cols())))
+
+    def __iter__(self):
+        for i in self._all_rows():
+            yield RowView(self.matrix, i, self.col_indices)
+
+    def __repr__(self):
+        return repr(self.copy())
+
+    def copy(self):
+        r"""
+        Return the minor as a polymake matrix
+        """
+        return self.matrix._minor(self._all_rows(), self._all_cols())
+
+    def python(self):
+        r"""
+        Return the entries as a list of lists of Python objects (see :meth:`copy`)
+        """
+        return self.copy().python()
@@ -6,6 +6,17 @@
 #include <polymake/Matrix.h>
 #include <polymake/Rational.h>
 #include <polymake/Map.h>
+#include <polymake/Vector.h>
+#include <polymake/Array.h>
+#include <polymake/Set.h>
+#include <polymake/IncidenceMatrix.h>
+#include <polymake/SparseMatrix.h>
+#include <polymake/linalg.h>
+#include <polymake/PlainParser.h>
+
+#include <sstream>
+#include <string>
+#include <vector>
 
 
 #define WRAP_OUT(x,y) x << y
@@ -19,7 +30,172 @@
 #define CALL_METHOD(ans, obj, prop) (obj)->call_method(prop) >> ans
 #define WRAP_CALL(t, i, j) t(i,j)
 
+/* in-place arithmetic (Cython does not support operator+= and friends) */
+#define WRAP_IADD(x,y) x += y
+#define WRAP_ISUB(x,y) x -= y
+#define WRAP_IMUL(x,y) x *= y
+#define WRAP_IDIV(x,y) x /= y
+
 /* this should not be needed... however Cython gets mad if not there */
 using namespace polymake;
 
+/* pointer to the contiguous storage of dense matrices and vectors         */
+/* (NULL if empty). The const access avoids a copy of shared storage.      */
+template <typename E>
+inline const E* pm_matrix_data(const Matrix<E>& m)
+{
+   return m.rows() * m.cols() ? &*concat_rows(m).begin() : NULL;
+}
+
+/* mutable version (divorces the storage if shared) */
+template <typename E>
+inline E* pm_matrix_mutable_data(Matrix<E>& m)
+{
+   return m.rows() * m.cols() ? &*concat_rows(m).begin() : NULL;
+}
+
+template <typename E>
+inline const E* pm_vector_data(const Vector<E>& v)
+{
+   return v.size() ? &*v.begin() : NULL;
+}
+
+/* read x from its plain text representation (i.e. the output of wrap(out) << x) */
+template <typename T>
+inline void pm_parse(T& x, const std::string& s)
+{
+   std::istringstream is(s);
+   PlainParser<> parser(is);
+   parser >> x;
+}
+
+/* rows, columns and minors of matrices (see polymake/views.py) as dense  */
+/* vectors (or sets for incidence matrices) and matrices                   */
+template <typename V, typename M>
+inline V pm_row(const M& m, int i) { return V(m.row(i)); }
+
+template <typename V, typename M>
+inline V pm_col(const M& m, int j) { return V(m.col(j)); }
+
+template <typename M>
+inline M pm_minor(const M& m, const int* rows, int nrows, const int* cols, int ncols)
+{
+   return M(m.minor(Array<int>(nrows, rows), Array<int>(ncols, cols)));
+}
+
+/* entries of sparse matrices (see sparse_matrix.pyx)                      */
+/* the const access does not create any element and returns a reference   */
+/* (to a static zero for the implicit entries)                            */
+template <typename E, typename Sym>
+inline const E& pm_sparse_get(const SparseMatrix<E, Sym>& m, int i, int j) { return m(i, j); }
+
+template <typename E, typename Sym>
+inline int pm_sparse_row_size(const SparseMatrix<E, Sym>& m, int i) { return m.row(i).size(); }
+
+/* fill cols and values with the column indices and the addresses of the   */
+/* nonzero entries of row i (the addresses are valid as long as the matrix */
+/* is not modified) and return their number                                */
+template <typename E, typename Sym>
+inline int pm_sparse_row_nonzeros(const SparseMatrix<E, Sym>& m, int i, int* cols, const E** values)
+{
+   int k = 0;
+   for (auto it = entire(m.row(i)); !it.at_end(); ++it, ++k) {
+      cols[k] = it.index();
+      values[k] = &*it;
+   }
+   return k;
+}
+
+/* arithmetic of vectors and matrices                                     */
+/* polymake operators return lazy expressions: they are evaluated here in  */
+/* the dense type of the first operand. The operands are wrapped with wary */
+/* so that dimension mismatches are raised as C++ exceptions.              */
+template <typename T>
+inline T pm_add(const T& a, const T& b) { return T(wary(a) + b); }
+
+template <typename T>
+inline T pm_sub(const T& a, const T& b) { return T(wary(a) - b); }
+
+template <typename T>
+inline T pm_neg(const T& a) { return T(-a); }
+
+template <typename T, typename E>
+inline T pm_scale(const T& a, const E& x) { return T(a * x); }
+
+template <typename E>
+inline E pm_dot(const Vector<E>& a, const Vector<E>& b) { return wary(a) * b; }
+
+template <typename E>
+inline Matrix<E> pm_matrix_product(const Matrix<E>& a, const Matrix<E>& b) { return Matrix<E>(wary(a) * b); }
+
+template <typename E>
+inline Vector<E> pm_matrix_vector_product(const Matrix<E>& a, const Vector<E>& v) { return Vector<E>(wary(a) * v); }
+
+template <typename E>
+inline Vector<E> pm_vector_matrix_product(const Vector<E>& v, const Matrix<E>& a) { return Vector<E>(wary(v) * a); }
+
+template <typename E>
+inline Matrix<E> pm_transpose(const Matrix<E>& m) { return Matrix<E>(T(m)); }
+
+template <typename E>
+inline int pm_rank(const Matrix<E>& m) { return rank(m); }
+
+template <typename E>
+inline E pm_det(const Matrix<E>& m) { return det(wary(m)); }
+
+template <typename E>
+inline Matrix<E> pm_null_space(const Matrix<E>& m) { return Matrix<E>(null_space(m)); }
+
+template <typename E>
+inline Vector<E> pm_lin_solve(const Matrix<E>& m, const Vector<E>& b) { return lin_solve(wary(m), wary(b)); }
+
+/* computation of several properties of obj in a single run of the rule   */
+/* scheduler (the perl method provide). The values are then read with      */
+/* GIVE without any further computation.                                   */
+inline void pm_provide(perl::Object* obj, const std::vector<std::string>& props)
+{
+   perl::FunCall fc(true, "provide", props.size() + 1);
+   fc << *obj;
+   for (const std::string& p : props) fc << p;
+   fc.void_evaluate();
+}
+
+/* computation of the property prop of obj (see handlers.pyx)              */
+inline void pm_provide(perl::Object* obj, const std::string& prop)
+{
+   perl::FunCall fc(true, "provide", 2);
+   fc << *obj << prop;
+   fc.void_evaluate();
+}
+
+/* call of a polymake function with arguments of arbitrary types (see     */
+/* call_polymake_function in perl_object.pyx). The arguments are pushed on */
+/* the perl stack one by one and the options are gathered in an OptionSet  */
+/* that is passed last.                                                    */
+class pm_FunctionCall {
+   perl::FunCall fc;
+   perl::OptionSet options;
+   bool with_options;
+public:
+   pm_FunctionCall(const std::string& name) : fc(false, name, 0), with_options(false) {}
+
+   template <typename T>
+   void push(const T& x) { fc << x; }
+
+   template <typename T>
+   void option(const std::string& key, const T& x)
+   {
+      options[key] << x;
+      with_options = true;
+   }
+
+   perl::Object call()
+   {
+      if (with_options) fc << options;
+      perl::Object ans;
+      perl::Value(fc.call_scalar_context()) >> ans;
+      return ans;
+   }
+};
+
 #endif
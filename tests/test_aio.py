@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+
+import polymake
+import unittest
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
+@unittest.skipIf(asyncio is None, "asyncio not available")
+class TestPolymakeAsyncio(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_agive(self):
+        c = polymake.cube(3)
+        self.assertEqual(self.loop.run_until_complete(c.agive("N_FACETS")), 6)
+        self.assertEqual(self.loop.run_until_complete(c.agive("N_VERTICES", timeout=60)), 8)
+        with self.assertRaises(AttributeError):
+            self.loop.run_until_complete(c.agive("NOT_A_PROPERTY"))
+
+    def test_acall(self):
+        c = self.loop.run_until_complete(polymake.acall("cube", 4))
+        self.assertEqual(c.N_VERTICES, 16)
+        c = self.loop.run_until_complete(polymake.acall("cross", 3, timeout=60))
+        self.assertEqual(c.N_VERTICES, 6)
+        # raw polymake function with options
+        c1 = self.loop.run_until_complete(polymake.acall("rand_box", 3, 10, 5, seed=1, app="polytope"))
+        c2 = self.loop.run_until_complete(polymake.acall("rand_box", 3, 10, 5, seed=1))
+        self.assertEqual(c1.POINTS.python(), c2.POINTS.python())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import polymake
+from polymake.columnar import write_columns, ColumnStore, OVERFLOW
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+@unittest.skipIf(numpy is None, "numpy not available")
+class TestPolymakeColumnar(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_round_trip(self):
+        path = os.path.join(self.tmpdir, "cubes")
+        cubes = [polymake.cube(d) for d in range(2, 6)]
+        n = write_columns(path, iter(cubes), ["N_VERTICES", "SIMPLE", "F_VECTOR", "VOLUME", "VERTEX_BARYCENTER"])
+        self.assertEqual(n, 4)
+
+        store = ColumnStore(path)
+        self.assertEqual(store.nrows, 4)
+        self.assertEqual(list(store["N_VERTICES"]), [2**d for d in range(2, 6)])
+        self.assertEqual(list(store["SIMPLE"]), [1, 1, 1, 1])
+        vol = store["VOLUME"]
+        self.assertEqual(list(vol.num), [2**d for d in range(2, 6)])
+        self.assertEqual(list(vol.den), [1, 1, 1, 1])
+        fv = store["F_VECTOR"]
+        for i, c in enumerate(cubes):
+            self.assertEqual(list(fv.row(i)), c.F_VECTOR.python())
+        num, den = store["VERTEX_BARYCENTER"].row(0)
+        self.assertEqual(list(num), [1, 0, 0])
+        self.assertEqual(store.overflow("N_VERTICES"), {})
+
+if __name__ == '__main__':
+    unittest.main()
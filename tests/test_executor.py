@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+
+import polymake
+import threading
+import unittest
+
+from polymake.executor import PolymakeExecutor
+
+class TestPolymakeExecutor(unittest.TestCase):
+    def test_futures(self):
+        ex = PolymakeExecutor()
+        c = ex.call("cube", 3).result()
+        futures = [ex.give(c, name) for name in ["N_VERTICES", "N_FACETS", b"N_EDGES"]]
+        self.assertEqual([f.result() for f in futures], [8, 6, 12])
+        with self.assertRaises(AttributeError):
+            ex.give(c, "NOT_A_PROPERTY").result()
+        ex.shutdown()
+        with self.assertRaises(RuntimeError):
+            ex.give(c, "N_VERTICES")
+
+    def test_polymake_thread(self):
+        from polymake.handlers import give_int
+        from polymake.main import run_in_polymake_thread
+        name = run_in_polymake_thread(lambda: threading.current_thread().name)
+        self.assertEqual(name, "polymake")
+        c = polymake.cube(3)
+        # perl can not be accessed from another thread
+        with self.assertRaises(RuntimeError):
+            give_int(c, b"N_VERTICES")
+        self.assertEqual(run_in_polymake_thread(give_int, c, b"N_VERTICES"), 8)
+
+    def test_cached_getattr(self):
+        from polymake.main import submit_to_polymake_thread
+        c = polymake.cube(3)
+        c.N_VERTICES
+        with self.assertRaises(AttributeError):
+            c.NOT_A_PROPERTY
+        # the caches are read without waiting for the (busy) polymake thread
+        busy = threading.Event()
+        f = submit_to_polymake_thread(busy.wait, 10)
+        try:
+            self.assertEqual(c.N_VERTICES, 8)
+            with self.assertRaises(AttributeError):
+                c.NOT_A_PROPERTY
+            self.assertFalse(f.done())
+        finally:
+            busy.set()
+            f.result()
+
+    def test_threads(self):
+        results = {}
+        def work(d):
+            results[d] = polymake.cube(d).N_FACETS
+        threads = [threading.Thread(target=work, args=(d,)) for d in range(2, 7)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(results, {d: 2*d for d in range(2, 7)})
+
+if __name__ == '__main__':
+    unittest.main()
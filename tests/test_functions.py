@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+import polymake
+import unittest
+from fractions import Fraction
+
+from polymake.perl_object import call_polymake_function
+
+class TestPolymakeFunctions(unittest.TestCase):
+    def test_arguments(self):
+        self.assertEqual(polymake.birkhoff(3).N_VERTICES, 6)
+        self.assertEqual(polymake.birkhoff(3, True).N_VERTICES, 3)
+        v = polymake.delpezzo(2, Fraction(1,3)).VERTICES
+        self.assertEqual(v[0,1], Fraction(1,3))
+        v = polymake.cube(2, polymake.Rational(3,2), 0).VERTICES
+        self.assertEqual(v[3,1], Fraction(3,2))
+        self.assertEqual(polymake.cube(2, 2**70, 0).VERTICES[3,1], 2**70)
+
+    def test_options(self):
+        v = polymake.cyclic(2, 4, start=3).VERTICES
+        self.assertEqual(v[0,1], 3)
+        p = polymake.cyclic(2, 5, spherical=True)
+        self.assertEqual(p.N_VERTICES, 5)
+
+    def test_objects(self):
+        c = polymake.cube(3)
+        p = call_polymake_function(b"polytope", b"pyramid", c)
+        self.assertEqual(p.N_VERTICES, 9)
+        with self.assertRaises(TypeError):
+            call_polymake_function(b"polytope", b"cube", object())
+
+    def test_sequences(self):
+        c = polymake.cube(2)
+        # list of rows -> matrix, list of numbers -> vector
+        self.assertEqual(call_polymake_function(b"polytope", b"zonotope", [[1,1,0], [1,0,1]]).N_VERTICES, 4)
+        v = call_polymake_function(b"polytope", b"translate", c, [2, Fraction(1,2)]).VERTICES
+        self.assertEqual((v[0,1], v[0,2]), (1, Fraction(-1,2)))
+        # Python set -> set
+        t = call_polymake_function(b"polytope", b"truncation", polymake.cube(3), {0})
+        self.assertEqual(t.N_VERTICES, 10)
+        with self.assertRaises(TypeError):
+            call_polymake_function(b"polytope", b"translate", c, [[[1]]])
+
+    def test_arrays(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("numpy not available")
+        c = polymake.cube(2)
+        # the conversion depends on the dimension of each array
+        self.assertEqual(call_polymake_function(b"polytope", b"zonotope", numpy.array([[1,1,0], [1,0,1]])).N_VERTICES, 4)
+        v = call_polymake_function(b"polytope", b"translate", c, numpy.array([2, 3])).VERTICES
+        self.assertEqual((v[0,1], v[0,2]), (1, 2))
+
+    def test_numpy_scalars(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("numpy not available")
+        # scalars have ndim 0 and are passed as numbers (twice to check the
+        # cached kind of their type)
+        for _ in range(2):
+            self.assertEqual(polymake.cube(numpy.int64(3)).N_VERTICES, 8)
+            self.assertEqual(polymake.cube(numpy.int32(2), numpy.int64(2), 0).VERTICES[3, 1], 2)
+        with self.assertRaises(TypeError):
+            polymake.cube(numpy.array(3))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+
+import subprocess
+import sys
+import unittest
+
+# run in a fresh interpreter: polymake can only be initialized once
+SCRIPT = """
+import polymake
+from polymake.main import is_initialized, pm_get_application
+assert not is_initialized()
+polymake.init(apps=["fan", "polytope"])
+assert is_initialized()
+assert pm_get_application() == b"fan"
+try:
+    polymake.init()
+except RuntimeError:
+    pass
+else:
+    raise AssertionError("init called twice")
+assert polymake.cube(3).N_VERTICES == 8
+"""
+
+class TestPolymakeInit(unittest.TestCase):
+    def test_lazy_init(self):
+        subprocess.check_call([sys.executable, "-c", SCRIPT])
+
+    def test_invalid(self):
+        import polymake
+        self.assertRaises(ValueError, polymake.init, apps=[])
+        self.assertRaises(ValueError, polymake.init, apps=["nonsense"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,6 +12,14 @@ class TestPolymakeInteger(unittest.TestCase):
         self.assertEqual(bool(polymake.integer.Integer(2)), True)
         self.assertEqual(bool(polymake.integer.Integer(-2)), True)
 
+    def test_init(self):
+        for a in [0, -1, 2**62, 2**64 + 1, -5**40]:
+            self.assertEqual(int(polymake.integer.Integer(a)), a)
+        a = polymake.integer.Integer(2**70)
+        self.assertEqual(polymake.integer.Integer(a), a)
+        with self.assertRaises(ValueError):
+            polymake.integer.Integer("3")
+
     def test_cmp(self):
         a = 2
         b = 3
@@ -55,6 +63,59 @@ class TestPolymakeInteger(unittest.TestCase):
             self.assertEqual(a*pb, polymake.integer.Integer(a*b))
             self.assertEqual(a-pb, polymake.integer.Integer(a-b))
 
+    def test_hash(self):
+        for a in [0, 1, -1, -2, 12, 2**61 - 1, 2**64, -3**70]:
+            pa = polymake.integer.Integer(a)
+            self.assertEqual(hash(pa), hash(a))
+        d = {polymake.integer.Integer(3): 'three'}
+        self.assertEqual(d[3], 'three')
+
+    def test_int(self):
+        for a in [0, -5, 2**63, -2**100]:
+            self.assertEqual(int(polymake.integer.Integer(a)), a)
+        self.assertEqual(list(range(polymake.integer.Integer(3))), [0, 1, 2])
+
+    def test_inplace(self):
+        a = polymake.integer.Integer(5)
+        b = a
+        a += 2
+        a *= polymake.integer.Integer(3)
+        a -= 1
+        self.assertEqual(a, 20)
+        self.assertEqual(b, 5)
+
+        c = polymake.integer.Integer(5)
+        for i in range(10):
+            c += i
+        self.assertEqual(c, 50)
+
+        d = polymake.integer.Integer(5)
+        e = d
+        d.iadd(2)
+        d.imul(polymake.integer.Integer(3))
+        d.isub(2**70)
+        self.assertIs(d, e)
+        self.assertEqual(e, 21 - 2**70)
+        d.idiv(-7)
+        self.assertEqual(d, (2**70 - 21) // 7)
+        with self.assertRaises(ZeroDivisionError):
+            d.idiv(0)
+        with self.assertRaises(TypeError):
+            d.iadd(1.5)
+
+    def test_big_int_operands(self):
+        a = polymake.integer.Integer(3)
+        big = 2**100
+        self.assertEqual(a + big, 3 + big)
+        self.assertEqual(big + a, 3 + big)
+        self.assertEqual(a - big, 3 - big)
+        self.assertEqual(big - a, big - 3)
+        self.assertEqual(a * -big, -3 * big)
+        self.assertEqual(polymake.integer.Integer(big) / 2**98, 4)
+        self.assertLess(a, big)
+        self.assertGreater(big, a)
+        self.assertNotEqual(a, big)
+
     def test_zero_division(self):
         zeros = [0, polymake.integer.Integer(0), polymake.rational.Rational(0)]
         rats = [polymake.integer.Integer(0), polymake.integer.Integer(1)]
@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import polymake
+from polymake.io import open_archive, iter_archive
+
+class TestPolymakeArchive(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_round_trip(self):
+        for name in ["a.pma", "a.pma.gz", "a.pma.bz2"]:
+            path = os.path.join(self.tmpdir, name)
+            with open_archive(path, "w") as archive:
+                archive.extend(polymake.cube(d) for d in range(2, 4))
+            with open_archive(path, "a") as archive:
+                archive.append(polymake.cross(3))
+            self.assertEqual([p.N_VERTICES for p in iter_archive(path)], [4, 8, 6])
+            self.assertEqual([d["N_FACETS"] for d in iter_archive(path, properties=["N_FACETS"])],
+                             [4, 6, 8])
+
+    def test_invalid(self):
+        path = os.path.join(self.tmpdir, "b.pma")
+        with open(path, "wb") as f:
+            f.write(b"not an archive")
+        with self.assertRaises(ValueError):
+            open_archive(path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+
+import polymake
+import unittest
+
+def matmul(a, b):
+    r"""``a @ b`` (the operator is a syntax error in Python 2)"""
+    ans = a.__matmul__(b)
+    if ans is NotImplemented:
+        ans = b.__rmatmul__(a)
+    return ans
+
+class TestPolymakeMatrix(unittest.TestCase):
+    def test_buffer_MatrixInt(self):
+        m = polymake.cube(3).EDGE_ORIENTATION
+        v = memoryview(m)
+        self.assertTrue(v.readonly)
+        self.assertEqual(v.ndim, 2)
+        self.assertEqual(v.shape, (m.rows(), m.cols()))
+        l = v.tolist()
+        for i in range(m.rows()):
+            for j in range(m.cols()):
+                self.assertEqual(l[i][j], m[i,j])
+
+    def test_python_MatrixRational(self):
+        from fractions import Fraction
+        m = polymake.cube(3).VERTEX_NORMALS
+        l = m.python()
+        self.assertEqual(len(l), m.rows())
+        for i in range(m.rows()):
+            self.assertEqual(len(l[i]), m.cols())
+            for j in range(m.cols()):
+                self.assertIsInstance(l[i][j], Fraction)
+                self.assertEqual(l[i][j], m[i,j].python())
+        self.assertEqual(m.tolist(), l)
+
+    def test_python_MatrixInteger(self):
+        m = polymake.cube(3).DEGREE_ONE_GENERATORS
+        l = m.python()
+        for i in range(m.rows()):
+            for j in range(m.cols()):
+                self.assertEqual(l[i][j], m[i,j])
+
+    def test_export_limbs(self):
+        m = polymake.cube(3).VERTEX_NORMALS
+        d = m.export_limbs()
+        self.assertEqual((d['nrows'], d['ncols']), (m.rows(), m.cols()))
+        self.assertIn(d['num_limbs'].typecode, ('L', 'Q'))
+        self.assertEqual(d['num_limbs'].typecode, d['den_limbs'].typecode)
+
+        def limbs_to_int(limbs, start, stop):
+            n = 0
+            for k in reversed(range(start, stop)):
+                n = (n << (8 * limbs.itemsize)) + limbs[k]
+            return n
+
+        l = m.python()
+        for k in range(m.rows() * m.cols()):
+            num = limbs_to_int(d['num_limbs'], d['num_offsets'][k], d['num_offsets'][k+1])
+            den = limbs_to_int(d['den_limbs'], d['den_offsets'][k], d['den_offsets'][k+1])
+            x = l[k // m.cols()][k % m.cols()]
+            self.assertEqual(d['signs'][k] * num, x.numerator)
+            self.assertEqual(den, x.denominator)
+
+        num, den, overflow = m.export_int64()
+        self.assertFalse(overflow)
+        for k in range(m.rows() * m.cols()):
+            x = l[k // m.cols()][k % m.cols()]
+            self.assertEqual((num[k], den[k]), (x.numerator, x.denominator))
+
+    def test_from_numpy(self):
+        from fractions import Fraction
+        from polymake.matrix import MatrixRational, MatrixInteger
+        l = [[1, Fraction(-1,3)], [2**70, Fraction(5, 2**65)]]
+        m = MatrixRational.from_numpy(l)
+        self.assertEqual(m.python(), l)
+        self.assertEqual(MatrixRational.from_numpy([[2, 3]], [[4, 9]]).python(),
+                         [[Fraction(1,2), Fraction(1,3)]])
+        self.assertRaises(ValueError, MatrixRational.from_numpy, [[1]], [[0]])
+        self.assertRaises(ValueError, MatrixRational.from_numpy, [[1], [1, 2]])
+        self.assertEqual(MatrixInteger.from_buffer([[2**70, -1]]).python(), [[2**70, -1]])
+
+        try:
+            import numpy
+        except ImportError:
+            return
+        num = numpy.array([[1, -2, 3], [4, 5, 6]], dtype=numpy.int64)
+        den = numpy.array([[2, 4, 3], [1, 1, 7]], dtype=numpy.int64)
+        m = MatrixRational.from_numpy(num, den)
+        for i in range(2):
+            for j in range(3):
+                self.assertEqual(m[i,j].python(), Fraction(int(num[i,j]), int(den[i,j])))
+        self.assertEqual(MatrixInteger.from_buffer(num).python(), num.tolist())
+
+    def test_arithmetic_MatrixRational(self):
+        from fractions import Fraction
+        m = polymake.cube(3).VERTICES
+        l = m.python()
+        self.assertEqual((m + m).python(), [[2*x for x in row] for row in l])
+        self.assertEqual((m - m).python(), [[0 for x in row] for row in l])
+        self.assertEqual((-m).python(), [[-x for x in row] for row in l])
+        self.assertEqual((m * Fraction(1, 2)).python(), [[x/2 for x in row] for row in l])
+        self.assertEqual((3 * m).python(), [[3*x for x in row] for row in l])
+
+        t = m.transpose()
+        self.assertEqual(t.python(), [list(col) for col in zip(*l)])
+        p = matmul(m, t)
+        self.assertEqual(p.python(),
+                [[sum(a*b for a, b in zip(r1, r2)) for r2 in l] for r1 in l])
+        with self.assertRaises(ValueError):
+            matmul(m, m)
+        with self.assertRaises(ValueError):
+            m + t
+
+        v = polymake.cube(3).CENTROID
+        self.assertEqual(matmul(m, v).python(), [row[0] for row in l])
+        self.assertEqual(matmul(v, t).python(), [1] * 8)
+
+    def test_linalg_MatrixRational(self):
+        m = polymake.cube(3).VERTICES
+        t = m.transpose()
+        self.assertEqual(m.rank(), 4)
+        self.assertEqual(matmul(t, m).det(), 8**4)
+        self.assertEqual(t.null_space().rows(), 4)
+        self.assertEqual(matmul(t, t.null_space().transpose()).rank(), 0)
+        with self.assertRaises(ValueError):
+            m.det()
+
+        b = matmul(m, polymake.cube(3).CENTROID)
+        self.assertEqual(m.solve(b).python(), [1, 0, 0, 0])
+
+if __name__ == '__main__':
+    unittest.main()
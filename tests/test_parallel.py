@@ -0,0 +1,19 @@
+#!/usr/bin/env python
+
+import functools
+import polymake
+import unittest
+
+from polymake.parallel import map_property
+
+class TestPolymakeParallel(unittest.TestCase):
+    def test_map_property(self):
+        objects = [polymake.cube(2), functools.partial(polymake.cube, 3), polymake.cross(3)]
+        res = dict(map_property(objects, ["N_VERTICES", b"F_VECTOR"], workers=2))
+        self.assertEqual(sorted(res), [0, 1, 2])
+        self.assertEqual(res[0]["N_VERTICES"], 4)
+        self.assertEqual(res[1]["F_VECTOR"], [8, 12, 6])
+        self.assertEqual(res[2]["F_VECTOR"], [6, 12, 8])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+
+import pickle
+import polymake
+import unittest
+
+class TestPolymakePickle(unittest.TestCase):
+    def assertRoundTrip(self, x):
+        y = pickle.loads(pickle.dumps(x))
+        self.assertIs(type(y), type(x))
+        self.assertEqual(repr(y), repr(x))
+
+    def test_small_types(self):
+        c = polymake.cube(3)
+        self.assertRoundTrip(polymake.Integer(2**100))
+        self.assertRoundTrip(polymake.Rational(-3, 7))
+        self.assertRoundTrip(c.FACETS)
+        self.assertRoundTrip(c.VERTEX_NORMALS)
+        self.assertRoundTrip(c.DEGREE_ONE_GENERATORS)
+        self.assertRoundTrip(c.EDGE_ORIENTATION)
+        self.assertRoundTrip(c.F_VECTOR)
+        self.assertRoundTrip(c.VERTICES_IN_FACETS)
+
+    def test_perl_object(self):
+        c = polymake.cube(3)
+        c.F_VECTOR
+        data = c.to_bytes()
+        self.assertIn(b"F_VECTOR", data)
+        d = polymake.perl_object.PerlObject.from_bytes(data)
+        self.assertEqual(d.N_VERTICES, 8)
+        d = pickle.loads(pickle.dumps(c))
+        self.assertEqual(d.F_VECTOR.python(), [8, 12, 6])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -225,6 +225,25 @@ class TestPolymakePolytope(unittest.TestCase):
         self.assertFalse(examples.p2().SIMPLICIAL)
         self.assertTrue(examples.p3().SIMPLICIAL)
 
+    def test_give_many(self):
+        c = polymake.cube(3)
+        d = c.give_many([b"N_VERTICES", b"N_FACETS", b"F_VECTOR"])
+        self.assertEqual(sorted(d), [b"F_VECTOR", b"N_FACETS", b"N_VERTICES"])
+        self.assertEqual(d[b"N_VERTICES"], 8)
+        self.assertEqual(d[b"N_FACETS"], 6)
+        self.assertEqual(d[b"F_VECTOR"].python(), [8, 12, 6])
+        with self.assertRaises(AttributeError):
+            c.give_many([b"N_VERTICES", b"NOT_A_PROPERTY"])
+
+    def test_constructor(self):
+        with self.assertRaises(ValueError):
+            polymake.Polytope(NOT_A_PROPERTY=[[1,0]])
+        with self.assertRaises(NotImplementedError):
+            polymake.Polytope(N_VERTICES=3)
+        l = polymake.Polytope.from_many([{'POINTS': [[1,0,0], [1,k,0], [1,0,k]]} for k in range(1,4)])
+        self.assertEqual([p.N_VERTICES for p in l], [3, 3, 3])
+        self.assertEqual([p.VOLUME for p in l], [polymake.Rational(k*k,2) for k in range(1,4)])
+
     def test_F_VECTOR(self):
         self.assertEqual(examples.p1().F_VECTOR.python(), [8, 12, 6])
         self.assertEqual(examples.p2().F_VECTOR.python(), [10, 21, 13])
@@ -16,6 +16,28 @@ class TestPolymakeRational(unittest.TestCase):
         with self.assertRaises(ValueError):
             polymake.rational.Rational(2,0)
 
+    def test_init_types(self):
+        from fractions import Fraction
+        Rational = polymake.rational.Rational
+        half = Rational(1, 2)
+        self.assertEqual(Rational(Fraction(-3, 6)), -half)
+        self.assertEqual(Rational(half), half)
+        self.assertEqual(Rational(polymake.integer.Integer(-7)), -7)
+        self.assertEqual(Rational(5), 5)
+        big = Rational(2**100, -3**70)
+        self.assertEqual(big.python(), Fraction(2**100, -3**70))
+
+    def test_from_pairs(self):
+        from fractions import Fraction
+        nums = [1, -2, 2**80, 0]
+        dens = [3, 4, -5, 7]
+        l = polymake.rational.Rational.from_pairs(nums, dens)
+        self.assertEqual([x.python() for x in l], [Fraction(a, b) for a, b in zip(nums, dens)])
+        with self.assertRaises(ValueError):
+            polymake.rational.Rational.from_pairs([1], [0])
+        with self.assertRaises(ValueError):
+            polymake.rational.Rational.from_pairs([1, 2], [1])
+
     def test_bool(self):
         self.assertEqual(bool(polymake.rational.Rational(0,1)), False)
         self.assertEqual(bool(polymake.rational.Rational(1,1)), True)
@@ -83,6 +105,46 @@ class TestPolymakeRational(unittest.TestCase):
 #                if anum:
 #                    self.assertTrue(t / a == polymake.rational.Rational(2*aden, anum), msg)
 
+    def test_hash(self):
+        from fractions import Fraction
+        for num, den in [(0, 1), (-1, 1), (3, 7), (-3, 7), (2**100, 3**50), (1, 2**61 - 1)]:
+            pa = polymake.rational.Rational(num, den)
+            self.assertEqual(hash(pa), hash(Fraction(num, den)))
+        self.assertEqual(hash(polymake.rational.Rational(6, 3)), hash(2))
+
+    def test_inplace(self):
+        a = polymake.rational.Rational(1, 2)
+        b = a
+        a += polymake.rational.Rational(1, 3)
+        a -= polymake.integer.Integer(1)
+        a *= 6
+        self.assertEqual(a, -1)
+        self.assertEqual(b, polymake.rational.Rational(1, 2))
+        a /= 4
+        self.assertEqual(a, polymake.rational.Rational(-1, 4))
+
+        c = polymake.rational.Rational(1, 2)
+        d = c
+        c.iadd(polymake.rational.Rational(1, 3))
+        c.isub(polymake.integer.Integer(1))
+        c.imul(6)
+        self.assertIs(c, d)
+        self.assertEqual(d, -1)
+        c.idiv(2**70)
+        self.assertEqual(c, polymake.rational.Rational(-1, 2**70))
+        with self.assertRaises(ZeroDivisionError):
+            c.idiv(0)
+
+    def test_big_int_operands(self):
+        a = polymake.rational.Rational(1, 2)
+        big = 2**100
+        self.assertEqual(a + big, polymake.rational.Rational(2 * big + 1, 2))
+        self.assertEqual(big - a, polymake.rational.Rational(2 * big - 1, 2))
+        self.assertEqual(a * big, 2**99)
+        self.assertEqual(a / big, polymake.rational.Rational(1, 2**101))
+        self.assertLess(a, big)
+        self.assertGreater(-big, -a)
+
     def test_zero_division(self):
         zeros = [0, polymake.integer.Integer(0), polymake.rational.Rational(0)]
         rats = [polymake.rational.Rational(0,1), polymake.rational.Rational(1,1)]
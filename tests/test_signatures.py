@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import polymake
+from polymake import signatures
+
+class TestPolymakeSignatures(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.old = os.environ.get("POLYMAKE_SIGNATURE_CACHE")
+        os.environ["POLYMAKE_SIGNATURE_CACHE"] = self.tmpdir
+        signatures.clear_signature_cache()
+
+    def tearDown(self):
+        signatures.clear_signature_cache()
+        if self.old is None:
+            del os.environ["POLYMAKE_SIGNATURE_CACHE"]
+        else:
+            os.environ["POLYMAKE_SIGNATURE_CACHE"] = self.old
+        shutil.rmtree(self.tmpdir)
+
+    def test_cache(self):
+        s = signatures.signatures()
+        self.assertIn("cube", s["polytope"])
+        self.assertEqual(len(os.listdir(self.tmpdir)), 1)
+        self.assertIs(signatures.signatures(), s)
+
+        # reload from disk
+        signatures._loaded.clear()
+        self.assertEqual(signatures.signatures(), s)
+        self.assertEqual(polymake.main.pm_get_application(), b"polytope")
+
+    def test_cache_key(self):
+        # the key depends on the user settings and on their content
+        key = signatures.cache_key()
+        filename = os.path.join(self.tmpdir, "settings.pl")
+        settings = polymake.main.settings
+        polymake.main.settings = lambda: (filename.encode('utf-8'), [b"polytope"])
+        try:
+            key1 = signatures.cache_key()
+            with open(filename, 'w') as f:
+                f.write("# extensions\n")
+            key2 = signatures.cache_key()
+        finally:
+            polymake.main.settings = settings
+        self.assertEqual(signatures.cache_key(), key)
+        self.assertEqual(len(set([key, key1, key2])), 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+
+from fractions import Fraction
+import unittest
+
+import polymake
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class TestPolymakeSparseMatrix(unittest.TestCase):
+    def setUp(self):
+        self.m = polymake.associahedron(3).COCIRCUIT_EQUATIONS
+        self.l = self.m.python()
+        self.entries = [(i, j, x) for i, row in enumerate(self.l)
+                                  for j, x in enumerate(row) if x]
+
+    def test_getitem(self):
+        for i, j, x in self.entries:
+            self.assertEqual(self.m[i, j].python(), x)
+        self.assertEqual(self.m[0, 0].python(), self.l[0][0])
+        self.assertEqual(self.m[-1, -1].python(), self.l[-1][-1])
+
+    def test_nonzeros(self):
+        self.assertEqual(self.m.nnz(), len(self.entries))
+        self.assertEqual([(i, j, x.python()) for i, j, x in self.m.nonzeros()], self.entries)
+
+    @unittest.skipIf(numpy is None, "numpy not available")
+    def test_coo(self):
+        data, row, col = self.m.to_coo()
+        self.assertEqual(row.dtype, numpy.int64)
+        self.assertEqual(col.dtype, numpy.int64)
+        self.assertEqual(data.dtype, numpy.float64)
+        self.assertEqual(list(zip(row, col)), [(i, j) for i, j, _ in self.entries])
+        self.assertEqual(list(data), [float(x) for _, _, x in self.entries])
+
+        data, row, col = self.m.to_coo(dtype=object)
+        self.assertEqual(list(data), [Fraction(x) for _, _, x in self.entries])
+
+    @unittest.skipIf(numpy is None, "numpy not available")
+    def test_csr(self):
+        data, indices, indptr = self.m.to_csr(dtype=object)
+        self.assertEqual(len(indptr), self.m.rows() + 1)
+        for i in range(self.m.rows()):
+            a, b = indptr[i], indptr[i + 1]
+            self.assertEqual(list(zip(indices[a:b], data[a:b])),
+                             [(j, x) for j, x in enumerate(self.l[i]) if x])
+
+        if all(Fraction(x).denominator == 1 for _, _, x in self.entries):
+            data, _, _ = self.m.to_csr(dtype='int64')
+            self.assertEqual(list(data), [int(x) for _, _, x in self.entries])
+
+        with self.assertRaises(ValueError):
+            self.m.to_csr(dtype=complex)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+
+import polymake
+import unittest
+
+class TestPolymakeVector(unittest.TestCase):
+    def test_arithmetic_VectorInteger(self):
+        v = polymake.cube(3).F_VECTOR
+        l = v.python()
+        self.assertEqual((v + v).python(), [2*x for x in l])
+        self.assertEqual((v - v).python(), [0] * len(l))
+        self.assertEqual((-v).python(), [-x for x in l])
+        self.assertEqual((3 * v).python(), [3*x for x in l])
+        self.assertEqual((v * polymake.Integer(2)).python(), [2*x for x in l])
+        self.assertEqual(v.__matmul__(v), sum(x*x for x in l))
+        with self.assertRaises(ValueError):
+            v + polymake.cube(4).F_VECTOR
+
+    def test_arithmetic_VectorRational(self):
+        from fractions import Fraction
+        w = polymake.cube(3).CENTROID
+        l = w.python()
+        self.assertEqual((w + w).python(), [2*x for x in l])
+        self.assertEqual((w * Fraction(2, 3)).python(), [Fraction(2, 3)*x for x in l])
+        self.assertEqual((polymake.Rational(1, 2) * w).python(), [x/2 for x in l])
+        self.assertEqual(w.__matmul__(w), sum(x*x for x in l))
+        with self.assertRaises(TypeError):
+            w * w
+
+if __name__ == '__main__':
+    unittest.main()
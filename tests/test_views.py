@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+import polymake
+import unittest
+
+class TestPolymakeViews(unittest.TestCase):
+    def test_dense(self):
+        m = polymake.cube(3).VERTICES
+        l = m.python()
+
+        r = m[2]
+        self.assertEqual(len(r), m.cols())
+        self.assertEqual([x.python() for x in r], l[2])
+        self.assertEqual(r.copy().python(), l[2])
+        self.assertEqual(r[-1].python(), l[2][-1])
+        self.assertEqual([x.python() for x in r[[0, -1]]], [l[2][0], l[2][-1]])
+        self.assertEqual(r[[]], [])
+        self.assertEqual(m[-1].python(), l[-1])
+
+        c = m[:, 1]
+        self.assertEqual(len(c), m.rows())
+        self.assertEqual(c.python(), [row[1] for row in l])
+
+        mi = m[1:5:2, [0, 3]]
+        self.assertEqual((mi.rows(), mi.cols()), (2, 2))
+        self.assertEqual(mi.python(), [[l[i][j] for j in [0, 3]] for i in [1, 3]])
+        self.assertEqual(mi[1, 0].python(), l[3][0])
+        self.assertEqual(mi[1].python(), [l[3][0], l[3][3]])
+        self.assertEqual(mi[:, 1].python(), [l[1][3], l[3][3]])
+        self.assertEqual(m[3, 1:].python(), l[3][1:])
+
+        self.assertEqual([row.python() for row in m], l)
+
+        # negative indices count from the end for entries as for views
+        self.assertEqual(m[-1, 0], m[m.rows()-1, 0])
+        self.assertEqual(m[-2, -1], m[m.rows()-2, m.cols()-1])
+        self.assertEqual(m[-1, 0], m[-1][0])
+        with self.assertRaises(IndexError):
+            m[-m.rows()-1, 0]
+        with self.assertRaises(IndexError):
+            m[0, m.cols()]
+
+        with self.assertRaises(IndexError):
+            m[m.rows()]
+        with self.assertRaises(IndexError):
+            m[:, [0, m.cols()]]
+
+    def test_integer(self):
+        m = polymake.cube(3).DEGREE_ONE_GENERATORS
+        l = m.python()
+        self.assertEqual(m[5].python(), l[5])
+        self.assertEqual(m[[0, 1], :2].python(), [row[:2] for row in l[:2]])
+
+    def test_incidence(self):
+        m = polymake.cube(3).VERTICES_IN_FACETS
+        s = m.row(0)
+        self.assertIsInstance(s, polymake.set.SetInt)
+        self.assertEqual(list(s), [j for j in range(m.cols()) if m[0, j]])
+        self.assertEqual(list(m.col(0)), [i for i in range(m.rows()) if m[i, 0]])
+        self.assertEqual(list(m[1].copy()), list(m.row(1)))
+        self.assertEqual([m[0, j] for j in range(m.cols())], list(m[0]))
+        self.assertEqual(m[0].python(), list(m[0]))
+        self.assertEqual(m[-1, -1], m[m.rows()-1, m.cols()-1])
+        self.assertEqual(list(m[0, [1, 2, 3]]), [m[0, j] for j in [1, 2, 3]])
+        self.assertEqual(m[:, 2][[0, 5]], [m[0, 2], m[5, 2]])
+        mi = m[[0, 1], [0, 1, 2]].copy()
+        self.assertEqual((mi.rows(), mi.cols()), (2, 3))
+        self.assertEqual(len(list(m)), m.rows())
+
+if __name__ == '__main__':
+    unittest.main()